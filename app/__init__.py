@@ -50,6 +50,10 @@ def create_mappings(arg) -> dict:
         "TestRunner": {},
         "ViewManager": {},
         "MelodicComponent": {},
+        "Scheduler": {},
+        "BindingEngine": {},
+        "OscOutput": {},
+        "GestureTracer": {},
     }
 
     def add_plugin_mappings(plugin_dict):
@@ -136,6 +140,7 @@ def create_instance(c_instance):
     from pathlib import Path
     from typing import Type
     from .preference_manager import PreferenceManager
+    from .log_queue import QueuedLogHandler, DEFAULT_QUEUE_SIZE
     global ROOT_LOGGER
     global plugin_loader
     global CONFIG_DIR
@@ -181,14 +186,19 @@ def create_instance(c_instance):
         ROOT_LOGGER.error(f"Invalid value `{log_backup_count_def}` for preference `log_file_backups`. Using default of `{default_log_backup_count}`.")
         log_backup_count_def = default_log_backup_count
 
-    has_rotating_handler = any(
-        isinstance(h, RotatingFileHandler) and h.baseFilename == log_filename
+    log_queue_size_def = prefs.get('log_queue_size', DEFAULT_QUEUE_SIZE)
+    if not isinstance(log_queue_size_def, int) or isinstance(log_queue_size_def, bool) or log_queue_size_def < 1:
+        ROOT_LOGGER.error(f"Invalid value `{log_queue_size_def}` for preference `log_queue_size`. Using default of `{DEFAULT_QUEUE_SIZE}`.")
+        log_queue_size_def = DEFAULT_QUEUE_SIZE
+
+    has_queued_handler = any(
+        isinstance(h, QueuedLogHandler) and h.is_running and h.baseFilename == log_filename
         for h in ROOT_LOGGER.handlers
     )
 
-    if not has_rotating_handler:
+    if not has_queued_handler:
         for handler in ROOT_LOGGER.handlers[:]:
-            if isinstance(handler, logging.FileHandler) and handler.baseFilename == log_filename:
+            if isinstance(handler, (logging.FileHandler, QueuedLogHandler)) and handler.baseFilename == log_filename:
                 ROOT_LOGGER.removeHandler(handler)
                 handler.close()
 
@@ -204,14 +214,15 @@ def create_instance(c_instance):
         formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
         file_handler.setFormatter(formatter)
 
-        ROOT_LOGGER.addHandler(file_handler)
-
         if os.path.exists(log_filename):
             file_size = os.path.getsize(log_filename)
             if file_size >= 5 * 1024 * 1024:
                 ROOT_LOGGER.info("Log file over size limit, rotating...")
                 file_handler.doRollover()
 
+        # the file is written on a background thread so that a slow disk can't stall Live
+        ROOT_LOGGER.addHandler(QueuedLogHandler(file_handler, log_queue_size_def))
+
     ROOT_LOGGER.debug(pref_manager.user_prefs)
     PREF_MANAGER = pref_manager
 
@@ -249,6 +260,10 @@ def create_instance(c_instance):
     from .test_runner import TestRunner
     from .view_manager import ViewManager
     from .playable.melodic_component import MelodicComponent
+    from .scheduler import Scheduler
+    from .binding_engine import BindingEngine
+    from .osc_output import OscOutput
+    from .gesture_tracer import GestureTracer
 
     plugin_loader = PluginLoader(logger=ROOT_LOGGER.getChild('PluginLoader'), root_cs_name=canon_name)
 
@@ -266,6 +281,10 @@ def create_instance(c_instance):
         "TestRunner": TestRunner,
         "ViewManager": ViewManager,
         "MelodicComponent": MelodicComponent,
+        "Scheduler": Scheduler,
+        "BindingEngine": BindingEngine,
+        "OscOutput": OscOutput,
+        "GestureTracer": GestureTracer,
     }
 
     def add_plugins_to_component_map(plugin_dict):
@@ -1,12 +1,15 @@
-import re
+import time
+from collections import ChainMap
+from contextlib import contextmanager
 from functools import partial
 from itertools import chain
-from typing import Dict, Any, Tuple, Callable, Union, TYPE_CHECKING
+from typing import Dict, Any, Tuple, Callable, Union, Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from .view_manager import ViewManager
 from random import randint
 
 from .util import DynamicString, number_to_send_letter
+from .compiled_template import LruCache, TemplateCache, TemplateExpression
 from .vendor.asteval import Interpreter, make_symbol_table
 
 from ableton.v3.base import listens, listens_group
@@ -23,6 +26,10 @@ from .colors import parse_color_definition
 from .errors import ConfigurationError
 
 ABORT_ON_FAILURE = True # todo: add to preferences.yaml
+TEMPLATE_CACHE_SIZE = 512
+EXPRESSION_CACHE_SIZE = 1024
+VAR_GRAPH_CACHE_SIZE = 256
+BATCH_MODES = (False, 'bundle', 'gesture')
 
 
 class DotDict:
@@ -93,7 +100,6 @@ class ActionResolver(ZCXComponent):
     ):
         super().__init__(name=name, *a, **k)
 
-        self.__pattern = re.compile(r"\\\$\\{|\\\${|\$\\{|\${([^{}\\]*)}")
         self.__page_manager: PageManager = self.canonical_parent.component_map['PageManager']
         self.__mode_manager: ModeManager = self.canonical_parent.component_map['ModeManager']
         self.__cxp: CxpBridge = self.canonical_parent.component_map['CxpBridge']
@@ -103,15 +109,33 @@ class ActionResolver(ZCXComponent):
         self.__log_func = lambda *args: self.log(*args)
         self.__msg_func = lambda message: self.canonical_parent.show_message(message)
         self.__interpreter = Interpreter()
+        self.__template_cache = TemplateCache(
+            self.__interpreter.parse,
+            max_templates=TEMPLATE_CACHE_SIZE,
+            max_expressions=EXPRESSION_CACHE_SIZE
+        )
         self.__cxp_partial = None
         self.__standard_context = {}
+        self.__base_symtable = make_symbol_table()
+        self.__var_graphs = LruCache(VAR_GRAPH_CACHE_SIZE)
+        self.__batch_mode = False
+        self.__batch_depth = 0
+        self.__batched_action_lists: "list[str]" = []
 
     def setup(self):
         self.__ring_api = self.canonical_parent._session_ring_custom.api
         self.__zcx_api_obj = self.component_map['ApiManager'].get_api_object()
         self.__cxp_partial = partial(self.__cxp.trigger_action_list)
         self.__standard_context = self.__build_standard_context()
+        self.__base_symtable = make_symbol_table(**self.__standard_context)
 
+        from . import PREF_MANAGER
+        batch_def = PREF_MANAGER.user_prefs.get("action_batching", False)
+        if batch_def not in BATCH_MODES:
+            self.error(f"Invalid value for preference `action_batching`: ({batch_def}).\nUsing `false`")
+            batch_def = False
+        # batch depth and held action lists are left alone, a hot reload may run from inside a batch
+        self.__batch_mode = batch_def
 
     def __build_standard_context(self) -> dict[str: Any]:
 
@@ -169,7 +193,14 @@ class ActionResolver(ZCXComponent):
 
             exec_context = self.__build_symtable(context, prior_resolved)
             self.__interpreter.symtable = exec_context
-            result = self.__interpreter.eval(expr)
+
+            node = self.__template_cache.get_expression(expr)
+            if node is None:
+                # let asteval re-parse so the syntax error is reported below
+                result = self.__interpreter.eval(expr)
+            else:
+                result = self.__run_node(node, expr)
+
             if len(self.__interpreter.error) > 0:
                 self.error(f"Error evaluating expression `{expr}`")
                 for error in self.__interpreter.error:
@@ -180,76 +211,103 @@ class ActionResolver(ZCXComponent):
             print(f"Error evaluating {expr}: {e}")
             return None, 2
 
+    def __run_node(self, node, expr: str) -> Any:
+        """Evaluate a pre-parsed AST, mirroring the bookkeeping `Interpreter.eval` does for strings."""
+        interpreter = self.__interpreter
+        interpreter.lineno = 0
+        interpreter.error = []
+        interpreter.error_msg = None
+        interpreter.code_text = []
+        interpreter.start_time = time.time()
+        try:
+            return interpreter.run(node, expr=expr, lineno=0, with_raise=False)
+        except Exception:
+            return None
+
     def _resolve_vars(
-        self, vars: Dict[str, Any], context: Dict[str, Any], mode: str
+        self, vars: Dict[str, Any], context: Dict[str, Any], mode: str, names: Optional[frozenset] = None
     ) -> Tuple[Dict[str, Any], int]:
-        """Resolve variables in order, checking for $ patterns and dependencies."""
-        resolved = {}
+        """Resolve variables in dependency order.
 
-        for var_name, expr in vars.items():
-            expr = str(expr) if not isinstance(expr, str) else expr
+        If `names` is given, only the vars it contains (and the vars those depend on) are evaluated.
+        Each var is evaluated at most once per call.
+        """
+        resolved = {}
+        if not vars:
+            return resolved, 0
 
-            try:
-                result, status = self._evaluate_expression(expr, context, resolved)
-                if status != 0:
-                    return {}, 2
+        graph = self.__get_var_graph(vars)
 
-                resolved[var_name] = result
-            except Exception as e:
-                print(f"Error resolving {var_name}: {e}")
+        for var_name in graph:
+            if names is not None and var_name not in names:
+                continue
+            if self.__resolve_var(var_name, graph, vars, context, resolved) != 0:
                 return {}, 2
 
         return resolved, 0
 
-    def __build_symtable(self, context: Dict[str, Any], prior_resolved: Dict[str, Any]) -> Dict[str, Any]:
-        """Build a comprehensive execution context with all available variables and functions."""
-        dot_context = {
-            k: DotDict(v) if isinstance(v, dict) else v for k, v in context.items()
-        }
+    def __resolve_var(
+            self, var_name: str, graph: Dict[str, tuple], vars: Dict[str, Any], context: Dict[str, Any],
+            resolved: Dict[str, Any]
+    ) -> int:
+        if var_name in resolved:
+            return 0
+
+        for dependency in graph[var_name]:
+            if self.__resolve_var(dependency, graph, vars, context, resolved) != 0:
+                return 2
 
-        extra = {}
+        expr = vars[var_name]
+        expr = str(expr) if not isinstance(expr, str) else expr
 
         try:
-            calling_control = context.get('me', {}).get('obj', None)
+            result, status = self._evaluate_expression(expr, context, resolved)
+            if status != 0:
+                return 2
+            resolved[var_name] = result
+        except Exception as e:
+            print(f"Error resolving {var_name}: {e}")
+            return 2
 
-            if calling_control is None:
-                parse_color = partial(parse_color_definition)
-            else:
-                parse_color = partial(parse_color_definition, calling_control=calling_control)
-            extra['parse_color'] = parse_color
+        return 0
 
-        except Exception as e:
-            self.debug(e)
+    def __get_var_graph(self, vars: Dict[str, Any]) -> Dict[str, tuple]:
+        """Map each var to the earlier vars its expression references.
 
-        exec_context = make_symbol_table(**dot_context, **prior_resolved, **self.__standard_context)
-        return exec_context
+        A var can only depend on vars declared before it, matching the order they were always resolved in.
+        """
+        try:
+            key = tuple(vars.items())
+            graph = self.__var_graphs.get(key)
+        except TypeError:
+            key = None
+            graph = None
 
-    def _replace_match(
-        self,
-        match: re.Match,
-        resolved_vars: Dict[str, Any],
-        context: Dict[str, Any],
-        mode: str,
-    ) -> Tuple[str, int]:
-        """Process a single pattern match."""
+        if graph is not None:
+            return graph
 
-        full_match = match.group(0)
-        if full_match.startswith("\\"):
-            return full_match, 0
+        graph = {}
+        for var_name, expr in vars.items():
+            expr = str(expr) if not isinstance(expr, str) else expr
+            if expr.startswith("$"):
+                expr = expr[1:]
+            referenced = self.__template_cache.get_names(expr)
+            graph[var_name] = tuple(name for name in graph if name in referenced)
 
-        var_name = match.group(1)
-        if not var_name:
-            return full_match, 0
+        if key is not None:
+            self.__var_graphs.put(key, graph)
+        return graph
 
-        if var_name in resolved_vars:
-            value = resolved_vars[var_name]
-        else:
-            result, status = self._evaluate_expression(var_name, context, resolved_vars)
-            if status != 0:
-                return match.group(0), 2
-            value = result
+    def __build_symtable(self, context: Dict[str, Any], prior_resolved: Dict[str, Any]) -> ChainMap:
+        """Layer the per-call context and resolved vars over the persistent base symbol table.
 
-        return str(value), 0
+        Writes made by the evaluated code land in the overlay, so the base table is never mutated.
+        """
+        overlay = {
+            k: DotDict(v) if isinstance(v, dict) else v for k, v in context.items()
+        }
+        overlay.update(prior_resolved)
+        return ChainMap(overlay, self.__base_symtable)
 
     def compile(
         self,
@@ -259,32 +317,36 @@ class ActionResolver(ZCXComponent):
         mode: str='live',
     ) -> Tuple[str, int]:
         """Compile an action string, resolving variables and template patterns."""
-        # self.log(action_string, vars, context, mode)
         if not isinstance(action_string, str) or "${" not in action_string:
             return action_string, 0
 
-        resolved_vars, status = self._resolve_vars(vars, context, mode)
+        template = self.__template_cache.get_template(action_string)
+        if template.is_static:
+            return action_string, 0
+
+        resolved_vars, status = self._resolve_vars(
+            vars, context, mode, self.__template_cache.get_template_names(template)
+        )
         if status != 0:
             return action_string, status
 
-        result = ""
-        last_end = 0
+        parts = []
 
-        for match in self.__pattern.finditer(action_string):
-            result += action_string[last_end : match.start()]
+        for segment in template.segments:
+            if not isinstance(segment, TemplateExpression):
+                parts.append(segment)
+                continue
 
-            replacement, match_status = self._replace_match(
-                match, resolved_vars, context, mode
-            )
-            if match_status != 0:
-                return action_string, match_status
+            if segment.source in resolved_vars:
+                value = resolved_vars[segment.source]
+            else:
+                value, status = self._evaluate_expression(segment.source, context, resolved_vars)
+                if status != 0:
+                    return action_string, status
 
-            result += replacement
-            last_end = match.end()
+            parts.append(str(value))
 
-        result += action_string[last_end:]
-        # self.log(result)
-        return result, 0
+        return "".join(parts), 0
 
     def parse_command_bundle(self, command_bundle: Any) -> list:
         if isinstance(command_bundle, str):
@@ -314,12 +376,65 @@ class ActionResolver(ZCXComponent):
             return None
         return parsed
 
+    @property
+    def batch_mode(self):
+        """The `action_batching` preference: `False`, `'bundle'`, or `'gesture'`."""
+        return self.__batch_mode
+
+    def begin_batch(self):
+        """Holds back ClyphX action lists until the matching `end_batch()`, when they are triggered as one action list.
+        Batches may be nested, only the outermost `end_batch()` triggers."""
+        self.__batch_depth += 1
+
+    def end_batch(self):
+        self.__batch_depth -= 1
+        if not self.__batch_depth:
+            self.flush_action_lists()
+
+    @contextmanager
+    def action_list_batch(self):
+        self.begin_batch()
+        try:
+            yield
+        finally:
+            self.end_batch()
+
+    def flush_action_lists(self):
+        """Triggers any held back action lists now, joined into one."""
+        batched = self.__batched_action_lists
+        if not batched:
+            return
+        self.__batched_action_lists = []
+        if len(batched) == 1:
+            self.__cxp.trigger_action_list(batched[0])
+            return
+        action_lists = (str(action_list).strip().rstrip(';') for action_list in batched)
+        self.__cxp.trigger_action_list('; '.join(action_list for action_list in action_lists if action_list))
+
+    def __trigger_action_list(self, action_list):
+        if self.__batch_depth:
+            self.__batched_action_lists.append(action_list)
+        else:
+            self.__cxp.trigger_action_list(action_list)
+
     def execute_command_bundle(
             self,
             calling_control: ZControl = None,
             bundle: list[Union[list, str, dict, Callable]] = None,
             vars_dict: dict = None,
             context: dict = None,
+    ):
+        if not self.__batch_mode:
+            return self.__execute_command_bundle(calling_control, bundle, vars_dict, context)
+        with self.action_list_batch():
+            return self.__execute_command_bundle(calling_control, bundle, vars_dict, context)
+
+    def __execute_command_bundle(
+            self,
+            calling_control: ZControl = None,
+            bundle: list[Union[list, str, dict, Callable]] = None,
+            vars_dict: dict = None,
+            context: dict = None,
     ):
         try:
             commands = self.parse_command_bundle(bundle)
@@ -327,15 +442,19 @@ class ActionResolver(ZCXComponent):
             for command in commands:
                 if isinstance(command, str):
                     if parsed := self._compile_and_check(command, vars_dict, context):
-                        self.__cxp.trigger_action_list(parsed)
+                        self.__trigger_action_list(parsed)
 
                 elif isinstance(command, dict):
                     command_type, command_def = command.popitem()
 
+                    if command_type != 'cxp' and self.__batched_action_lists:
+                        # anything else may depend on the action lists before it
+                        self.flush_action_lists()
+
                     match command_type:
                         case 'cxp':
                             if (parsed := self._compile_and_check(command_def, vars_dict, context)) is not None:
-                                self.__cxp.trigger_action_list(parsed)
+                                self.__trigger_action_list(parsed)
                         case 'log':
                             if (parsed := self._compile_and_check(command_def, vars_dict, context)) is not None:
                                 self.log(parsed)
@@ -461,8 +580,7 @@ class ActionResolver(ZCXComponent):
                                 ring_component.go_to_scene(scene_def_parsed)
 
                         case 'keyboard':
-                            self.log("got keybaord cmd")
-                            self.log(command_def)
+                            self.debug(command_def)
                             melodic_inst = self.component_map["MelodicComponent"]
 
                             for key_type, key_def in command_def.items():
@@ -590,7 +708,7 @@ class ActionResolver(ZCXComponent):
                                 self.debug("`hot_reload` called with falsy value")
                                 return
 
-                            self.canonical_parent.hot_reload()
+                            self.canonical_parent.hot_reload(full=command_def == 'full')
                         case 'do_toggle':
                             if not command_def:
                                 return
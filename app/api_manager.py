@@ -18,6 +18,7 @@ if TYPE_CHECKING:
     from .zcx_core import ZCXCore
     from .page_manager import PageManager
     from .view_manager import ViewManager
+    from .gesture_tracer import GestureTracer
 
 
 class ApiManager(ZCXComponent):
@@ -51,6 +52,7 @@ class ZcxApi:
         self.page_manager: PageManager = self.root_cs.component_map['PageManager']
         self.mode_manager: ModeManager = self.root_cs.component_map['ModeManager']
         self.view_manager: ViewManager = self.root_cs.component_map['ViewManager']
+        self.gesture_tracer: GestureTracer = self.root_cs.component_map['GestureTracer']
 
         self.request_page_change = self.page_manager.request_page_change
         self.set_page = self.page_manager.set_page
@@ -104,6 +106,28 @@ class ZcxApi:
     def refresh(self):
         self.root_cs.manual_refresh()
 
+    @property
+    def gesture_tracing(self) -> bool:
+        return self.gesture_tracer.enabled
+
+    @gesture_tracing.setter
+    def gesture_tracing(self, value: bool):
+        self.gesture_tracer.enabled = value
+
+    def get_latency_report(self) -> dict:
+        """
+        Returns the gesture latency histograms, by stage, command type, and control.
+        Only populated while gesture tracing is enabled.
+        :return:
+        """
+        return self.gesture_tracer.get_report()
+
+    def log_latency_report(self):
+        self.gesture_tracer.log_report()
+
+    def reset_latency_stats(self):
+        self.gesture_tracer.reset()
+
     def set_hardware_mode(self, mode_def):
         self.root_cs.set_hardware_mode(mode_def)
 
@@ -0,0 +1,543 @@
+from ableton.v3.base import listens, listens_group
+from ableton.v3.live import liveobj_valid
+
+from .bank_definitions import get_banked_parameter
+from .consts import SENDS_COUNT
+from .errors import ConfigurationError, NumberedDeviceMissingError
+from .zcx_component import ZCXComponent
+
+MAX_PLANS = 1024
+MAX_INDEXED_CONTAINERS = 512
+DEFAULT_REBIND_WINDOW = 0.1 # seconds
+
+MIXER_PARAMETERS = {
+    "vol": "volume",
+    "cue": "cue_volume",
+    "pan": "panning",
+    "panl": "left_split_stereo",
+    "panr": "right_split_stereo",
+}
+CHAIN_MIXER_PARAMETER_TYPES = ("vol", "pan", "send")
+
+# the Live properties that each key of a binding's `assess_dynamism()` result depends on
+LISTEN_TOPICS = {
+    "selected_track": ("selected_track",),
+    "track_list": ("tracks",),
+    "chain_list": ("selected_chain",),
+    "sends_list": ("return_tracks",),
+    "selected_parameter": ("selected_parameter",),
+    "ring_tracks": ("offsets", "tracks"),
+    "selected_device": ("selected_device",),
+}
+
+
+class TargetPlan(object):
+    """The parts of a `parse_target_path()` result that `BindingEngine` needs, normalised once
+    so that rebinding does no string handling beyond templated nodes."""
+
+    __slots__ = (
+        "target_map",
+        "par_type",
+        "track_def",
+        "ring_def",
+        "has_device",
+        "device_def",
+        "device_is_sel",
+        "device_number",
+        "chain_map",
+        "send",
+        "bank",
+        "par_name",
+        "par_num",
+    )
+
+    def __init__(self, target_map: dict):
+        self.target_map = target_map
+
+        par_type = target_map.get("parameter_type")
+        self.par_type = par_type.lower() if par_type is not None else None
+        self.track_def = target_map.get("track")
+        self.ring_def = target_map.get("ring_track")
+
+        device_def = target_map.get("device")
+        chain_map = target_map.get("chain_map")
+        self.has_device = device_def is not None or chain_map is not None
+        self.device_def = device_def
+        self.device_is_sel = device_def is not None and device_def.lower() == "sel"
+        self.device_number = None
+        if device_def is not None and not self.device_is_sel:
+            try:
+                self.device_number = int(device_def) - 1
+            except ValueError:
+                pass
+
+        self.chain_map = tuple(_parse_chain_node(node) for node in chain_map) if chain_map is not None else None
+
+        send_def = target_map.get("send")
+        if send_def is None:
+            self.send = None
+        elif send_def.isdigit():
+            self.send = int(send_def) % SENDS_COUNT
+        else:
+            self.send = send_def.upper()
+
+        bank_def = target_map.get("bank")
+        self.bank = int(bank_def) if bank_def is not None else None
+
+        par_name = target_map.get("parameter_name")
+        par_num = target_map.get("parameter_number")
+        if isinstance(par_name, str) and "${" in par_name:
+            raise ConfigurationError(f"Failed to parse parameter: {par_name}")
+        if isinstance(par_num, str):
+            if "${" in par_num:
+                raise ConfigurationError(f"Failed to parse parameter: {par_num}")
+            try:
+                par_num = int(par_num)
+            except ValueError:
+                raise ConfigurationError(f"Failed to parse parameter: {par_num}")
+        self.par_name = par_name if isinstance(par_name, str) else None
+        self.par_num = par_num
+
+
+def _parse_chain_node(node):
+    """Returns `node` as an int or an unquoted name, or leaves it as is if it is templated."""
+    if isinstance(node, str) and "${" in node:
+        return node
+    try:
+        return int(node)
+    except (ValueError, TypeError):
+        if isinstance(node, str) and node.startswith('"') and node.endswith('"'):
+            return node.strip('"')
+        return node
+
+
+class BindingEngine(ZCXComponent):
+    """Resolves the targets of encoders and param controls.
+
+    Each target map is compiled into a `TargetPlan` once. Tracks, devices, chains and parameters
+    are then found by name through an index of the song, rather than by walking `song.tracks`
+    and `track.devices` on every rebind.
+
+    The index is dropped whenever the track list changes. Entries for a track's devices, a rack's
+    chains, etc. are rebuilt when their container's length changes or a cached object no longer
+    has the name it was found by, and on a miss.
+
+    The engine also owns the Live listeners that bindings depend on, one per property rather than
+    one per binding. Bindings `subscribe()` with their `assess_dynamism()` result.
+    When a property changes, its subscribers are rebound straight away, and a window of
+    `rebind_window` seconds opens. Changes inside the window, such as scrolling through tracks,
+    only queue their subscribers, and each queued binding is rebound once when the window closes.
+    """
+
+    def __init__(
+        self,
+        name="BindingEngine",
+        *a,
+        **k,
+    ):
+        super().__init__(name=name, *a, **k)
+        self.__plans: "dict[int, TargetPlan]" = {}
+        self.__tracks: "dict[str, tuple]" = {}
+        self.__children: "dict[tuple, tuple]" = {}
+        self.__cxp_bridge = None
+        self.__scheduler = None
+        self.__rebind_window = DEFAULT_REBIND_WINDOW
+        self.__subscribers: "dict[str, dict]" = {topic: {} for topics in LISTEN_TOPICS.values() for topic in topics}
+        self.__device_list_subscribers: "dict[int, dict]" = {}
+        self.__subscriptions: "dict[object, tuple]" = {}
+        self.__pending: "dict[object, None]" = {}
+
+    def setup(self):
+        self.__cxp_bridge = self.component_map["CxpBridge"]
+        self.__scheduler = self.component_map["Scheduler"]
+
+        from . import PREF_MANAGER
+        window_def = PREF_MANAGER.user_prefs.get("rebind_window", DEFAULT_REBIND_WINDOW)
+        if isinstance(window_def, (int, float)) and not isinstance(window_def, bool) and window_def >= 0:
+            if window_def >= 1:
+                self.warning(f"Very high value for preference `rebind_window`: ({window_def}).\nDefault is {DEFAULT_REBIND_WINDOW}")
+            self.__rebind_window = window_def
+        else:
+            self.error(f"Invalid value for preference `rebind_window`: ({window_def}).\nUsing `{DEFAULT_REBIND_WINDOW}`")
+            self.__rebind_window = DEFAULT_REBIND_WINDOW
+
+        self.tracks_listener.subject = self.song
+        self.return_tracks_listener.subject = self.song
+        self.selected_track_listener.subject = self.song.view
+        self.selected_parameter_listener.subject = self.song.view
+        self.offsets_listener.subject = self.canonical_parent._session_ring_custom
+        self.__watch_selected_track()
+
+    def _unload(self):
+        super()._unload()
+        self.__plans.clear()
+        self.clear_index()
+        for subscribers in self.__subscribers.values():
+            subscribers.clear()
+        self.__device_list_subscribers.clear()
+        self.device_list_listener.replace_subjects([])
+        self.__subscriptions.clear()
+        self.__pending.clear()
+        if self.__scheduler is not None:
+            self.__scheduler.cancel(self.__close_window)
+
+    def clear_index(self):
+        self.__tracks.clear()
+        self.__children.clear()
+
+    def subscribe(self, binding, listen_dict: dict, mapped_track=None):
+        """Rebinds `binding` when any property named by `listen_dict` changes,
+        replacing its previous subscription. `device_list` refers to `mapped_track`."""
+        topics = frozenset(
+            topic for key, key_topics in LISTEN_TOPICS.items() if listen_dict.get(key) for topic in key_topics
+        )
+        if not listen_dict.get("device_list") or not liveobj_valid(mapped_track):
+            mapped_track = None
+        track_ptr = mapped_track._live_ptr if mapped_track is not None else None
+
+        subscription = self.__subscriptions.get(binding)
+        if subscription is not None and subscription[0] == topics and subscription[1] == track_ptr:
+            return
+
+        self.unsubscribe(binding, keep_pending=True)
+        for topic in topics:
+            self.__subscribers[topic][binding] = None
+        if mapped_track is not None:
+            subscribers = self.__device_list_subscribers.get(track_ptr)
+            if subscribers is None:
+                subscribers = self.__device_list_subscribers[track_ptr] = {}
+                self.device_list_listener.add_subject(mapped_track)
+            subscribers[binding] = None
+        self.__subscriptions[binding] = (topics, track_ptr, mapped_track)
+
+    def unsubscribe(self, binding, keep_pending=False):
+        subscription = self.__subscriptions.pop(binding, None)
+        if not keep_pending:
+            self.__pending.pop(binding, None)
+        if subscription is None:
+            return
+        topics, track_ptr, mapped_track = subscription
+        for topic in topics:
+            self.__subscribers[topic].pop(binding, None)
+        if track_ptr is not None:
+            subscribers = self.__device_list_subscribers.get(track_ptr)
+            if subscribers is not None:
+                subscribers.pop(binding, None)
+                if not subscribers:
+                    del self.__device_list_subscribers[track_ptr]
+                    self.device_list_listener.remove_subject(mapped_track)
+
+    @property
+    def pending_rebind_count(self) -> int:
+        return len(self.__pending)
+
+    @property
+    def rebind_window(self) -> float:
+        return self.__rebind_window
+
+    def flush(self):
+        """Rebinds every queued binding now and closes the window, so the next change rebinds straight away."""
+        self.__scheduler.cancel(self.__close_window)
+        self.__rebind_pending()
+
+    def __rebind_pending(self):
+        pending = self.__pending
+        self.__pending = {}
+        for binding in pending:
+            binding.bind_to_active()
+
+    def __queue(self, *subscriber_dicts: dict):
+        for subscribers in subscriber_dicts:
+            if subscribers:
+                self.__pending.update(subscribers)
+        if not self.__pending or self.__scheduler.is_scheduled(self.__close_window):
+            return
+        self.__rebind_pending()
+        if self.__rebind_window > 0:
+            self.__scheduler.schedule(self.__close_window, self.__rebind_window)
+
+    def __close_window(self):
+        if self.__pending:
+            # the storm is still going; rebind to where it has got to and keep coalescing
+            self.__rebind_pending()
+            self.__scheduler.schedule(self.__close_window, self.__rebind_window)
+
+    def __watch_selected_track(self):
+        track = self.song.view.selected_track
+        self.selected_device_listener.subject = track.view if liveobj_valid(track) else None
+        self.__watch_selected_device()
+
+    def __watch_selected_device(self):
+        track = self.song.view.selected_track
+        device = track.view.selected_device if liveobj_valid(track) else None
+        if liveobj_valid(device) and device.can_have_chains and hasattr(device, "view"):
+            self.selected_chain_listener.subject = device.view
+        else:
+            self.selected_chain_listener.subject = None
+
+    @listens("tracks")
+    def tracks_listener(self):
+        self.clear_index()
+        self.__queue(self.__subscribers["tracks"])
+
+    @listens("return_tracks")
+    def return_tracks_listener(self):
+        self.__queue(self.__subscribers["return_tracks"])
+
+    @listens("selected_track")
+    def selected_track_listener(self):
+        # a new track brings its own selected device and chain
+        self.__watch_selected_track()
+        self.__queue(
+            self.__subscribers["selected_track"],
+            self.__subscribers["selected_device"],
+            self.__subscribers["selected_chain"],
+        )
+
+    @listens("selected_parameter")
+    def selected_parameter_listener(self):
+        self.__queue(self.__subscribers["selected_parameter"])
+
+    @listens("offsets")
+    def offsets_listener(self):
+        self.__queue(self.__subscribers["offsets"])
+
+    @listens("selected_device")
+    def selected_device_listener(self):
+        self.__watch_selected_device()
+        self.__queue(self.__subscribers["selected_device"], self.__subscribers["selected_chain"])
+
+    @listens("selected_chain")
+    def selected_chain_listener(self):
+        self.__queue(self.__subscribers["selected_chain"])
+
+    @listens_group("devices")
+    def device_list_listener(self, track):
+        self.__queue(self.__device_list_subscribers.get(track._live_ptr))
+
+    def compile_target(self, target_map: dict) -> TargetPlan:
+        plan = self.__plans.get(id(target_map))
+        if plan is not None and plan.target_map is target_map:
+            return plan
+        plan = TargetPlan(target_map)
+        if len(self.__plans) >= MAX_PLANS:
+            self.__plans.clear()
+        self.__plans[id(target_map)] = plan
+        return plan
+
+    def resolve_track(self, plan: TargetPlan, owner, default_to_selected=False):
+        """Returns the track a plan targets, or None if it names none and `default_to_selected` is False."""
+        if plan.track_def is not None:
+            track = self.get_track(plan.track_def)
+            if track is None:
+                raise ConfigurationError(f"No track found for {plan.track_def}")
+            return track
+        elif plan.ring_def is not None:
+            ring_track_parsed, status = owner.action_resolver.compile(
+                plan.ring_def,
+                owner._vars,
+                owner._context
+            )
+            if status != 0:
+                raise ConfigurationError(f"Unparseable ring target: {plan.ring_def}")
+
+            track = self.canonical_parent._session_ring_custom.get_ring_track(int(ring_track_parsed))
+            if track is None:
+                raise ConfigurationError(f"Invalid ring target: `{plan.target_map}`")
+            return track
+        elif default_to_selected:
+            return self.song.view.selected_track
+        return None
+
+    def resolve_device(self, plan: TargetPlan, track, owner):
+        """Returns the device, or for a chain map the device or chain, that a plan targets on `track`."""
+        if plan.device_def is not None:
+            if plan.device_is_sel:
+                device = track.view.selected_device
+            elif plan.device_number is not None:
+                try:
+                    device = list(track.devices)[plan.device_number]
+                except IndexError:
+                    raise NumberedDeviceMissingError()
+            else:
+                device = self.get_device(track, plan.device_def)
+
+            if device is None:
+                raise ConfigurationError(f"No device found for {plan.device_def}")
+            return device
+
+        return self.traverse_chain_map(track, plan.chain_map, owner)
+
+    def resolve_mixer_parameter(self, plan: TargetPlan, mixer_device):
+        """Returns the parameter of a track or chain mixer that a plan targets,
+        or None if its parameter type is not a mixer parameter."""
+        if plan.par_type == "send":
+            try:
+                send_num = plan.send
+                if isinstance(send_num, str):
+                    send_letter = send_num
+                    send_num = ord(send_letter) - 65  # `A` in ASCII
+                    sends_count = len(self.song.return_tracks)
+                    if send_num < 0 or send_num >= sends_count:
+                        raise ConfigurationError(
+                            f"Invalid send: {send_letter} | {send_num} | sends_count {sends_count}"
+                        )
+                return mixer_device.sends[send_num]
+            except Exception as e:
+                raise ConfigurationError(f"Failed to bind to send: {e}")
+
+        attribute = MIXER_PARAMETERS.get(plan.par_type)
+        if attribute is None:
+            return None
+        return getattr(mixer_device, attribute)
+
+    def resolve_device_parameter(self, plan: TargetPlan, device, prefer_left=True):
+        """Returns the parameter of `device` that a plan targets, or None if there is no such parameter."""
+        if plan.par_type == "cs":
+            return device.chain_selector
+
+        if plan.bank is not None:
+            return get_banked_parameter(device, device.class_name, plan.bank, int(plan.par_num), prefer_left)
+
+        if plan.par_name is not None:
+            parameter = self.get_parameter(device, plan.par_name)
+            if parameter is None:
+                raise ConfigurationError(
+                    f'Parameter "{plan.par_name}" not found on device {plan.device_def}'
+                )
+            return parameter
+
+        if plan.par_num is None:
+            return device.parameters[0] # bypass parameter
+
+        try:
+            return device.parameters[plan.par_num]
+        except IndexError:
+            return None
+
+    def get_track(self, track_def):
+        lower_def = track_def.lower()
+        if lower_def == "sel":
+            return self.song.view.selected_track
+        elif lower_def == "mst":
+            return self.song.master_track
+
+        cached = self.__tracks.get(track_def)
+        if cached is not None:
+            track, track_name = cached
+            if liveobj_valid(track) and track.name == track_name:
+                return track
+
+        track = self.__find_track(track_def)
+        if track is not None:
+            self.__tracks[track_def] = (track, track.name)
+        return track
+
+    def __find_track(self, track_def):
+        try:
+            return self.__cxp_bridge.get_track_by_name(track_def)
+        except RuntimeError:
+            self.debug(f"Failed to get track called `{track_def}` from CXP")
+
+        for track in self.song.tracks:
+            if track.name == track_def:
+                return track
+
+        try:
+            track_num = int(track_def) - 1
+            tracklist = list(self.song.tracks)
+            return tracklist[track_num]
+        except (ValueError, IndexError):
+            return None
+
+    def get_device(self, track, device_name):
+        """Returns the first device called `device_name` on `track`, including devices nested in racks."""
+        return self.__get_child(track, "all_devices", device_name)
+
+    def get_parameter(self, device, parameter_name):
+        return self.__get_child(device, "parameters", parameter_name)
+
+    def traverse_chain_map(self, track, chain_map, owner):
+        current_search_obj = track
+
+        for i, node in enumerate(chain_map):
+            is_device = i % 2 == 0
+            if isinstance(node, str) and "${" in node:
+                node = self.__compile_chain_node(node, owner)
+
+            if i == 0:
+                # First node is always a device
+                if isinstance(node, int):
+                    current_search_obj = list(track.devices)[node - 1]
+                else:
+                    current_search_obj = self.__get_child(track, "devices", node)
+                    if current_search_obj is None:
+                        raise ConfigurationError(f"No device called: {node}")
+            elif is_device:
+                # Looking for a device in the current chain
+                if isinstance(node, int):
+                    current_search_obj = list(current_search_obj.devices)[node - 1]
+                else:
+                    device = self.__get_child(current_search_obj, "devices", node)
+                    if device is None:
+                        raise ConfigurationError(f'No device in {current_search_obj.name} called {node}')
+                    current_search_obj = device
+            else:
+                # Looking for a chain in the current device
+                if isinstance(node, int) and hasattr(current_search_obj, "chains"):
+                    current_search_obj = list(current_search_obj.chains)[node - 1]
+                else:
+                    chain = None
+                    if hasattr(current_search_obj, "chains"):
+                        chain = self.__get_child(current_search_obj, "chains", node)
+                    if chain is None:
+                        raise ConfigurationError(f'No chain in {current_search_obj.name} called {node}')
+                    current_search_obj = chain
+
+        return current_search_obj
+
+    @staticmethod
+    def __compile_chain_node(node, owner):
+        parsed, status = owner.action_resolver.compile(node, owner._vars, owner._context)
+        if status != 0:
+            raise ConfigurationError(f"Unparseable node: {node}")
+
+        # Strip quotes if present
+        if isinstance(parsed, str) and parsed.startswith('"') and parsed.endswith('"'):
+            return parsed.strip('"')
+        return parsed
+
+    def __get_child(self, container, attribute, name):
+        """Returns the first of `container`'s `attribute` called `name`, from the index where possible.
+        `all_devices` walks a track's devices and every device nested in their chains."""
+        key = (container._live_ptr, attribute)
+        if attribute == "all_devices":
+            size = len(container.devices)
+        else:
+            size = len(getattr(container, attribute))
+
+        entry = self.__children.get(key)
+        if entry is not None and entry[0] == size:
+            child = entry[1].get(name)
+            if child is not None and liveobj_valid(child) and child.name == name:
+                return child
+
+        if attribute == "all_devices":
+            by_name = {}
+            self.__index_devices(container.devices, by_name)
+        else:
+            by_name = {}
+            for child in getattr(container, attribute):
+                by_name.setdefault(child.name, child)
+
+        if len(self.__children) >= MAX_INDEXED_CONTAINERS:
+            self.__children.clear()
+        self.__children[key] = (size, by_name)
+        return by_name.get(name)
+
+    def __index_devices(self, devices, by_name):
+        for device in devices:
+            by_name.setdefault(device.name, device)
+            if hasattr(device, "chains"):
+                for chain in device.chains:
+                    self.__index_devices(chain.devices, by_name)
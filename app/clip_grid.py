@@ -0,0 +1,236 @@
+from typing import TYPE_CHECKING
+
+from ableton.v3.base import EventObject, listens
+from ableton.v3.live import liveobj_valid
+
+if TYPE_CHECKING:
+    from .hardware_interface import HardwareInterface
+    from .session_view import SessionView
+    from .z_controls.session_clip_control import SessionClipControl
+
+
+class ClipGrid(EventObject):
+    """Keeps the state of every clip slot in the session ring's window, and drives the session view's pads from it.
+
+    Live listeners live on one `SlotWatcher` per clip slot and one `TrackWatcher` per track in view,
+    not on the pads. When the ring moves, watchers for slots that are still in view are kept, so
+    scrolling by one column only creates watchers for the column that came into view.
+    A pad is only sent a new colour when its colour has actually changed.
+    """
+
+    def __init__(self, session_view: "SessionView", controls: "list[list[SessionClipControl]]", hardware_interface: "HardwareInterface"):
+        super().__init__()
+        self.__session_view = session_view
+        self.__controls = controls
+        self.__hardware_interface = hardware_interface
+        self.__width = len(controls)
+        self.__height = len(controls[0]) if controls else 0
+        self.__empty_color_dict = session_view.empty_color_dict
+        self.__slot_watchers: "dict[int, SlotWatcher]" = {}
+        self.__track_watchers: "dict[int, TrackWatcher]" = {}
+        self.__cells_by_slot: "dict[int, tuple[int, int]]" = {}
+        self.__columns_by_track: "dict[int, int]" = {}
+        self.__window = None
+
+    def disconnect(self):
+        for watcher in self.__slot_watchers.values():
+            watcher.disconnect()
+        for watcher in self.__track_watchers.values():
+            watcher.disconnect()
+        self.__slot_watchers = {}
+        self.__track_watchers = {}
+        self.__cells_by_slot = {}
+        self.__columns_by_track = {}
+        self.__window = None
+        super().disconnect()
+
+    def assign(self, tracks, scene_offset: int, force=False):
+        """Points the grid at `tracks` from `scene_offset`, then refreshes every pad in one pass.
+        Unless `force` is set, does nothing if the grid is already showing this window."""
+        tracks = list(tracks)[:self.__width]
+        window = (tuple(track._live_ptr for track in tracks), scene_offset)
+        if window == self.__window and not force:
+            return
+        self.__window = window
+
+        slot_watchers = {}
+        track_watchers = {}
+        cells_by_slot = {}
+        columns_by_track = {}
+
+        for x, track in enumerate(tracks):
+            track_ptr = track._live_ptr
+            track_watcher = self.__track_watchers.pop(track_ptr, None) or track_watchers.get(track_ptr)
+            if track_watcher is None:
+                track_watcher = TrackWatcher(self, track)
+            track_watchers[track_ptr] = track_watcher
+            columns_by_track[track_ptr] = x
+
+            clip_slots = track.clip_slots
+            for y in range(min(self.__height, max(0, len(clip_slots) - scene_offset))):
+                clip_slot = clip_slots[y + scene_offset]
+                slot_ptr = clip_slot._live_ptr
+                slot_watcher = self.__slot_watchers.pop(slot_ptr, None)
+                if slot_watcher is None:
+                    slot_watcher = SlotWatcher(self, clip_slot)
+                slot_watchers[slot_ptr] = slot_watcher
+                cells_by_slot[slot_ptr] = (x, y)
+
+        # whatever is left has scrolled out of view
+        for watcher in self.__slot_watchers.values():
+            watcher.disconnect()
+        for watcher in self.__track_watchers.values():
+            watcher.disconnect()
+
+        self.__slot_watchers = slot_watchers
+        self.__track_watchers = track_watchers
+        self.__cells_by_slot = cells_by_slot
+        self.__columns_by_track = columns_by_track
+
+        watchers_by_cell = {cell: slot_watchers[ptr] for ptr, cell in cells_by_slot.items()}
+
+        with self.__hardware_interface.led_frame:
+            for x, column in enumerate(self.__controls):
+                for y, control in enumerate(column):
+                    watcher = watchers_by_cell.get((x, y))
+                    if watcher is None:
+                        control.set_clip_slot(None, None, 0)
+                        control.set_status_color(self.__empty_color_dict, self.__empty_color_dict['base'])
+                    else:
+                        control.set_clip_slot(watcher.clip_slot, watcher.clip, y + scene_offset)
+                        self.__refresh_cell(control, watcher)
+
+    def get_watcher(self, x, y) -> "SlotWatcher | None":
+        control = self.__controls[x][y]
+        if control.clip_slot is None:
+            return None
+        return self.__slot_watchers.get(control.clip_slot._live_ptr)
+
+    def _slot_changed(self, watcher: "SlotWatcher"):
+        cell = self.__cells_by_slot.get(watcher.clip_slot._live_ptr)
+        if cell is None:
+            return
+        control = self.__controls[cell[0]][cell[1]]
+        control.set_clip(watcher.clip)
+        self.__refresh_cell(control, watcher)
+
+    def _track_changed(self, watcher: "TrackWatcher"):
+        x = self.__columns_by_track.get(watcher.track._live_ptr)
+        if x is None:
+            return
+        with self.__hardware_interface.led_frame:
+            for control in self.__controls[x]:
+                if control.clip_slot is None:
+                    continue
+                slot_watcher = self.__slot_watchers.get(control.clip_slot._live_ptr)
+                if slot_watcher is not None:
+                    self.__refresh_cell(control, slot_watcher)
+
+    def __refresh_cell(self, control: "SessionClipControl", watcher: "SlotWatcher"):
+        color_dict, color_key = self.get_slot_status(watcher)
+        control.set_status_color(color_dict, color_dict[color_key])
+
+    def get_slot_status(self, watcher: "SlotWatcher") -> "tuple[dict, str]":
+        """Returns the colour dict for a slot, and which of its colours to show."""
+        clip_slot = watcher.clip_slot
+        track = watcher.track
+
+        if watcher.is_group:
+            if not clip_slot.controls_other_clips:
+                return self.__empty_color_dict, 'base'
+            color_dict = self.__session_view.get_color_dict(track.color_index)
+            return color_dict, 'triggered_to_play' if clip_slot.is_triggered else 'base'
+
+        clip = watcher.clip
+        if clip is not None:
+            color_dict = self.__session_view.get_color_dict(clip.color_index)
+            if clip.is_recording:
+                return color_dict, 'recording'
+            elif clip_slot.is_playing:
+                return color_dict, 'playing'
+            elif clip_slot.is_triggered:
+                return color_dict, 'triggered_to_play'
+            return color_dict, 'base'
+
+        color_dict = self.__empty_color_dict
+        is_armed = track.can_be_armed and track.arm
+        if clip_slot.is_triggered:
+            if is_armed and clip_slot.will_record_on_start:
+                return color_dict, 'triggered_to_record'
+            return color_dict, 'triggered_to_play'
+        if clip_slot.has_stop_button and is_armed:
+            return color_dict, 'arm'
+        return color_dict, 'base'
+
+
+class SlotWatcher(EventObject):
+    """Listens to one clip slot, and the clip in it, on behalf of a `ClipGrid`."""
+
+    def __init__(self, grid: ClipGrid, clip_slot):
+        super().__init__()
+        self.__grid = grid
+        self.clip_slot = clip_slot
+        self.track = clip_slot.canonical_parent
+        self.is_group = clip_slot.is_group_slot
+        self.clip = None
+
+        self._on_is_triggered.subject = clip_slot
+        if self.is_group:
+            self._on_controls_other_clips_changed.subject = clip_slot
+        else:
+            self._on_has_clip_changed.subject = clip_slot
+            self.__watch_clip()
+
+    def __watch_clip(self):
+        clip = self.clip_slot.clip if self.clip_slot.has_clip else None
+        self.clip = clip if liveobj_valid(clip) else None
+        self._on_playing_status_changed.subject = self.clip
+        self._on_is_recording_changed.subject = self.clip
+        self._on_color_index_changed.subject = self.clip
+
+    @listens('has_clip')
+    def _on_has_clip_changed(self):
+        self.__watch_clip()
+        self.__grid._slot_changed(self)
+
+    @listens('playing_status')
+    def _on_playing_status_changed(self):
+        self.__grid._slot_changed(self)
+
+    @listens('is_recording')
+    def _on_is_recording_changed(self):
+        self.__grid._slot_changed(self)
+
+    @listens('is_triggered')
+    def _on_is_triggered(self):
+        self.__grid._slot_changed(self)
+
+    @listens('color_index')
+    def _on_color_index_changed(self):
+        self.__grid._slot_changed(self)
+
+    @listens('controls_other_clips')
+    def _on_controls_other_clips_changed(self):
+        self.__grid._slot_changed(self)
+
+
+class TrackWatcher(EventObject):
+    """Listens to the properties of a track in view that affect all of its slots:
+    its arm state, and for group tracks, its colour."""
+
+    def __init__(self, grid: ClipGrid, track):
+        super().__init__()
+        self.__grid = grid
+        self.track = track
+        if track.can_be_armed:
+            self._on_arm_changed.subject = track
+        if track.is_foldable:
+            self._on_color_index_changed.subject = track
+
+    @listens('arm')
+    def _on_arm_changed(self):
+        self.__grid._track_changed(self)
+
+    @listens('color_index')
+    def _on_color_index_changed(self):
+        self.__grid._track_changed(self)
@@ -1,4 +1,5 @@
 from .errors import *
+from .compiled_template import LruCache
 from .hardware import colors as hardware_colors
 
 Color = hardware_colors.Color
@@ -73,119 +74,22 @@ def get_named_color(name, calling_control=None):
         return RgbColor(0)
 
 
-def parse_color_definition(color, calling_control=None):
-    try:
-
-        try:
-            color = int(color)
-            if 0 <= color <= 127:
-                return RgbColor(color)
-            else:
-                raise ConfigurationError(f'Int color value must be in range 0-127. You entered {color}.')
-        except (TypeError, ValueError):
-            pass
-        if type(color) is str:
-            if '${' in color:
-                from .zcx_core import root_cs
-                resolver = root_cs.component_map['ActionResolver']
-                parse = resolver.compile(color, calling_control._vars, calling_control._context)
-                if parse[1] != 0:
-                    raise ConfigurationError(f'Unparseable color definition: {color}')
-                return get_named_color(parse[0], calling_control=calling_control)
-            return get_named_color(color, calling_control=calling_control)
-        elif type(color) is dict:
-            special_color_type = list(color.keys())[0].lower()
-            special_color_def = list(color.values())[0]
-
-            if isinstance(special_color_def, str) and '${' in special_color_def:
-                from .zcx_core import root_cs
-                resolver = root_cs.component_map['ActionResolver']
-                parse = resolver.compile(special_color_def, calling_control._vars, calling_control._context)
-                if parse[1] != 0:
-                    raise ConfigurationError(f'Unparseable color definition: {color}')
-                special_color_def = parse[0]
-
-            if special_color_type == 'blink':
-                if isinstance(special_color_def, str):
-                    a_def = special_color_def
-                    b_def = None
-                    speed_def = 1
-                else:
-                    a_def = special_color_def['a']
-                    b_def = special_color_def.get('b')
-                    speed_def = special_color_def.get('speed', 1)
-                if b_def is None:
-                    b_def = 0
-                a = parse_color_definition(a_def, calling_control)
-                b = parse_color_definition(b_def, calling_control)
-                speed = hardware_colors.translate_speed(speed_def)
-                if REVERSE_BLINK_COLORS:
-                    temp = b
-                    b = a
-                    a = temp
-
-                return Blink(a, b, speed)
-
-            elif special_color_type == 'pulse':
-                if isinstance(special_color_def, str):
-                    a_def = special_color_def
-                    b_def = 0
-                    speed_def = 1
-                else:
-                    a_def = special_color_def['a']
-                    b_def = special_color_def.get('b')
-                    speed_def = special_color_def.get('speed', 1)
-                if b_def is None or SINGLE_COLOR_PULSE:
-                    b_def = a_def
-                a = parse_color_definition(a_def, calling_control)
-                b = parse_color_definition(b_def, calling_control)
-                speed = hardware_colors.translate_speed(speed_def)
-
-                return Pulse(a, b, speed)
-            elif special_color_type == 'palette':
-                split = special_color_def.split()
-                if len(split) == 1:
-                    index_offset = 0
-                elif len(split) == 2:
-                    index_offset = int(split[1])
-                else:
-                    raise ConfigurationError(f'Invalid color definition: {special_color_def}') #todo
-                palette_name = split[0]
-
-                context = calling_control._context['me']
-                if 'group_index' in context:
-                    index = context['group_index']
-                    if index is None:
-                        index = context['index']
-                else:
-                    # if this doesn't exist something is seriously wrong
-                    index = context['index']
-
-                palette_list = hardware_colors.palettes.get(palette_name)
-                if palette_list is None:
-                    raise ConfigurationError(f'No palette definition in `zcx/hardware/colors.py` for {palette_name}'
-                                             f'\nThe maintainer may not have included it, or it may be misspelled'
-                                             f'\n{calling_control.parent_section.name}'
-                                             f'\n{calling_control._raw_config}')
-
-                i = (index + index_offset) % len(palette_list)
-
-                return palette_list[i]
+# parsed colors, keyed by (definition, swatch class, feedback type), so that identical definitions share one object
+_parsed_colors = {}
+ANIMATED_COLOR_CACHE_SIZE = 512
+# animated colors, keyed by (class, value of a, value of b, speed), so that equal colors share one animation
+_animated_colors = LruCache(ANIMATED_COLOR_CACHE_SIZE)
 
-            elif special_color_type == 'midi':
-                return parse_color_definition(color['midi'], calling_control)
-            elif special_color_type == 'live':
-                try:
-                    special_color_def = int(special_color_def)
-                except ValueError:
-                    raise ConfigurationError(f'Invalid color definition: {special_color_def}\n'
-                                             f'{calling_control._raw_config}')
-                color_index = hardware_colors.live_index_for_midi_index(special_color_def)
-                return Color(color_index)
 
-            else:
-                    raise ConfigurationError(f'Invalid color definition: {color}')
+def parse_color_definition(color, calling_control=None):
+    cache_key = _color_cache_key(color, calling_control)
+    if cache_key is not None:
+        cached = _parsed_colors.get(cache_key)
+        if cached is not None:
+            return cached
 
+    try:
+        parsed = _parse_color_definition(color, calling_control)
     except Exception as e:
         from . import ROOT_LOGGER
         if calling_control is None:
@@ -196,8 +100,192 @@ def parse_color_definition(color, calling_control=None):
         ROOT_LOGGER.error(f'using color: 127')
         return Color(127)
 
+    if cache_key is not None and parsed is not None:
+        _parsed_colors[cache_key] = parsed
+    return parsed
+
+
+def _parse_color_definition(color, calling_control=None):
+    try:
+        color = int(color)
+        if 0 <= color <= 127:
+            return RgbColor(color)
+        else:
+            raise ConfigurationError(f'Int color value must be in range 0-127. You entered {color}.')
+    except (TypeError, ValueError):
+        pass
+    if type(color) is str:
+        if '${' in color:
+            from .zcx_core import root_cs
+            resolver = root_cs.component_map['ActionResolver']
+            parse = resolver.compile(color, calling_control._vars, calling_control._context)
+            if parse[1] != 0:
+                raise ConfigurationError(f'Unparseable color definition: {color}')
+            return get_named_color(parse[0], calling_control=calling_control)
+        return get_named_color(color, calling_control=calling_control)
+    elif type(color) is dict:
+        special_color_type = list(color.keys())[0].lower()
+        special_color_def = list(color.values())[0]
+
+        if isinstance(special_color_def, str) and '${' in special_color_def:
+            from .zcx_core import root_cs
+            resolver = root_cs.component_map['ActionResolver']
+            parse = resolver.compile(special_color_def, calling_control._vars, calling_control._context)
+            if parse[1] != 0:
+                raise ConfigurationError(f'Unparseable color definition: {color}')
+            special_color_def = parse[0]
+
+        if special_color_type == 'blink':
+            if isinstance(special_color_def, str):
+                a_def = special_color_def
+                b_def = None
+                speed_def = 1
+            else:
+                a_def = special_color_def['a']
+                b_def = special_color_def.get('b')
+                speed_def = special_color_def.get('speed', 1)
+            if b_def is None:
+                b_def = 0
+            a = parse_color_definition(a_def, calling_control)
+            b = parse_color_definition(b_def, calling_control)
+            speed = hardware_colors.translate_speed(speed_def)
+            if REVERSE_BLINK_COLORS:
+                temp = b
+                b = a
+                a = temp
+
+            return get_blink(a, b, speed)
+
+        elif special_color_type == 'pulse':
+            if isinstance(special_color_def, str):
+                a_def = special_color_def
+                b_def = 0
+                speed_def = 1
+            else:
+                a_def = special_color_def['a']
+                b_def = special_color_def.get('b')
+                speed_def = special_color_def.get('speed', 1)
+            if b_def is None or SINGLE_COLOR_PULSE:
+                b_def = a_def
+            a = parse_color_definition(a_def, calling_control)
+            b = parse_color_definition(b_def, calling_control)
+            speed = hardware_colors.translate_speed(speed_def)
+
+            return get_pulse(a, b, speed)
+        elif special_color_type == 'palette':
+            split = special_color_def.split()
+            if len(split) == 1:
+                index_offset = 0
+            elif len(split) == 2:
+                index_offset = int(split[1])
+            else:
+                raise ConfigurationError(f'Invalid color definition: {special_color_def}') #todo
+            palette_name = split[0]
+
+            context = calling_control._context['me']
+            if 'group_index' in context:
+                index = context['group_index']
+                if index is None:
+                    index = context['index']
+            else:
+                # if this doesn't exist something is seriously wrong
+                index = context['index']
+
+            palette_list = hardware_colors.palettes.get(palette_name)
+            if palette_list is None:
+                raise ConfigurationError(f'No palette definition in `zcx/hardware/colors.py` for {palette_name}'
+                                         f'\nThe maintainer may not have included it, or it may be misspelled'
+                                         f'\n{calling_control.parent_section.name}'
+                                         f'\n{calling_control._raw_config}')
+
+            i = (index + index_offset) % len(palette_list)
+
+            return palette_list[i]
+
+        elif special_color_type == 'midi':
+            return parse_color_definition(color['midi'], calling_control)
+        elif special_color_type == 'live':
+            try:
+                special_color_def = int(special_color_def)
+            except ValueError:
+                raise ConfigurationError(f'Invalid color definition: {special_color_def}\n'
+                                         f'{calling_control._raw_config}')
+            color_index = hardware_colors.live_index_for_midi_index(special_color_def)
+            return Color(color_index)
+
+        else:
+                raise ConfigurationError(f'Invalid color definition: {color}')
+
 
 def simplify_color(color):
     return hardware_colors.simplify_color(color)
 
+
+def get_pulse(a, b, speed):
+    return _get_animated_color(Pulse, a, b, speed)
+
+
+def get_blink(a, b, speed):
+    return _get_animated_color(Blink, a, b, speed)
+
+
+def _get_animated_color(color_class, a, b, speed):
+    cache_key = (color_class, _color_value_key(a), _color_value_key(b), speed)
+    color = _animated_colors.get(cache_key)
+    if color is None:
+        color = color_class(a, b, speed)
+        _animated_colors.put(cache_key, color)
+    return color
+
+
+def _color_value_key(color):
+    """Returns a hashable key that is equal for colors of the same class and attributes,
+    or the color itself if its attributes can't be hashed."""
+    try:
+        attrs = vars(color)
+    except TypeError:
+        return color
+    key = (type(color), tuple(sorted(
+        (name, _color_value_key(value) if isinstance(value, Color) else value) for name, value in attrs.items()
+    )))
+    try:
+        hash(key)
+    except TypeError:
+        return color
+    return key
+
+
+def clear_color_cache():
+    _parsed_colors.clear()
+    _animated_colors.clear()
+
+
+def _color_cache_key(color, calling_control):
+    frozen_def = _freeze_color_definition(color)
+    if frozen_def is None:
+        return None
+    if calling_control is None:
+        return frozen_def, None, None
+    return frozen_def, type(calling_control._color_swatch), calling_control._feedback_type
+
+
+def _freeze_color_definition(color):
+    """Returns a hashable form of `color`, or None if the parsed color depends on the calling
+    control's vars or context (templates and palettes), so must not be shared."""
+    if isinstance(color, str):
+        return None if '${' in color else color
+    if isinstance(color, (int, float)):
+        return color
+    if isinstance(color, dict):
+        frozen_items = []
+        for key, value in color.items():
+            if isinstance(key, str) and key.lower() == 'palette':
+                return None
+            frozen_value = _freeze_color_definition(value)
+            if frozen_value is None:
+                return None
+            frozen_items.append((key, frozen_value))
+        return tuple(frozen_items)
+    return None
+
 ALL_LIVE_COLORS = [parse_color_definition({"live": i}) for i in range(70)] # 70 colors in the picker
@@ -0,0 +1,160 @@
+import ast
+import re
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+TEMPLATE_PATTERN = re.compile(r"\\\$\\{|\\\${|\$\\{|\${([^{}\\]*)}")
+
+
+class LruCache:
+    """Bounded mapping that evicts the least recently used entry once full."""
+
+    def __init__(self, max_size: int = 512):
+        self._max_size = max(1, max_size)
+        self._entries = OrderedDict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        try:
+            value = self._entries[key]
+        except KeyError:
+            return default
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        self._entries.clear()
+
+
+class TemplateExpression:
+    """A single `${...}` segment of an action string."""
+
+    __slots__ = ('source',)
+
+    def __init__(self, source: str):
+        self.source = source
+
+    def __repr__(self):
+        return f'TemplateExpression({self.source!r})'
+
+
+class CompiledTemplate:
+    """An action string split once into literal and expression segments."""
+
+    __slots__ = ('source', 'segments', 'expressions', 'names')
+
+    def __init__(self, source: str, segments: tuple):
+        self.source = source
+        self.segments = segments
+        self.expressions = tuple(s for s in segments if isinstance(s, TemplateExpression))
+        self.names = None
+
+    @property
+    def is_static(self) -> bool:
+        return len(self.expressions) == 0
+
+    def __repr__(self):
+        return f'CompiledTemplate({self.source!r})'
+
+
+def compile_template(source: str) -> CompiledTemplate:
+    segments = []
+    literal = ''
+    last_end = 0
+
+    for match in TEMPLATE_PATTERN.finditer(source):
+        literal += source[last_end:match.start()]
+        last_end = match.end()
+
+        full_match = match.group(0)
+        expr = match.group(1)
+
+        # escaped or empty patterns are passed through verbatim
+        if full_match.startswith('\\') or not expr:
+            literal += full_match
+            continue
+
+        if literal:
+            segments.append(literal)
+            literal = ''
+        segments.append(TemplateExpression(expr))
+
+    literal += source[last_end:]
+    if literal:
+        segments.append(literal)
+
+    return CompiledTemplate(source, tuple(segments))
+
+
+class TemplateCache:
+    """Caches compiled action strings and the parsed ASTs of their expressions.
+
+    `parse_func` turns an expression string into an AST, raising on failure.
+    Expressions that fail to parse are not cached, so that the caller can
+    re-raise and report the error on every attempt.
+    """
+
+    def __init__(self, parse_func: Callable[[str], Any], max_templates: int = 512, max_expressions: int = 1024):
+        self._parse_func = parse_func
+        self._templates = LruCache(max_templates)
+        self._expressions = LruCache(max_expressions)
+        self._names = LruCache(max_expressions)
+
+    def get_template(self, source: str) -> CompiledTemplate:
+        template = self._templates.get(source)
+        if template is None:
+            template = compile_template(source)
+            self._templates.put(source, template)
+        return template
+
+    def get_expression(self, expr: str) -> Optional[Any]:
+        node = self._expressions.get(expr)
+        if node is None:
+            try:
+                node = self._parse_func(expr)
+            except Exception:
+                return None
+            self._expressions.put(expr, node)
+        return node
+
+    def get_names(self, expr: str) -> frozenset:
+        """Returns every bare name referenced by an expression."""
+        names = self._names.get(expr)
+        if names is None:
+            node = self.get_expression(expr)
+            if node is None:
+                return frozenset()
+            names = frozenset(n.id for n in ast.walk(node) if isinstance(n, ast.Name))
+            self._names.put(expr, names)
+        return names
+
+    def get_template_names(self, template: CompiledTemplate) -> frozenset:
+        """Returns the expression sources of a template plus every name they reference.
+
+        A source is included verbatim so that vars with dotted names such as `me.pct`
+        can be matched against a `${me.pct}` segment.
+        """
+        if template.names is None:
+            names = set()
+            for expression in template.expressions:
+                source = expression.source
+                names.add(source)
+                names.update(self.get_names(source[1:] if source.startswith('$') else source))
+            template.names = frozenset(names)
+        return template.names
+
+    def clear(self):
+        self._templates.clear()
+        self._expressions.clear()
+        self._names.clear()
@@ -0,0 +1,201 @@
+import hashlib
+import logging
+import os
+import pickle
+from contextlib import contextmanager
+
+CACHE_FILE_NAME = '_config_cache.pickle'
+CACHE_VERSION = 2
+
+# files outside the config dir that compiled configs also depend on
+SHARED_DEPENDENCIES = ('zcx.yaml', 'hardware/specs.yaml', '_global_preferences.yaml')
+
+
+def _digest(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class ConfigCache:
+    """On-disk cache of parsed YAML files and compiled (flattened) configs.
+
+    Parsed files are keyed by the hash of their contents, so an unchanged file
+    is never run through the YAML parser twice. Compiled configs are keyed by a
+    fingerprint of every YAML file in their config dir, and are discarded as
+    soon as any of those files change.
+
+    Entries are stored pickled and unpickled on every hit, so callers always
+    receive a private copy they are free to mutate. Anything logged at WARNING
+    or above while a config was compiled is stored with it, and logged again on
+    every hit.
+    """
+
+    def __init__(self, base_dir, logger):
+        self.__base_dir = base_dir
+        self.__path = os.path.join(base_dir, CACHE_FILE_NAME)
+        self.__logger = logger
+        # compiling components log to the loggers beside this one
+        self.__compile_logger = logger.parent
+        self.__enabled = True
+        self.__loaded = False
+        self.__dirty = False
+        self.__parsed = {}
+        self.__compiled = {}
+        self.__file_digests = {}
+        self.__fingerprints = {}
+
+    @property
+    def enabled(self):
+        return self.__enabled
+
+    def begin_load_cycle(self, enabled=True):
+        """Forgets file digests from the previous load, so that edited files are picked up."""
+        self.__enabled = enabled
+        self.__file_digests.clear()
+        self.__fingerprints.clear()
+
+    def load_yaml(self, full_path, parse_func):
+        """Returns the parsed contents of `full_path`, calling `parse_func(file)` on a cache miss."""
+        if not self.__enabled:
+            with open(full_path, 'r') as f:
+                return parse_func(f)
+
+        self.__ensure_loaded()
+        key = self.__relative_path(full_path)
+        digest = self.__get_file_digest(full_path)
+        entry = self.__parsed.get(key)
+        if entry is not None and entry[0] == digest:
+            return pickle.loads(entry[1])
+
+        with open(full_path, 'r') as f:
+            obj = parse_func(f)
+
+        self.__store(self.__parsed, key, digest, obj)
+        return obj
+
+    def get_compiled(self, config_dir, key):
+        """Returns the compiled config stored under `key`, or None if any file in `config_dir` has changed."""
+        if not self.__enabled:
+            return None
+        self.__ensure_loaded()
+        entry = self.__compiled.get((config_dir, key))
+        if entry is None or entry[0] != self.__get_fingerprint(config_dir):
+            return None
+        obj, warnings = pickle.loads(entry[1])
+        for logger_name, level, message in warnings:
+            logging.getLogger(logger_name).log(level, message)
+        return obj
+
+    def put_compiled(self, config_dir, key, obj, warnings=()):
+        """Stores `obj` under `key`, along with the `warnings` collected by `recording_warnings` while compiling it."""
+        if not self.__enabled:
+            return
+        self.__ensure_loaded()
+        self.__store(self.__compiled, (config_dir, key), self.__get_fingerprint(config_dir), (obj, tuple(warnings)))
+
+    @contextmanager
+    def recording_warnings(self):
+        """Collects what is logged at WARNING or above inside the block, to be passed to `put_compiled`."""
+        recorder = _WarningRecorder()
+        self.__compile_logger.addHandler(recorder)
+        try:
+            yield recorder.warnings
+        finally:
+            self.__compile_logger.removeHandler(recorder)
+
+    def get_file_digests(self, config_dir, extra_paths=()) -> dict:
+        """Returns the content hash of every YAML file in `config_dir` plus `extra_paths`,
+        keyed by path relative to the base dir."""
+        full_dir = os.path.join(self.__base_dir, config_dir)
+        paths = [os.path.join(self.__base_dir, path) for path in extra_paths]
+        for root, dirs, files in os.walk(full_dir):
+            dirs.sort()
+            paths.extend(os.path.join(root, file) for file in sorted(files) if file.endswith('.yaml'))
+
+        return {
+            self.__relative_path(path): self.__get_file_digest(path)
+            for path in paths
+            if os.path.isfile(path)
+        }
+
+    def save(self):
+        if not self.__enabled or not self.__dirty:
+            return
+        tmp_path = f'{self.__path}.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(
+                    {'version': CACHE_VERSION, 'parsed': self.__parsed, 'compiled': self.__compiled},
+                    f,
+                    protocol=pickle.HIGHEST_PROTOCOL
+                )
+            os.replace(tmp_path, self.__path)
+            self.__dirty = False
+        except OSError as e:
+            self.__logger.warning(f'Could not write config cache: {e}')
+
+    def clear(self):
+        self.__parsed.clear()
+        self.__compiled.clear()
+        self.__file_digests.clear()
+        self.__fingerprints.clear()
+        self.__dirty = True
+
+    def __ensure_loaded(self):
+        if self.__loaded:
+            return
+        self.__loaded = True
+        if not os.path.isfile(self.__path):
+            return
+        try:
+            with open(self.__path, 'rb') as f:
+                artifact = pickle.load(f)
+            if artifact.get('version') != CACHE_VERSION:
+                return
+            self.__parsed = artifact['parsed']
+            self.__compiled = artifact['compiled']
+        except Exception as e:
+            self.__logger.warning(f'Ignoring unreadable config cache: {e}')
+            self.__parsed = {}
+            self.__compiled = {}
+
+    def __store(self, store, key, digest, obj):
+        try:
+            store[key] = (digest, pickle.dumps(obj, protocol=pickle.HIGHEST_PROTOCOL))
+            self.__dirty = True
+        except (pickle.PicklingError, TypeError, AttributeError):
+            store.pop(key, None)
+
+    def __relative_path(self, full_path):
+        return os.path.relpath(full_path, self.__base_dir)
+
+    def __get_file_digest(self, full_path):
+        digest = self.__file_digests.get(full_path)
+        if digest is None:
+            with open(full_path, 'rb') as f:
+                digest = _digest(f.read())
+            self.__file_digests[full_path] = digest
+        return digest
+
+    def __get_fingerprint(self, config_dir):
+        fingerprint = self.__fingerprints.get(config_dir)
+        if fingerprint is not None:
+            return fingerprint
+
+        hasher = hashlib.blake2b(digest_size=16)
+        for path, digest in self.get_file_digests(config_dir, SHARED_DEPENDENCIES).items():
+            hasher.update(path.encode())
+            hasher.update(digest)
+
+        fingerprint = hasher.digest()
+        self.__fingerprints[config_dir] = fingerprint
+        return fingerprint
+
+
+class _WarningRecorder(logging.Handler):
+
+    def __init__(self):
+        super().__init__(level=logging.WARNING)
+        self.warnings = []
+
+    def emit(self, record):
+        self.warnings.append((record.name, record.levelno, record.getMessage()))
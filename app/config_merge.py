@@ -0,0 +1,52 @@
+"""Copy-on-write merging for the control/encoder template pipeline.
+
+Configs passed through these helpers are treated as immutable. A merge never
+mutates its inputs: it copies only the dicts on the path to an overridden key
+and shares every other subtree with its inputs. Once a config is final, `thaw`
+gives the consumer its own private copy to mutate.
+"""
+from collections.abc import Mapping
+
+
+def merge_configs(base, override, merge_color=False):
+    """Deep merge two configurations, ensuring override values take precedence.
+
+    If `merge_color` is set, two `color` dicts that share the same first key (e.g. both `palette`)
+    are merged shallowly, otherwise the override color replaces the base color entirely.
+    """
+    if not isinstance(override, Mapping):
+        return override
+    if not isinstance(base, Mapping):
+        return override
+
+    merged = dict(base)
+    for key, value in override.items():
+        base_value = merged.get(key)
+        if key in merged and isinstance(base_value, Mapping) and isinstance(value, Mapping):
+            if merge_color and key == "color":
+                try:
+                    if next(iter(base_value)) == next(iter(value)):
+                        merged["color"] = {**base_value, **value}
+                    else:
+                        merged["color"] = value
+                except StopIteration:
+                    merged["color"] = value
+            else:
+                merged[key] = merge_configs(base_value, value, merge_color)
+        else:
+            merged[key] = value
+    return merged
+
+
+def without_keys(config: Mapping, *keys) -> dict:
+    """Returns a shallow copy of `config` minus `keys`."""
+    return {k: v for k, v in config.items() if k not in keys}
+
+
+def thaw(config):
+    """Returns a private copy of a config tree, copying containers and sharing scalar leaves."""
+    if isinstance(config, Mapping):
+        return {k: thaw(v) for k, v in config.items()}
+    if isinstance(config, list):
+        return [thaw(item) for item in config]
+    return config
@@ -1,9 +1,15 @@
+from time import perf_counter
+from typing import TYPE_CHECKING
+
 from ableton.v3.live import liveobj_valid
 from ableton.v3.base import listens
 
 from .consts import CXP_NAME
 from .zcx_component import ZCXComponent
 
+if TYPE_CHECKING:
+    from .gesture_tracer import GestureTracer
+
 
 class CxpBridge(ZCXComponent):
 
@@ -19,6 +25,7 @@ class CxpBridge(ZCXComponent):
         self._osc_server = None
         self.get_clyph_x()
         self.__log_action_lists = True
+        self.__gesture_tracer: "GestureTracer" = None
 
     def setup(self):
         from . import PREF_MANAGER
@@ -28,6 +35,7 @@ class CxpBridge(ZCXComponent):
             self.error(f'Invalid option for `action_log`: {log_action_lists}')
             log_action_lists = True
         self.__log_action_lists = log_action_lists
+        self.__gesture_tracer = self.component_map['GestureTracer']
         self._on_control_surfaces_changed.subject = self.canonical_parent.application
 
     def get_clyph_x(self):
@@ -63,7 +71,13 @@ class CxpBridge(ZCXComponent):
             raise RuntimeError(f"Can't trigger action list!:\n"
                                f"Not connected to {CXP_NAME}. Is it selected as a control surface in Live?")
 
-        self.__clyph_x.trigger_action_list(action_list)
+        tracer = self.__gesture_tracer
+        if tracer is not None and tracer.enabled:
+            start = perf_counter()
+            self.__clyph_x.trigger_action_list(action_list)
+            tracer.action_list_finished(start)
+        else:
+            self.__clyph_x.trigger_action_list(action_list)
 
         if self.__log_action_lists:
             self.log(f'did action list: `{action_list}`')
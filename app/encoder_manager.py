@@ -1,8 +1,6 @@
-import copy
 from typing import Optional
 
-from ableton.v3.base import EventObject, listens, listens_group, listenable_property
-
+from .config_merge import merge_configs, thaw, without_keys
 from .errors import ConfigurationError, CriticalConfigurationError
 from .z_encoder import ZEncoder
 from .zcx_component import ZCXComponent
@@ -22,12 +20,9 @@ class EncoderManager(ZCXComponent):
 
         self._encoders: dict[str, ZEncoder] = {}
         self.__encoder_groups = {}
-        self._selected_device_watcher = None
 
     def setup(self):
         self.debug(f'{self.name} doing setup')
-        self._selected_device_watcher = SelectedDeviceWatcher(self, self.song)
-        ZEncoder.selected_device_watcher = self._selected_device_watcher
         self.create_encoders()
         self.create_osc_watchers()
 
@@ -39,6 +34,11 @@ class EncoderManager(ZCXComponent):
         self._encoders: dict[str, ZEncoder] = {}
         self.__encoder_groups = {}
 
+    def reload(self):
+        self._unload()
+        self.setup()
+        self.bind_all_encoders()
+
     def bind_all_encoders(self):
         for enc_name, enc_obj in self._encoders.items():
             try:
@@ -48,12 +48,17 @@ class EncoderManager(ZCXComponent):
 
     def create_encoders(self):
         try:
-            try:
-                encoder_config = self.yaml_loader.load_yaml(f'{self._config_dir}/encoders.yaml')
-            except FileNotFoundError:
-                encoder_config = {}
+            flat_config = self.yaml_loader.get_compiled(self._config_dir, 'encoders')
 
-            flat_config = self.flatten_encoder_config(encoder_config)
+            if flat_config is None:
+                try:
+                    encoder_config = self.yaml_loader.load_yaml(f'{self._config_dir}/encoders.yaml')
+                except FileNotFoundError:
+                    encoder_config = {}
+
+                with self.yaml_loader.recording_warnings() as warnings:
+                    flat_config = self.flatten_encoder_config(encoder_config)
+                self.yaml_loader.put_compiled(self._config_dir, 'encoders', flat_config, warnings)
 
             from . import PREF_MANAGER
             user_prefs = PREF_MANAGER.user_prefs
@@ -63,6 +68,7 @@ class EncoderManager(ZCXComponent):
             ZEncoder.action_resolver = self.canonical_parent.component_map['ActionResolver']
             ZEncoder.song = self.song
             ZEncoder.session_ring = self.canonical_parent._session_ring_custom
+            ZEncoder.binding_engine = self.canonical_parent.component_map['BindingEngine']
 
             undo_duration_def = user_prefs.get("encoder_undo_duration")
             if undo_duration_def:
@@ -122,20 +128,6 @@ class EncoderManager(ZCXComponent):
     def flatten_encoder_config(self, raw_config) -> dict:
         self.debug(f'Flattening encoder config')
 
-        def merge_configs(base, override):
-            """Deep merge two configurations, ensuring override values take precedence"""
-            merged = copy.deepcopy(base)
-            for key, value in override.items():
-                if (
-                        key in merged
-                        and isinstance(merged[key], dict)
-                        and isinstance(value, dict)
-                ):
-                    merged[key] = merge_configs(merged[key], value)
-                else:
-                    merged[key] = copy.deepcopy(value)
-            return merged
-
         flat_defs = {}
         grouped_defs = {}
 
@@ -154,7 +146,6 @@ class EncoderManager(ZCXComponent):
                 'group_name': group_name,
             }
 
-            group_def = copy.deepcopy(group_def)
             included_encoders = group_def.get('includes')
             override_dict = group_def.get('encoders', {})
 
@@ -164,19 +155,17 @@ class EncoderManager(ZCXComponent):
                     f'\n{group_def}'
                 )
 
-            del group_def['includes']
+            group_def = without_keys(group_def, 'includes')
 
             for i, encoder_name in enumerate(included_encoders):
-                item_def_copy = copy.deepcopy(group_def)
-
                 if encoder_name in override_dict:
                     override_def = override_dict[encoder_name]
                 else:
                     override_def = {}
 
-                merged_def = merge_configs(item_def_copy, override_def)
+                merged_def = thaw(merge_configs(group_def, override_def))
 
-                group_context_copy = copy.deepcopy(group_context)
+                group_context_copy = dict(group_context)
                 group_context_copy['group_name'] = group_name.lstrip('__')
 
                 this_context = {
@@ -272,93 +261,3 @@ class EncoderManager(ZCXComponent):
     def refresh_all_bindings(self):
         for encoder in self._encoders.values():
             encoder.refresh_binding()
-
-
-class SelectedDeviceWatcher(EventObject):
-
-    def __init__(self, encoder_manager, song, *a, **kw):
-        super().__init__(*a, **kw)
-        self._encoder_manager = encoder_manager
-        self._song = song
-        self._selected_track = None
-        self.__selected_device = None
-        self.__selected_rack = None
-        self.__selected_chain = None
-        self.selected_track_listener.subject = self._song.view
-        self.selected_track_listener()
-
-    def log(self, *msg):
-        self._encoder_manager.debug(*msg)
-
-    @listenable_property
-    def selected_device(self):
-        return self.__selected_device
-
-    @selected_device.setter
-    def selected_device(self, device):
-        self.__selected_device = device
-        self.notify_selected_device(device)
-
-    @listenable_property
-    def selected_rack(self):
-        return self.__selected_rack
-
-    @selected_rack.setter
-    def selected_rack(self, rack):
-        self.__selected_rack = rack
-        self.notify_selected_rack(rack)
-
-    @listenable_property
-    def selected_chain(self):
-        return self.__selected_chain
-
-    @selected_chain.setter
-    def selected_chain(self, chain):
-        self.__selected_chain = chain
-        self.notify_selected_chain(chain)
-
-    @listens('selected_track')
-    def selected_track_listener(self):
-        if hasattr(self, '_selected_track') and self._selected_track is not None:
-            self.selected_device_listener.subject = None
-
-        self._selected_track = self._song.view.selected_track
-        if self._selected_track is not None:
-            self.selected_device_listener.subject = self._selected_track.view
-            self.selected_device_listener()
-            self.log(f'selected track: {self._selected_track.name}')
-        else:
-            self.selected_device = None
-            self.log('No track selected')
-
-    @listens('selected_device')
-    def selected_device_listener(self):
-        self.log(f'selected device changed')
-        new_device = None if self._selected_track is None else self._selected_track.view.selected_device
-        self.selected_device = new_device
-
-        try:
-            if new_device is not None:
-                self.log(f'selected device: {new_device.name}')
-        except AttributeError:
-            pass
-
-        self.selected_chain_listener.subject = None
-
-        if new_device is None or not new_device.can_have_chains:
-            self.selected_rack = None
-            self.selected_chain = None
-            return
-
-        self.selected_rack = new_device
-
-        if hasattr(new_device, 'view') and new_device.view is not None:
-            self.selected_chain_listener.subject = new_device.view
-            self.selected_chain = new_device.view.selected_chain
-        else:
-            self.selected_chain = None
-
-    @listens('selected_chain')
-    def selected_chain_listener(self):
-        if self.selected_rack is not None and hasattr(self.selected_rack, 'view'):
-            self.selected_chain = self.selected_rack.view.selected_chain
@@ -22,3 +22,9 @@ class ZcxStartupError(Exception):
         self.msg = msg
         self.traceback = traceback
         self.boilerplate = boilerplate
+
+
+class NumberedDeviceMissingError(Exception):
+    """Raised when a target names a device by number, and the track has fewer devices."""
+
+    pass
@@ -0,0 +1,196 @@
+from bisect import bisect_left
+from time import perf_counter
+
+from .zcx_component import ZCXComponent
+
+BUCKET_BOUNDS_MS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250)
+STAGES = ("dispatch", "resolve", "cxp", "total")
+REPORT_CONTROL_COUNT = 10
+
+
+class LatencyHistogram:
+    """Counts latencies into the fixed buckets of `BUCKET_BOUNDS_MS`, plus one for anything slower."""
+
+    __slots__ = ("counts", "count", "total", "max")
+
+    def __init__(self):
+        self.counts = [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, ms: float):
+        self.counts[bisect_left(BUCKET_BOUNDS_MS, ms)] += 1
+        self.count += 1
+        self.total += ms
+        if ms > self.max:
+            self.max = ms
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, p: float) -> float:
+        """The upper bound of the bucket containing the `p`th percentile, or the max if it is the last bucket."""
+        if not self.count:
+            return 0.0
+        target = self.count * p / 100
+        running = 0
+        for i, count in enumerate(self.counts):
+            running += count
+            if running >= target:
+                return min(BUCKET_BOUNDS_MS[i], self.max) if i < len(BUCKET_BOUNDS_MS) else self.max
+        return self.max
+
+    def to_dict(self) -> dict:
+        labels = [f"<={bound}" for bound in BUCKET_BOUNDS_MS] + [f">{BUCKET_BOUNDS_MS[-1]}"]
+        return {
+            "count": self.count,
+            "mean": round(self.mean, 3),
+            "p50": round(self.percentile(50), 3),
+            "p95": round(self.percentile(95), 3),
+            "max": round(self.max, 3),
+            "buckets": dict(zip(labels, self.counts)),
+        }
+
+
+class GestureTracer(ZCXComponent):
+    """Opt-in timing of the path from a hardware event to ClyphX Pro, enabled by the `gesture_tracing` preference.
+
+    Each traced gesture records how long it took to reach a control (`dispatch`), to run its commands (`resolve`),
+    how much of that was spent triggering action lists (`cxp`), and the whole event (`total`).
+    Times are aggregated into `LatencyHistogram`s per stage, per control, and per command type.
+    """
+
+    def __init__(
+            self,
+            name="GestureTracer",
+            *a,
+            **k,
+    ):
+        super().__init__(name=name, *a, **k)
+        self.__enabled = False
+        self.__event_start = None
+        self.__stage_times: "dict[str, float]" = {}
+        self.__traced_controls: "list[str]" = []
+        self.__stages: "dict[str, LatencyHistogram]" = {}
+        self.__controls: "dict[str, LatencyHistogram]" = {}
+        self.__command_types: "dict[str, LatencyHistogram]" = {}
+        self.reset()
+
+    def setup(self):
+        from . import PREF_MANAGER
+        tracing_def = PREF_MANAGER.user_prefs.get("gesture_tracing", False)
+        if not isinstance(tracing_def, bool):
+            self.error(f"Invalid value for preference `gesture_tracing`: ({tracing_def}).\nUsing `False`")
+            tracing_def = False
+        self.__enabled = tracing_def
+
+    def _unload(self):
+        super()._unload()
+        self.__event_start = None
+        self.reset()
+
+    @property
+    def enabled(self) -> bool:
+        return self.__enabled
+
+    @enabled.setter
+    def enabled(self, value: bool):
+        if not isinstance(value, bool):
+            raise TypeError("gesture tracing must be enabled with a boolean")
+        self.__enabled = value
+        self.__event_start = None
+
+    def reset(self):
+        self.__stages = {stage: LatencyHistogram() for stage in STAGES}
+        self.__controls = {}
+        self.__command_types = {}
+
+    def begin_event(self) -> bool:
+        """Starts a trace, unless one is already running. Returns True if the caller should call `end_event()`."""
+        if not self.__enabled or self.__event_start is not None:
+            return False
+        self.__event_start = perf_counter()
+        self.__stage_times = {}
+        self.__traced_controls = []
+        return True
+
+    def end_event(self):
+        start = self.__event_start
+        if start is None:
+            return
+        self.__event_start = None
+        if not self.__traced_controls:
+            return
+        total = (perf_counter() - start) * 1000
+        stage_times = self.__stage_times
+        for stage in ("dispatch", "resolve", "cxp"):
+            if stage in stage_times:
+                self.__stages[stage].add(stage_times[stage])
+        self.__stages["total"].add(total)
+        for control_name in self.__traced_controls:
+            self.__get_histogram(self.__controls, control_name).add(total)
+
+    def gesture_started(self, control_name: str) -> bool:
+        """Called by a control that is about to run commands for a gesture.
+        Gestures that don't come from a hardware event, e.g. `held`, start their own trace, in which
+        case this returns True, and the caller should call `end_event()`."""
+        opened = self.begin_event()
+        now = perf_counter()
+        if "dispatch" not in self.__stage_times:
+            self.__stage_times["dispatch"] = (now - self.__event_start) * 1000
+        self.__traced_controls.append(control_name)
+        return opened
+
+    def command_finished(self, command, start: float):
+        ms = (perf_counter() - start) * 1000
+        self.__add_stage_time("resolve", ms)
+        self.__get_histogram(self.__command_types, get_command_type(command)).add(ms)
+
+    def action_list_finished(self, start: float):
+        if self.__event_start is not None:
+            self.__add_stage_time("cxp", (perf_counter() - start) * 1000)
+
+    def __add_stage_time(self, stage: str, ms: float):
+        self.__stage_times[stage] = self.__stage_times.get(stage, 0.0) + ms
+
+    @staticmethod
+    def __get_histogram(histograms: "dict[str, LatencyHistogram]", key: str) -> LatencyHistogram:
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = histograms[key] = LatencyHistogram()
+        return histogram
+
+    def get_report(self) -> dict:
+        return {
+            "stages": {stage: histogram.to_dict() for stage, histogram in self.__stages.items()},
+            "command_types": {name: histogram.to_dict() for name, histogram in self.__command_types.items()},
+            "controls": {name: histogram.to_dict() for name, histogram in self.__controls.items()},
+        }
+
+    def log_report(self):
+        def row(name, histogram: LatencyHistogram):
+            return (f"{name:<24} {histogram.count:>6} {histogram.mean:>8.3f} {histogram.percentile(50):>8.3f} "
+                    f"{histogram.percentile(95):>8.3f} {histogram.max:>8.3f}")
+
+        header = f"{'':<24} {'count':>6} {'mean':>8} {'p50':>8} {'p95':>8} {'max':>8}"
+        lines = [f"gesture latency report (ms), tracing {'on' if self.__enabled else 'off'}", header]
+        lines += [row(stage, histogram) for stage, histogram in self.__stages.items()]
+        lines += ["", "by command type:", header]
+        lines += [row(name, histogram) for name, histogram in sorted(self.__command_types.items())]
+
+        slowest = sorted(self.__controls.items(), key=lambda item: (item[1].percentile(95), item[1].max), reverse=True)
+        lines += ["", f"slowest {REPORT_CONTROL_COUNT} controls by p95:", header]
+        lines += [row(name, histogram) for name, histogram in slowest[:REPORT_CONTROL_COUNT]]
+        self.log("\n".join(lines))
+
+
+def get_command_type(command) -> str:
+    if isinstance(command, str):
+        return "cxp"
+    if isinstance(command, dict) and len(command) == 1:
+        return str(next(iter(command)))
+    if callable(command):
+        return "callable"
+    return "bundle"
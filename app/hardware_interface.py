@@ -3,6 +3,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from ableton.v3.control_surface.elements import ButtonMatrixElement
     from ableton.v2.control_surface.control.control_list import MatrixControl
+    from .gesture_tracer import GestureTracer
+    from .z_element import ZElement
 
 from .z_state import ZState
 from .zcx_component import ZCXComponent
@@ -22,6 +24,8 @@ class HardwareInterface(ZCXComponent):
         super().__init__(name=name, *a, **k)
         self.__button_matrix_element = None
         self.__page_manager = None
+        self.__led_frame = LedFrame(self)
+        self.__gesture_tracer: "GestureTracer" = None
 
     @property
     def button_matrix_element(self) -> "ButtonMatrixElement":
@@ -31,22 +35,57 @@ class HardwareInterface(ZCXComponent):
     def button_matrix_state(self) -> "MatrixControl.State":
         return self.button_matrix
 
+    @property
+    def led_frame(self) -> "LedFrame":
+        return self.__led_frame
+
+    def send_feedback(self, midi_bytes: tuple):
+        """Sends feedback that bypasses the elements, e.g. from `MelodicComponent`.
+        Within an LED frame, only the last message for each status and identifier is sent."""
+        if self.__led_frame.depth:
+            self.__led_frame.feedback[midi_bytes[:2]] = midi_bytes
+        else:
+            self.canonical_parent._send_midi(midi_bytes)
+
+    def _flush_led_frame(self):
+        frame = self.__led_frame
+        element_writes = frame.element_writes
+        feedback = frame.feedback
+        frame.element_writes = {}
+        frame.feedback = {}
+
+        for element, (write, args, force) in element_writes.items():
+            try:
+                if force:
+                    element._force_next_send = True
+                write(element, *args)
+            except Exception as e:
+                self.error(f"Failed to update light for `{element.name}`:")
+                self.error(f"{e.__class__.__name__}: {e}")
+        for midi_bytes in feedback.values():
+            self.canonical_parent._send_midi(midi_bytes)
+
     def handle_control_event(self, event, state: ZState.State):
+        tracer = self.__gesture_tracer
+        tracing = tracer is not None and tracer.begin_event()
         try:
             state.forward_gesture(event)
         except Exception as e:
             self.error(f"{e.__class__.__name__}: {e}")
             self.error(traceback.format_exc())
+        if tracing:
+            tracer.end_event()
 
     def refresh_all_lights(self):
         count = 0
-        for state_name in self.named_button_states.keys():
-            element = getattr(self, f'_button_{state_name}')
-            element.request_color_update()
-            count += 1
-        for state in self.button_matrix_state:
-            state.request_color_update()
-            count += 1
+        with self.__led_frame:
+            for state_name in self.named_button_states.keys():
+                element = getattr(self, f'_button_{state_name}')
+                element.request_color_update()
+                count += 1
+            for state in self.button_matrix_state:
+                state.request_color_update()
+                count += 1
 
         self.debug(f'refreshed {count} lights')
 
@@ -63,6 +102,10 @@ class HardwareInterface(ZCXComponent):
     def setup(self):
         self.__button_matrix_element = self.canonical_parent.elements.button_matrix
         self.__page_manager = self.canonical_parent.component_map['PageManager']
+        self.__gesture_tracer = self.canonical_parent.component_map['GestureTracer']
+        elements = self.canonical_parent.elements
+        for element in list(elements.named_buttons.values()) + elements.button_matrix.nested_control_elements():
+            element._led_frame = self.__led_frame
 
     def _unload(self):
         super()._unload()
@@ -71,3 +114,35 @@ class HardwareInterface(ZCXComponent):
             element._unload()
         for state in self.button_matrix_state:
             state._unload()
+
+
+class LedFrame:
+    """Collects LED writes while open, then sends only the last write made to each element.
+
+    Used as a context manager, e.g. `with hardware_interface.led_frame:`. Frames may be nested;
+    the writes are sent when the outermost frame closes.
+    """
+
+    __slots__ = ("depth", "element_writes", "feedback", "__owner")
+
+    def __init__(self, owner: HardwareInterface):
+        self.__owner = owner
+        self.depth = 0
+        self.element_writes: "dict[ZElement, tuple]" = {}
+        self.feedback: "dict[tuple, tuple]" = {}
+
+    def __enter__(self):
+        self.depth += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self.depth -= 1
+        if self.depth == 0 and (self.element_writes or self.feedback):
+            self.__owner._flush_led_frame()
+        return False
+
+    def buffer(self, element: "ZElement", write, args: tuple, force=False):
+        previous = self.element_writes.get(element)
+        if previous is not None:
+            force = force or previous[2]
+        self.element_writes[element] = (write, args, force)
@@ -0,0 +1,86 @@
+import copy
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+DEFAULT_QUEUE_SIZE = 1000 # records
+
+LOG_LEVELS = {
+    'debug': logging.DEBUG,
+    'info': logging.INFO,
+    'warning': logging.WARNING,
+    'error': logging.ERROR,
+    'critical': logging.CRITICAL,
+}
+
+
+class QueuedLogHandler(QueueHandler):
+    """Hands log records to a background thread that writes them to `target`, so a slow disk never blocks the
+    thread that logged. The queue holds at most `max_size` records; when it is full new records are dropped, and
+    the number dropped is logged as a warning once there is room again.
+    """
+
+    def __init__(self, target: logging.Handler, max_size: int = DEFAULT_QUEUE_SIZE):
+        super().__init__(queue.Queue(max_size))
+        self.target = target
+        self.dropped_count = 0
+        self.__unreported_drops = 0
+        self.__listener = _Listener(self.queue, target, respect_handler_level=True)
+        self.__listener.start()
+
+    @property
+    def baseFilename(self):
+        return getattr(self.target, 'baseFilename', None)
+
+    @property
+    def is_running(self) -> bool:
+        thread = self.__listener._thread
+        return thread is not None and thread.is_alive()
+
+    def prepare(self, record):
+        # only resolve the message here, the target's formatter runs on the writer thread
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            formatter = self.target.formatter or logging.Formatter()
+            record.exc_text = formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            if self.__unreported_drops:
+                self.queue.put_nowait(self.__make_drop_record(record.name))
+                self.__unreported_drops = 0
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped_count += 1
+            self.__unreported_drops += 1
+
+    def __make_drop_record(self, name):
+        return logging.makeLogRecord({
+            'name': name,
+            'levelno': logging.WARNING,
+            'levelname': 'WARNING',
+            'msg': f'log queue full, dropped {self.__unreported_drops} messages',
+        })
+
+    def flush(self):
+        """Blocks until everything queued so far has been written."""
+        if self.is_running:
+            self.queue.join()
+        self.target.flush()
+
+    def close(self):
+        if self.is_running:
+            self.__listener.stop()
+        self.target.close()
+        super().close()
+
+
+class _Listener(QueueListener):
+
+    def enqueue_sentinel(self):
+        # the queue may be full, wait for the writer to make room
+        self.queue.put(self._sentinel)
@@ -1,4 +1,5 @@
 from copy import copy
+from types import MappingProxyType
 
 from ableton.v2.base.event import listenable_property
 
@@ -18,17 +19,27 @@ class ModeManager(ZCXComponent):
         self.__all_modes = []
         self.__mode_command_dict = {}
         self.__modes_state = {}
+        self.__modes_state_view = MappingProxyType(self.__modes_state)
+        self.__mode_bits: dict[str, int] = {}
+        self.__mode_mask = 0
+        self.__mode_subscribers: dict[str, dict] = {} # mode name: objects to notify when that mode changes
+        self.__subscriber_modes: dict[object, tuple] = {} # subscriber: the modes it is subscribed to
         self.__action_resolver = None
+        self.__hardware_interface = None
         self.__exclusive_modes: dict[str, list[str]] = {} # mode name: list of mode names this mode disables
 
     def setup(self):
         config = self.yaml_loader.load_yaml(f'{self._config_dir}/modes.yaml')
         self.parse_modes_config(config)
 
-        for mode in self.__all_modes:
+        for i, mode in enumerate(self.__all_modes):
             self.__modes_state[mode] = False
+            self.__mode_bits[mode] = 1 << i
+            self.__mode_subscribers[mode] = {}
+        self.__mode_mask = 0
 
         self.__action_resolver = self.component_map['ActionResolver']
+        self.__hardware_interface = self.component_map['HardwareInterface']
 
         from . import PREF_MANAGER
         from . import STRICT_MODE
@@ -76,7 +87,11 @@ class ModeManager(ZCXComponent):
         super()._unload()
         self.__all_modes = []
         self.__mode_command_dict = {}
-        self.__modes_state = {}
+        self.__modes_state.clear()
+        self.__mode_bits = {}
+        self.__mode_mask = 0
+        self.__mode_subscribers = {}
+        self.__subscriber_modes = {}
 
     def parse_modes_config(self, raw_config):
         parsed_modes = []
@@ -114,17 +129,53 @@ class ModeManager(ZCXComponent):
     def current_modes(self):
         return copy(self.__modes_state)
 
+    @property
+    def mode_states(self) -> MappingProxyType:
+        """Read-only live view of mode states, for internal consumers that don't need a snapshot."""
+        return self.__modes_state_view
+
+    @property
+    def mode_mask(self) -> int:
+        return self.__mode_mask
+
     @property
     def active_modes(self) -> list:
-        return [mode for mode, active in self.current_modes.items() if active]
+        return [mode for mode, active in self.__modes_state.items() if active]
+
+    def get_mode_bit(self, mode_name) -> int:
+        return self.__mode_bits[mode_name]
+
+    def get_modes_mask(self, mode_names) -> int:
+        mask = 0
+        for mode in mode_names:
+            mask |= self.__mode_bits[mode]
+        return mask
+
+    def subscribe_to_modes(self, subscriber, mode_names):
+        """Call `subscriber.modes_changed()` whenever one of `mode_names` changes state.
+
+        Replaces any previous subscription held by `subscriber`.
+        """
+        self.unsubscribe_from_modes(subscriber)
+        modes = tuple(mode for mode in dict.fromkeys(mode_names) if mode in self.__mode_subscribers)
+        if not modes:
+            return
+        for mode in modes:
+            self.__mode_subscribers[mode][subscriber] = None
+        self.__subscriber_modes[subscriber] = modes
+
+    def unsubscribe_from_modes(self, subscriber):
+        for mode in self.__subscriber_modes.pop(subscriber, ()):
+            subscribers = self.__mode_subscribers.get(mode)
+            if subscribers is not None:
+                subscribers.pop(subscriber, None)
 
     def add_mode(self, mode_name):
         mode = self.__modes_state.get(mode_name)
         if mode is None:
             raise ValueError(f'Mode {mode_name} is not defined in {self._config_dir}/modes.yaml')
         if self.__modes_state[mode_name] is False:
-            self.__modes_state[mode_name] = True
-            self.notify_current_modes(self.current_modes)
+            self.__set_mode_state(mode_name, True)
             self.debug(f'Added mode {mode_name}')
             self._handle_exclusive_mode(mode_name)
             self.__execute_mode_change_command(mode_name, 'on_enter')
@@ -134,8 +185,7 @@ class ModeManager(ZCXComponent):
         if mode is None:
             raise ValueError(f'Mode {mode_name} is not defined in {self._config_dir}/modes.yaml')
         if self.__modes_state[mode_name] is True:
-            self.__modes_state[mode_name] = False
-            self.notify_current_modes(self.current_modes)
+            self.__set_mode_state(mode_name, False)
             self.debug(f'Removed mode {mode_name}')
             self.__execute_mode_change_command(mode_name, 'on_leave')
 
@@ -143,11 +193,24 @@ class ModeManager(ZCXComponent):
         mode = self.__modes_state.get(mode_name)
         if mode is None:
             raise ValueError(f'Mode {mode_name} is not defined in {self._config_dir}/modes.yaml')
-        self.__modes_state[mode_name] = not self.__modes_state[mode_name]
-        self.notify_current_modes(self.current_modes)
+        self.__set_mode_state(mode_name, not self.__modes_state[mode_name])
         self.debug(f'Toggled mode {mode_name}')
         self.__execute_mode_change_command(mode_name, 'on_toggle')
 
+    def __set_mode_state(self, mode_name, state):
+        self.__modes_state[mode_name] = state
+        if state:
+            self.__mode_mask |= self.__mode_bits[mode_name]
+        else:
+            self.__mode_mask &= ~self.__mode_bits[mode_name]
+
+        # only wake the objects that have a definition involving this mode
+        with self.__hardware_interface.led_frame:
+            for subscriber in list(self.__mode_subscribers[mode_name]):
+                subscriber.modes_changed(self.__modes_state_view)
+
+        self.notify_current_modes(self.current_modes)
+
     def is_valid_mode(self, mode):
         return mode in self.__modes_state
 
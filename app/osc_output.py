@@ -0,0 +1,103 @@
+import time
+
+from .zcx_component import ZCXComponent
+
+DEFAULT_MAX_RATE = 20 # messages per second, per address
+
+
+class OscOutput(ZCXComponent):
+    """Sends zcx's OSC output through ClyphX Pro's OSC server.
+
+    Messages are not sent straight away. Each address holds only its latest value until the next
+    scheduler tick, when everything pending is sent together. A value is dropped if it is the same
+    as the last value sent to that address, and an address is sent at most `max_rate` times per second
+    (the `osc_output` preference of the same name); anything over the rate waits for a later tick.
+    """
+
+    def __init__(
+            self,
+            name="OscOutput",
+            *a,
+            **k,
+    ):
+        super().__init__(name=name, *a, **k)
+        self.__osc_server = None
+        self.__scheduler = None
+        self.__min_interval = 1 / DEFAULT_MAX_RATE
+        self.__pending: "dict[str, object]" = {}
+        self.__last_sent: "dict[str, object]" = {}
+        self.__last_sent_time: "dict[str, float]" = {}
+
+    def setup(self):
+        self.__osc_server = self.component_map['CxpBridge']._osc_server
+        self.__scheduler = self.component_map['Scheduler']
+
+        from . import PREF_MANAGER
+        osc_prefs = PREF_MANAGER.user_prefs.get('osc_output', {})
+        rate_def = osc_prefs.get('max_rate', DEFAULT_MAX_RATE) if isinstance(osc_prefs, dict) else DEFAULT_MAX_RATE
+        if isinstance(rate_def, (int, float)) and not isinstance(rate_def, bool) and rate_def >= 0:
+            self.__min_interval = 1 / rate_def if rate_def else 0.0
+        else:
+            self.error(f"Invalid value for preference `osc_output.max_rate`: ({rate_def}).\nUsing `{DEFAULT_MAX_RATE}`")
+            self.__min_interval = 1 / DEFAULT_MAX_RATE
+
+        from .osc_watcher import OscWatcher
+        OscWatcher.osc_output = self
+
+    def _unload(self):
+        super()._unload()
+        if self.__scheduler is not None:
+            self.__scheduler.cancel(self.__flush)
+        self.__pending.clear()
+        self.__last_sent.clear()
+        self.__last_sent_time.clear()
+
+    @property
+    def is_enabled(self) -> bool:
+        return self.__osc_server is not None
+
+    @property
+    def pending_count(self) -> int:
+        return len(self.__pending)
+
+    def send(self, address: str, value):
+        """Queues `value` to be sent to `address` on the next tick, replacing any value already queued for it."""
+        if self.__osc_server is None:
+            return
+        if address not in self.__pending and self.__last_sent.get(address, self) == value:
+            return
+        self.__pending[address] = value
+        if not self.__scheduler.is_scheduled(self.__flush):
+            self.__scheduler.schedule(self.__flush, 0)
+
+    def flush(self):
+        """Sends everything that is pending now, ignoring `max_rate`."""
+        self.__scheduler.cancel(self.__flush)
+        self.__send_pending(respect_rate=False)
+
+    def __flush(self):
+        self.__send_pending(respect_rate=True)
+        if self.__pending:
+            self.__scheduler.schedule(self.__flush, 0)
+
+    def __send_pending(self, respect_rate: bool):
+        now = time.time()
+        pending = self.__pending
+        self.__pending = {}
+        last_sent = self.__last_sent
+        last_sent_time = self.__last_sent_time
+        min_interval = self.__min_interval
+
+        for address, value in pending.items():
+            if last_sent.get(address, self) == value:
+                continue
+            if respect_rate and now - last_sent_time.get(address, 0.0) < min_interval:
+                self.__pending[address] = value
+                continue
+            try:
+                self.__osc_server.sendOSC(address, value)
+            except Exception as e:
+                self.error(f"Failed to send OSC message to `{address}`: {e.__class__.__name__}: {e}")
+                continue
+            last_sent[address] = value
+            last_sent_time[address] = now
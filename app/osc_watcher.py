@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING
+
 from ableton.v3.base import listens
 from ableton.v2.base.event import EventObject
 
@@ -5,6 +7,9 @@ from .cxp_bridge import CxpBridge
 from .encoder_element import EncoderElement
 from .pad_section import PadSection
 
+if TYPE_CHECKING:
+    from .osc_output import OscOutput
+
 def re_range_float_parameter(min_val, max_val, current):
    return (current - min_val) / (max_val - min_val)
 
@@ -33,6 +38,7 @@ class OscWatcher(EventObject):
 
     address_prefix: str = '/zcx/'
     _osc_server = None
+    osc_output: "OscOutput" = None
 
     def __init__(self, *a, **kw):
         super().__init__(*a, **kw)
@@ -64,26 +70,26 @@ class OscEncoderWatcher(OscWatcher):
     def parameter_value_changed(self):
         if self._base_element.parameter is None:
             if self.send_string:
-                self._osc_server.sendOSC(self._string_osc_address, '-')
+                self.osc_output.send(self._string_osc_address, '-')
             if self.send_float:
-                self._osc_server.sendOSC(self._float_osc_address, 0.0)
+                self.osc_output.send(self._float_osc_address, 0.0)
             if self.send_int:
-                self._osc_server.sendOSC(self._int_osc_address, 0)
+                self.osc_output.send(self._int_osc_address, 0)
         else:
             if self.send_string:
-                self._osc_server.sendOSC(self._string_osc_address, self._base_element.parameter_value)
+                self.osc_output.send(self._string_osc_address, self._base_element.parameter_value)
             if self.send_float:
-                self._osc_server.sendOSC(self._float_osc_address, re_range_float_parameter(self._base_element.parameter.min, self._base_element.parameter.max, self._base_element.parameter.value))
+                self.osc_output.send(self._float_osc_address, re_range_float_parameter(self._base_element.parameter.min, self._base_element.parameter.max, self._base_element.parameter.value))
             if self.send_int:
-                self._osc_server.sendOSC(self._int_osc_address, re_range_int_parameter(self._base_element.parameter.min, self._base_element.parameter.max, self._base_element.parameter.value))
+                self.osc_output.send(self._int_osc_address, re_range_int_parameter(self._base_element.parameter.min, self._base_element.parameter.max, self._base_element.parameter.value))
 
     @listens('parameter_name')
     def parameter_name_changed(self):
         if self._base_element.parameter is None:
             if self.send_string:
-                self._osc_server.sendOSC(self._name_osc_address, '-')
+                self.osc_output.send(self._name_osc_address, '-')
         else:
-            self._osc_server.sendOSC(self._name_osc_address, self._base_element.parameter_name)
+            self.osc_output.send(self._name_osc_address, self._base_element.parameter_name)
 
     def disconnect(self):
         super().disconnect()
@@ -113,6 +113,11 @@ class PadSection(EventObject):
         if not control in self.__owned_controls:
             self.__owned_controls.append(control)
 
+    def unregister_owned_controls(self) -> "list[ZControl]":
+        controls = self.__owned_controls
+        self.__owned_controls = []
+        return controls
+
     def get_row(self, row_num):
         start = row_num * self.__width
         end = start + self.__width
@@ -14,6 +14,7 @@ MATRIX_HEIGHT = 0
 
 if TYPE_CHECKING:
     from .action_resolver import ActionResolver
+    from .osc_output import OscOutput
 
 class PageManager(ZCXComponent):
 
@@ -36,7 +37,7 @@ class PageManager(ZCXComponent):
         self.__named_button_section: Optional[PadSection] = None
         self.__page_definitions: dict[str, dict] = {}
         self.__action_resolver: ActionResolver = None
-        self.__osc_server = None
+        self.__osc_output = None
         self.__osc_address_prefix = None
         self.__osc_address_page_name = None
         self.__osc_address_page_number = None
@@ -84,8 +85,8 @@ class PageManager(ZCXComponent):
 
         try:
             if self.__does_send_page_change_osc:
-                self.__osc_server.sendOSC(self.__osc_address_page_name, self.current_page_name)
-                self.__osc_server.sendOSC(self.__osc_address_page_number, self.__current_page)
+                self.__osc_output.send(self.__osc_address_page_name, self.current_page_name)
+                self.__osc_output.send(self.__osc_address_page_number, self.__current_page)
         except:
             pass
 
@@ -228,7 +229,7 @@ class PageManager(ZCXComponent):
 
         self.__z_manager.create_named_controls()
 
-        self.__osc_server = self.component_map['CxpBridge']._osc_server
+        self.__osc_output: 'OscOutput' = self.component_map['OscOutput']
         self.__osc_address_prefix = f'/zcx/{self.canonical_parent.name}/page'
         self.__osc_address_page_name = self.__osc_address_prefix + '/name'
         self.__osc_address_page_number = self.__osc_address_prefix + '/number'
@@ -251,7 +252,7 @@ class PageManager(ZCXComponent):
         self.__pad_sections: Dict[PadSection] = {}
         self.__named_button_section: Optional[PadSection] = None
         self.__page_definitions = {}
-        self.__osc_server = None
+        self.__osc_output = None
         self.__osc_address_prefix = None
         self.__osc_address_page_name = None
         self.__osc_address_page_number = None
@@ -12,6 +12,9 @@ from ..consts import REPEAT_RATES
 from ..colors import parse_color_definition, ALL_LIVE_COLORS
 repeat_rates_lower = [rate.lower() for rate in REPEAT_RATES]
 
+MAX_TRANSLATION_TABLES = 256
+UNKNOWN_VELOCITY = 0xFF # a pad's LED is not known to be showing anything sent by the keyboard
+
 class PitchClass(Enum):
     HIDDEN = "hidden"
     IN_KEY = "in_key"
@@ -19,6 +22,18 @@ class PitchClass(Enum):
     OUT_KEY = "out_key"
     OUT_OF_RANGE = "out_of_range"
 
+
+class TranslationTable:
+    """The keyboard's layout for one combination of scale, root, octave, layout and chromatic setting."""
+
+    __slots__ = ("og_pitch_to_translated_pitch", "translated_pitches_to_controls", "pitch_classes")
+
+    def __init__(self):
+        self.og_pitch_to_translated_pitch: list[int | None] = [None for _ in range(128)]
+        self.translated_pitches_to_controls: list[list[PlayableZControl]] = [[] for _ in range(128)]
+        self.pitch_classes: list[tuple[PlayableZControl, PitchClass]] = []
+
+
 class MelodicComponent(ZCXComponent):
 
 
@@ -45,11 +60,14 @@ class MelodicComponent(ZCXComponent):
         self.__note_layout = "fourths"
         self.__octave = 3
         self.__does_exist = False
-        self.__sounding_pitches = []
+        self.__sounding_pitches: set[int] = set()
         self.__repeat_rate = 0
         self.__chromatic = False
         self.__full_velo = False
         self.__selected_track_color_index = None
+        self.__translation_tables: dict[tuple, TranslationTable] = {}
+        self.__applied_translations: dict[int, tuple[int, int, int]] = {}
+        self.__feedback_frame = bytearray([UNKNOWN_VELOCITY] * 128)
 
     def _unload(self):
         self.__base_status_message = None
@@ -67,11 +85,14 @@ class MelodicComponent(ZCXComponent):
         self.__note_layout = "fourths"
         self.__octave = 3
         self.__does_exist = False
-        self.__sounding_pitches = []
+        self.__sounding_pitches: set[int] = set()
         self.__repeat_rate = 0
         self.__chromatic = False
         self.__full_velo = False
         self.__selected_track_color_index = None
+        self.__translation_tables: dict[tuple, TranslationTable] = {}
+        self.__applied_translations: dict[int, tuple[int, int, int]] = {}
+        self.__feedback_frame = bytearray([UNKNOWN_VELOCITY] * 128)
 
     @listens('scale_name')
     def _on_scale_name_change(self):
@@ -91,16 +112,16 @@ class MelodicComponent(ZCXComponent):
 
     @octave.setter
     def octave(self, value):
-        self.log("setting octave to {value}".format(value=value))
+        self.debug("setting octave to {value}".format(value=value))
         if not isinstance(value, int):
             raise TypeError('Octave must be an integer')
         if not -1 < value < 11:
             raise ValueError('Octave must be between 0 and 10')
         self.__octave = value
-        self.log("updating translation with octave {value}".format(value=value))
+        self.debug("updating translation with octave {value}".format(value=value))
         self.update_translation()
         self.notify_octave(value)
-        self.log("notified octave")
+        self.debug("notified octave")
 
     @listenable_property
     def repeat_rate(self):
@@ -180,7 +201,7 @@ class MelodicComponent(ZCXComponent):
         self.notify_note_layout(value)
 
     def increment_octave(self, increment: int):
-        self.log(f"incrementing octave to {self.octave} += {increment}")
+        self.debug(f"incrementing octave to {self.octave} += {increment}")
         self.octave = self.octave + increment
 
     def setup(self):
@@ -299,18 +320,46 @@ class MelodicComponent(ZCXComponent):
     def update_translation(self):
         if self.does_exist:
             self.canonical_parent._doing_note_translations = True
-            self.canonical_parent.request_rebuild_midi_map()
-            self._calculate_translations()
+            self.__set_translation_table(self.__get_translation_table())
             self._apply_translation()
             self.canonical_parent._doing_note_translations = False
             self.refresh_all_feedback()
 
+    def invalidate_translations(self):
+        """Forgets which note translations have been sent, e.g. because the MIDI map was rebuilt,
+        so that the next `update_translation` sends all of them."""
+        self.__applied_translations = {}
+
     def debug_translation(self):
         for i in range(128):
             o_p = self.__og_pitch_to_translated_pitch[i]
             if o_p:
                 self.log(f'note {i} -> play note {o_p}')
 
+    def __get_translation_table(self) -> TranslationTable:
+        scale_intervals = tuple(self.song.scale_intervals)
+        tonic_index = self.song.root_note
+        key = (scale_intervals, tonic_index, self.octave, self.note_layout, self.chromatic)
+        table = self.__translation_tables.get(key)
+        if table is None:
+            if len(self.__translation_tables) >= MAX_TRANSLATION_TABLES:
+                self.__translation_tables.clear()
+            table = self._calculate_translations(
+                scale_intervals=list(scale_intervals),
+                octave=self.octave,
+                chromatic=self.chromatic,
+                tonic_index=tonic_index,
+                layout=self.note_layout
+            )
+            self.__translation_tables[key] = table
+        return table
+
+    def __set_translation_table(self, table: TranslationTable):
+        self.__og_pitch_to_translated_pitch = table.og_pitch_to_translated_pitch
+        self.__translated_pitches_to_controls = table.translated_pitches_to_controls
+        for control, pitch_class in table.pitch_classes:
+            control._pitch_class = pitch_class
+
     def _calculate_translations(
             self,
             scale_intervals: Optional[list[int]] = None,
@@ -318,7 +367,7 @@ class MelodicComponent(ZCXComponent):
             chromatic=None,
             tonic_index=None,  # C♮
             layout=None
-    ) -> None:
+    ) -> TranslationTable:
 
         if scale_intervals is None:
             scale_intervals = list(self.song.scale_intervals)
@@ -335,8 +384,10 @@ class MelodicComponent(ZCXComponent):
 
         base_pitch = (octave * 12) + tonic_index
 
-        self.__og_pitch_to_translated_pitch: list[int | None] = [None for _ in range(128)]
-        self.__translated_pitches_to_controls: list[list[PlayableZControl]] = [[] for _ in range(128)]
+        table = TranslationTable()
+        og_pitch_to_translated_pitch = table.og_pitch_to_translated_pitch
+        translated_pitches_to_controls = table.translated_pitches_to_controls
+        pitch_classes = table.pitch_classes
 
         if not chromatic:
             if layout == "fourths":
@@ -360,17 +411,18 @@ class MelodicComponent(ZCXComponent):
                     scale_interval = scale_intervals[scale_degree_index]
 
                     if scale_interval == 0:
-                        control._pitch_class = PitchClass.TONIC
+                        pitch_class = PitchClass.TONIC
                     else:
-                        control._pitch_class = PitchClass.IN_KEY
+                        pitch_class = PitchClass.IN_KEY
 
                     pitch = base_pitch + scale_interval + octave_offset
 
                     if pitch < 0 or pitch > 127:
-                        control._pitch_class = PitchClass.OUT_OF_RANGE
+                        pitch_class = PitchClass.OUT_OF_RANGE
                     else:
-                        self.__og_pitch_to_translated_pitch[og_pitch] = pitch
-                        self.__translated_pitches_to_controls[pitch].append(control)
+                        og_pitch_to_translated_pitch[og_pitch] = pitch
+                        translated_pitches_to_controls[pitch].append(control)
+                    pitch_classes.append((control, pitch_class))
         else:
             if layout == "fourths":
                 row_degrees = 5
@@ -387,46 +439,53 @@ class MelodicComponent(ZCXComponent):
                     pitch = row_start_pitch + j
 
                     if pitch < 0 or pitch > 127:
-                        control._pitch_class = PitchClass.OUT_OF_RANGE
+                        pitch_class = PitchClass.OUT_OF_RANGE
                     else:
-                        self.__og_pitch_to_translated_pitch[og_pitch] = pitch
-                        self.__translated_pitches_to_controls[pitch].append(control)
+                        og_pitch_to_translated_pitch[og_pitch] = pitch
+                        translated_pitches_to_controls[pitch].append(control)
 
                         semitone_distance_from_tonic = (pitch - base_pitch) % 12
 
                         if semitone_distance_from_tonic in scale_intervals:
                             scale_degree_index = scale_intervals.index(semitone_distance_from_tonic)
                             if scale_degree_index == 0:
-                                control._pitch_class = PitchClass.TONIC
+                                pitch_class = PitchClass.TONIC
                             else:
-                                control._pitch_class = PitchClass.IN_KEY
+                                pitch_class = PitchClass.IN_KEY
                         else:
-                            control._pitch_class = PitchClass.OUT_KEY
+                            pitch_class = PitchClass.OUT_KEY
+                    pitch_classes.append((control, pitch_class))
+
+        return table
 
     def _apply_translation(self):
+        """Sends the note translation of each pad to Live, skipping pads whose translation is unchanged."""
+        set_note_translation = self.canonical_parent._c_instance.set_note_translation
+        applied_translations = self.__applied_translations
 
-        for p in range(128):
-            if p not in self.__concerned_pitches:
-                continue
+        for p in self.__concerned_pitches:
             translated_pitch = self.__og_pitch_to_translated_pitch[p]
 
             control = self.__og_pitch_to_controls[p]
             control_in_view = control.in_view
             if translated_pitch is None or not control_in_view:
-                new_pitch = p
-                new_channel = self.__original_channel
-                control._state.set_mode(1)
+                translation = (p, self.__original_channel, 1)
             else:
-                new_pitch = translated_pitch
-                new_channel = self.__playable_channel
-                control._state.set_mode(2)
+                translation = (translated_pitch, self.__playable_channel, 2)
 
-            self.canonical_parent._c_instance.set_note_translation(
+            if applied_translations.get(p) == translation:
+                continue
+
+            new_pitch, new_channel, mode = translation
+            control._state.set_mode(mode)
+
+            set_note_translation(
                 p,
                 self.__original_channel,
                 new_pitch,
                 new_channel
             )
+            applied_translations[p] = translation
 
     @listens('selected_track')
     def _on_selected_track_changed(self):
@@ -492,50 +551,97 @@ class MelodicComponent(ZCXComponent):
             return self.selected_track_color
         return self.__color_dict["pressed"]
 
+    def __pitch_class_velocities(self) -> dict[PitchClass, int]:
+        return {
+            PitchClass.HIDDEN: 0,
+            PitchClass.TONIC: self._color_tonic,
+            PitchClass.IN_KEY: self._color_in_key,
+            PitchClass.OUT_KEY: self._color_out_key,
+            PitchClass.OUT_OF_RANGE: 0,
+        }
+
+    def __send_frame(self, pitches: list[int]):
+        """Sends the feedback frame's velocity for each of `pitches`, as one LED frame."""
+        if not pitches:
+            return
+        status = self.__base_status_message + self.__original_channel
+        frame = self.__feedback_frame
+        hardware_interface = self.component_map["HardwareInterface"]
+        if len(pitches) == 1:
+            hardware_interface.send_feedback((status, pitches[0], frame[pitches[0]]))
+            return
+        with hardware_interface.led_frame:
+            for pitch in pitches:
+                hardware_interface.send_feedback((status, pitch, frame[pitch]))
+
     def refresh_single_pitch(self, t_pitch: int):
+        if not self.__does_exist:
+            return
         try:
-            messages = []
             controls = self.__translated_pitches_to_controls[t_pitch]
+            if not controls:
+                return
             if t_pitch in self.__sounding_pitches:
                 vel = self._color_pressed
             else:
                 vel = self.get_color_for_pitch_class(controls[0]._pitch_class)
+
+            frame = self.__feedback_frame
+            changed = []
             for control in controls:
-                if not control.in_view or control._pitch_class in [PitchClass.OUT_OF_RANGE, PitchClass.HIDDEN]:
+                if not control.in_view or control._pitch_class in (PitchClass.OUT_OF_RANGE, PitchClass.HIDDEN):
                     continue
-                messages.append((self.__base_status_message + self.__original_channel, control._control_element.message_identifier(), vel))
-
-            for msg in messages:
-                self.canonical_parent._send_midi(msg)
+                pitch = control._original_id
+                if frame[pitch] != vel:
+                    frame[pitch] = vel
+                    changed.append(pitch)
+            self.__send_frame(changed)
 
         except Exception as e:
             self.error(e)
 
-    def refresh_all_feedback(self):
+    def refresh_all_feedback(self, force=False):
+        """Brings every keyboard pad's LED up to date, sending only the pads whose velocity changed.
+        With `force`, every pad in view is sent, e.g. after the controller has been reset."""
+        if not self.__does_exist:
+            # no keyboard, or its colors aren't parsed yet
+            return
         try:
-            messages = []
-            for i, t_pitch in enumerate(self.__og_pitch_to_translated_pitch):
-                if not t_pitch:
-                    continue
-                control = self.__og_pitch_to_controls[i]
+            frame = self.__feedback_frame
+            if force:
+                frame[:] = bytes([UNKNOWN_VELOCITY] * 128)
+
+            velocities = self.__pitch_class_velocities()
+            pressed_vel = self._color_pressed
+            sounding_pitches = self.__sounding_pitches
+            og_pitch_to_translated_pitch = self.__og_pitch_to_translated_pitch
+            og_pitch_to_controls = self.__og_pitch_to_controls
+
+            changed = []
+            for pitch in self.__concerned_pitches:
+                control = og_pitch_to_controls[pitch]
                 if not control.in_view:
+                    # whatever is in view here now owns the LED
+                    frame[pitch] = UNKNOWN_VELOCITY
                     continue
-                if t_pitch in self.__sounding_pitches:
-                    vel = self._color_pressed
+                t_pitch = og_pitch_to_translated_pitch[pitch]
+                if t_pitch is None:
+                    vel = 0
+                elif t_pitch in sounding_pitches:
+                    vel = pressed_vel
                 else:
-                    vel = self.get_color_for_pitch_class(control._pitch_class)
-                messages.append((self.__base_status_message + self.__original_channel, i, vel))
+                    vel = velocities[control._pitch_class]
+                if frame[pitch] != vel:
+                    frame[pitch] = vel
+                    changed.append(pitch)
 
-            for msg in messages: # iterate again here to reduce time between each message
-                self.canonical_parent._send_midi(msg)
+            self.__send_frame(changed)
 
         except Exception as e:
             self.critical(e)
 
     def __add_sounding_pitch(self, pitch):
-        if pitch not in self.__sounding_pitches:
-            self.__sounding_pitches.append(pitch)
+        self.__sounding_pitches.add(pitch)
 
     def __remove_sounding_pitch(self, pitch):
-        if pitch in self.__sounding_pitches:
-            self.__sounding_pitches.remove(pitch)
+        self.__sounding_pitches.discard(pitch)
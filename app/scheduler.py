@@ -0,0 +1,104 @@
+from math import ceil
+
+from ableton.v2.base.task import TimerTask
+
+from .zcx_component import ZCXComponent
+
+TICK = 0.05 # seconds
+WHEEL_SLOTS = 64
+
+
+class Scheduler(ZCXComponent):
+    """Runs deferred callbacks, such as the end of a control's animation or a debounced feedback
+    update, from one task instead of a task per control.
+
+    Callbacks are kept in a timing wheel of `WHEEL_SLOTS` slots, each `TICK` seconds wide, so
+    scheduling, rescheduling and cancelling are O(1), and each tick only looks at one slot.
+    A callback is its own key: scheduling it again moves its deadline.
+    """
+
+    def __init__(
+        self,
+        name="Scheduler",
+        *a,
+        **k,
+    ):
+        super().__init__(name=name, *a, **k)
+        self.__task: "SchedulerTask" = None
+        self.__slots: "list[dict[callable, int]]" = [{} for _ in range(WHEEL_SLOTS)]
+        self.__deadlines: "dict[callable, int]" = {}
+        self.__current_tick = 0
+        self.__elapsed = 0.0
+
+    def setup(self):
+        if self.__task is None:
+            self.__task = SchedulerTask(self)
+            self.__task.kill()
+            self.canonical_parent._task_group.add(self.__task)
+
+    def _unload(self):
+        super()._unload()
+        self.clear()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self.__deadlines)
+
+    def schedule(self, callback, delay: float):
+        """Calls `callback()` once `delay` seconds have passed, replacing any pending call to it."""
+        self.cancel(callback)
+        deadline = self.__current_tick + max(1, ceil(delay / TICK))
+        self.__deadlines[callback] = deadline
+        self.__slots[deadline % WHEEL_SLOTS][callback] = deadline
+        if self.__task is not None and not self.__task.is_running:
+            self.__elapsed = 0.0
+            self.__task.restart()
+
+    def cancel(self, callback):
+        deadline = self.__deadlines.pop(callback, None)
+        if deadline is not None:
+            del self.__slots[deadline % WHEEL_SLOTS][callback]
+
+    def is_scheduled(self, callback) -> bool:
+        return callback in self.__deadlines
+
+    def clear(self):
+        for slot in self.__slots:
+            slot.clear()
+        self.__deadlines.clear()
+        if self.__task is not None:
+            self.__task.kill()
+
+    def advance(self, delta: float):
+        """Called by the task with the time passed since its last update."""
+        self.__elapsed += delta
+        while self.__elapsed >= TICK and self.__deadlines:
+            self.__elapsed -= TICK
+            self.__current_tick += 1
+            slot = self.__slots[self.__current_tick % WHEEL_SLOTS]
+            if not slot:
+                continue
+            # entries in the slot that are a full turn of the wheel or more away stay put
+            due = [callback for callback, deadline in slot.items() if deadline <= self.__current_tick]
+            for callback in due:
+                del slot[callback]
+                del self.__deadlines[callback]
+            for callback in due:
+                try:
+                    callback()
+                except Exception as e:
+                    self.error(f"Error in scheduled call `{getattr(callback, '__qualname__', callback)}`:")
+                    self.error(f"{e.__class__.__name__}: {e}")
+
+        if not self.__deadlines:
+            self.__task.kill()
+
+
+class SchedulerTask(TimerTask):
+
+    def __init__(self, scheduler: Scheduler, **k):
+        super().__init__(TICK, **k)
+        self._scheduler = scheduler
+
+    def do_update(self, delta):
+        self._scheduler.advance(delta)
@@ -5,6 +5,9 @@ from ableton.v3.base import listenable_property, EventObject
 from ableton.v2.control_surface.components import SessionRingComponent as SessionRingBase
 from ableton.v3.base import listens
 
+if TYPE_CHECKING:
+    from .osc_output import OscOutput
+
 
 class SessionRing(SessionRingBase):
 
@@ -59,7 +62,7 @@ class SessionRing(SessionRingBase):
 
         self.api = RingAPI(self)
 
-        self.__osc_server = None
+        self.__osc_output = None
         self.__osc_address_base_prefix = None
         self.__osc_address_track_prefix = None
         self.__osc_address_pos_x_address = None
@@ -110,7 +113,7 @@ class SessionRing(SessionRingBase):
         self.__does_send_osc_tracks = osc_prefs.get('ring_tracks', False)
         self.__does_send_osc_positions = osc_prefs.get('ring_pos', False)
 
-        self.__osc_server = self.component_map['CxpBridge']._osc_server
+        self.__osc_output: 'OscOutput' = self.component_map['OscOutput']
         self.__osc_address_base_prefix = f'/zcx/{self.canonical_parent.name}/ring/'
         self.__osc_address_track_prefix = self.__osc_address_base_prefix + f'track/'
         self.__osc_address_pos_x_address = self.__osc_address_base_prefix + f'pos_x/'
@@ -121,7 +124,7 @@ class SessionRing(SessionRingBase):
     def _unload(self):
         from . import PREF_MANAGER
         self._config_dir = PREF_MANAGER.config_dir
-        self.__osc_server = None
+        self.__osc_output = None
         self.__osc_address_base_prefix = None
         self.__osc_address_track_prefix = None
         self.__osc_address_pos_x_address = None
@@ -188,16 +191,16 @@ class SessionRing(SessionRingBase):
             return None
 
     def update_osc(self):
-        if self.__osc_server is None:
+        if self.__osc_output is None:
             return
 
         if self.__does_send_osc_tracks:
             for i, track in enumerate(self.tracks_in_view):
-                self.__osc_server.sendOSC(f'{self.__osc_address_track_prefix}{i}', track.name)
+                self.__osc_output.send(f'{self.__osc_address_track_prefix}{i}', track.name)
 
         if self.__does_send_osc_positions:
-            self.__osc_server.sendOSC(self.__osc_address_pos_x_address, self.scene_offset)
-            self.__osc_server.sendOSC(self.__osc_address_pos_y_address, self.track_offset)
+            self.__osc_output.send(self.__osc_address_pos_x_address, self.scene_offset)
+            self.__osc_output.send(self.__osc_address_pos_y_address, self.track_offset)
 
     @listenable_property
     def offsets(self):
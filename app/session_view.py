@@ -1,5 +1,6 @@
 from .zcx_component import ZCXComponent
 from typing import TYPE_CHECKING
+from .clip_grid import ClipGrid
 from .z_controls.session_clip_control import SessionClipControl
 from ableton.v3.base import listens
 from .colors import parse_color_definition, Pulse, Blink, RgbColor
@@ -31,6 +32,7 @@ class SessionView(ZCXComponent):
         self.__width = 0
         self.__height = 0
         self.__control_array = None
+        self.__clip_grid: 'ClipGrid' = None
 
     def setup(self):
         self.__page_manager: 'PageManager' = self.component_map['PageManager']
@@ -96,6 +98,7 @@ class SessionView(ZCXComponent):
             control_array.append(column)
 
         self.__control_array = control_array
+        self.__clip_grid = ClipGrid(self, control_array, self.component_map['HardwareInterface'])
 
         self.ring_offsets_changed.subject = self._session_ring
         self.tracks_changed.subject = self._song
@@ -107,6 +110,9 @@ class SessionView(ZCXComponent):
 
     def _unload(self):
         super()._unload()
+        if self.__clip_grid is not None:
+            self.__clip_grid.disconnect()
+            self.__clip_grid = None
         self.__pad_section = None
         self.__page_manager: 'PageManager' = None
         self._session_ring = None
@@ -177,25 +183,28 @@ class SessionView(ZCXComponent):
     def get_color_dict(self, color_index):
         return self.__color_dict_lookup[color_index]
 
-    def update_clip_slot_assignments(self):
-        tracks_to_use = self._session_ring.tracks_in_view
-        scene_offset = self._session_ring.offsets['scene_offset']
-
-        if len(tracks_to_use) > len(self.__control_array):
-            tracks_to_use = tracks_to_use[:len(self.__control_array)]
-
-        for i, track in enumerate(tracks_to_use):
-            controls = self.__control_array[i]
-            for j, control in enumerate(controls):
-                control.set_clip_slot(track.clip_slots[j + scene_offset])
+    @property
+    def empty_color_dict(self):
+        return self.__empty_color_dict
+
+    def update_clip_slot_assignments(self, force=False):
+        self.__clip_grid.assign(
+            self._session_ring.tracks_in_view,
+            self._session_ring.offsets['scene_offset'],
+            force=force
+        )
 
     @listens('tracks')
     def tracks_changed(self):
-        self.update_clip_slot_assignments()
+        self.update_clip_slot_assignments(force=True)
 
     @listens('scenes')
     def scenes_changed(self):
-        self.update_clip_slot_assignments()
+        self.update_clip_slot_assignments(force=True)
+
+    @property
+    def clip_grid(self):
+        return self.__clip_grid
 
     @property
     def pad_section(self):
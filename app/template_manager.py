@@ -1,4 +1,5 @@
 from copy import deepcopy
+from types import MappingProxyType
 
 from ableton.v3.control_surface import ControlSurface
 
@@ -27,11 +28,13 @@ class TemplateManager:
 
     @property
     def global_control_template(self):
-        return deepcopy(self.__global_control_template)
+        """Read-only view of the global template. Use `get_control_template` for a mutable copy."""
+        return MappingProxyType(self.__global_control_template)
 
     @property
     def control_templates(self):
-        return deepcopy(self.__control_templates)
+        """Read-only view of all named templates. The templates themselves must not be mutated."""
+        return MappingProxyType(self.__control_templates)
 
     def get_control_template(self, name):
         template = self.__control_templates.get(name)
@@ -1,4 +1,3 @@
-from copy import copy
 from typing import TYPE_CHECKING
 
 from ableton.v2.base.event import listenable_property, listens, listens_group
@@ -9,11 +8,16 @@ from .zcx_component import ZCXComponent
 
 if TYPE_CHECKING:
     from .action_resolver import ActionResolver
+    from .hardware_interface import HardwareInterface
     from .pad_section import PadSection
     from .page_manager import PageManager
     from .z_manager import ZManager
     from .z_control import ZControl
 
+# (page, active overlays) combinations whose composition is kept; more is a sign of overlays being
+# toggled freely, in which case the tables are rebuilt as they are used
+MAX_COMPOSITION_TABLES = 256
+
 
 class ViewManager(ZCXComponent):
 
@@ -24,8 +28,9 @@ class ViewManager(ZCXComponent):
         **k,
     ):
         super().__init__(name=name, *a, **k)
-        self.__in_view_named_controls: "list[ZControl]" = []
-        self.__in_view_matrix_controls: "list[ZControl]" = []
+        self.__named_compositor = LayerCompositor()
+        self.__matrix_compositor = LayerCompositor()
+        self.__composition_tables: "dict[tuple[int, frozenset], tuple[dict, dict]]" = {}
         self.__in_view_section_names: "list[PadSection]" = []
         self.__named_controls_section: "PadSection" = None
         self.__matrix_sections: "dict[str, PadSection]" = {}
@@ -33,6 +38,7 @@ class ViewManager(ZCXComponent):
         self._z_manager: "ZManager" = None
         self._page_manager: "PageManager" = None
         self._action_resolver: "ActionResolver" = None
+        self._hardware_interface: "HardwareInterface" = None
         self.__active_overlay_names: "list[str]" = []
         self.__overlay_details: dict[str, OverlayDetail] = {}
         self.__pages_to_overlays_in: list[list[str]] = []
@@ -41,7 +47,7 @@ class ViewManager(ZCXComponent):
 
     @property
     def in_view_controls(self):
-        return copy(self.__in_view_named_controls)
+        return self.__named_compositor.winners
 
     @listenable_property
     def active_overlay_names(self) -> "list[str]":
@@ -55,11 +61,15 @@ class ViewManager(ZCXComponent):
         self._z_manager: "PageManager" = self.component_map['ZManager']
         self._action_resolver: "ActionResolver" = self.component_map['ActionResolver']
         self._page_manager: "PageManager" = self.component_map['PageManager']
+        self._hardware_interface: "HardwareInterface" = self.component_map['HardwareInterface']
         matrix_sections = self._z_manager.all_matrix_sections
         self.__named_controls_section = self._z_manager.named_controls_section
         self.__matrix_sections = dict(sorted(matrix_sections.items(), key=lambda item: item[1].layer, reverse=False))
         self.__overlay_sections = dict(sorted(self._z_manager.all_overlay_sections.items(), key=lambda item: item[
             1].layer, reverse=False))
+        self.__named_compositor = LayerCompositor(self.__named_layer_entries, self.__on_named_conflict)
+        self.__matrix_compositor = LayerCompositor(self.__matrix_layer_entries, self.__on_matrix_conflict)
+        self.__composition_tables.clear()
 
         page_count = self._page_manager.page_count
         self.__pages_to_overlays_in: list[list[int]] = [[] for _ in range(page_count)]
@@ -147,104 +157,97 @@ class ViewManager(ZCXComponent):
 
     @listens("current_page")
     def _current_page_listener(self):
-        self._on_page_changed()
-        self._update_in_view_controls()
-        
-    def _update_in_view_controls(self):
-        named_set_in_view: "dict[str, tuple[ZControl, int, str]]" = {}
-        matrix_set_in_view: "dict[tuple[int, int], tuple[ZControl, int, str]]" = {}
+        with self._hardware_interface.led_frame:
+            self._on_page_changed()
+            self._update_in_view_controls()
 
+    def _update_in_view_controls(self):
+        current_page = self._page_manager.current_page
+        table_key = (current_page, frozenset(self.__active_overlay_names))
+        tables = self.__composition_tables.get(table_key)
+        if tables is None:
+            if len(self.__composition_tables) >= MAX_COMPOSITION_TABLES:
+                self.__composition_tables.clear()
+            tables = self.__compose(current_page, table_key[1])
+            self.__composition_tables[table_key] = tables
+        named_table, matrix_table = tables
+
+        named_leaving, named_entering = self.__named_compositor.apply(named_table)
+        matrix_leaving, matrix_entering = self.__matrix_compositor.apply(matrix_table)
+
+        with self._hardware_interface.led_frame:
+            for control in matrix_leaving + named_leaving:
+                try:
+                    control.in_view = False
+                except Exception as e:
+                    self.error(f"Error when bringing control `{control.name}` out of view:")
+                    self.error(f"{e.__class__.__name__}: {e}")
+            for control in matrix_entering + named_entering:
+                try:
+                    control.in_view = True
+                    control.request_color_update()
+                except Exception as e:
+                    self.error(f"Error when bringing control `{control.name}` in view:")
+                    self.error(f"{e.__class__.__name__}: {e}")
+
+            if matrix_leaving or matrix_entering:
+                self.component_map["MelodicComponent"].update_translation()
+                self.component_map["MelodicComponent"].refresh_all_feedback()
+
+    def __compose(self, current_page, active_overlay_names):
+        named_layers = {self.__named_controls_section.name: (0, 0, 0)}
         overlay_matrix_section_names = set()
-
-        for section_name, section_obj in self.__overlay_sections.items():
-            if section_name not in self.__active_overlay_names:
+        for order, (section_name, section_obj) in enumerate(self.__overlay_sections.items()):
+            if section_name not in active_overlay_names:
                 continue
-            section_obj: "PadSection" = section_obj
-            layer_idx = section_obj.layer
-            overlay_detail = self.__overlay_details[section_name]
-            overlay_matrix_section_names.update(overlay_detail.matrix_sections)
-
-            for control in section_obj.owned_controls:
-                if control.name.endswith(f"_{section_name}"):
-                    base_name = control.name[:-len(f"_{section_name}")]
-                else:
-                    base_name = control.name
-
-                existing_def = named_set_in_view.get(base_name)
-                if existing_def:
-                    existing_layer = existing_def[1]
-                    existing_section_name = existing_def[2]
-                    if existing_layer == layer_idx:
-                        self.warning(f"Overlays `{section_name}` and `{existing_section_name}` share a layer ({layer_idx}) and the same control (`{base_name}`)\n"
-                                     f"The control from `{section_name}` will be disabled.")
-                        continue
-
-                named_set_in_view[base_name] = (control, layer_idx, section_name)
-
-        named_control_section_name = self.__named_controls_section.name
-        for control in self.__named_controls_section.owned_controls:
-            existing_def = named_set_in_view.get(control.name)
-            if existing_def:
-                continue
-            named_set_in_view[control.name] = (control, 0, named_control_section_name)
-
-        invoked_matrix_sections = set()
-        current_page = self._page_manager.current_page
-        for section_name in overlay_matrix_section_names:
-            invoked_matrix_sections.add(self.__matrix_sections[section_name])
-        for section_obj in self.__matrix_sections.values():
-            if current_page in section_obj.in_pages:
-                invoked_matrix_sections.add(section_obj)
-
-        invoked_matrix_sections = list(invoked_matrix_sections)
-
-        def sort_key(section):
-            is_overlay = section.name in overlay_matrix_section_names
-            return (is_overlay, section.layer)
-
-        invoked_matrix_sections.sort(key=sort_key, reverse=True)
-
-        for section_obj in invoked_matrix_sections:
-            section_obj: "PadSection" = section_obj
-            section_name = section_obj.name
-            layer_idx = section_obj.layer
-            for i, coord in enumerate(section_obj.owned_coordinates):
-                control = section_obj.owned_controls[i]
-                existing_def = matrix_set_in_view.get(coord)
-                if existing_def:
-                    existing_layer = existing_def[1]
-                    existing_section_name = existing_def[2]
-                    if existing_layer == layer_idx and existing_section_name not in overlay_matrix_section_names:
-                        self.warning(f"Sections `{section_name}` and `{existing_section_name}` share a layer ({layer_idx}) and the same control (`idx #{i}`)\n"
-                                     f"The control from `{section_name}` will be disabled.")
-                    continue
-
-                matrix_set_in_view[coord] = (control, layer_idx, section_name)
-        named_to_enable = [entry[0] for entry in named_set_in_view.values()]
-        matrix_to_enable = [entry[0] for entry in matrix_set_in_view.values()]
-
-        named_to_disable = [control for control in self.__in_view_named_controls if control not in named_to_enable]
-        matrix_to_disable = [control for control in self.__in_view_matrix_controls if control not in matrix_to_enable]
-
-        for control in matrix_to_disable + named_to_disable:
-            try:
-                control.in_view = False
-            except Exception as e:
-                self.error(f"Error when bringing control `{control.name}` out of view:")
-                self.error(f"{e.__class__.__name__}: {e}")
-        for control in matrix_to_enable + named_to_enable:
-            try:
-                control.in_view = True
-                control.request_color_update()
-            except Exception as e:
-                self.error(f"Error when bringing control `{control.name}` in view:")
-                self.error(f"{e.__class__.__name__}: {e}")
-
-        self.__in_view_named_controls = named_to_enable
-        self.__in_view_matrix_controls = matrix_to_enable
-        self.component_map["MelodicComponent"].update_translation()
-        self.component_map["MelodicComponent"].refresh_all_feedback()
-
+            named_layers[section_name] = (1, section_obj.layer, -order)
+            overlay_matrix_section_names.update(self.__overlay_details[section_name].matrix_sections)
+
+        matrix_layers = {}
+        for order, (section_name, section_obj) in enumerate(self.__matrix_sections.items()):
+            is_overlay = section_name in overlay_matrix_section_names
+            if is_overlay or current_page in section_obj.in_pages:
+                matrix_layers[section_name] = (int(is_overlay), section_obj.layer, -order)
+
+        return (
+            self.__named_compositor.resolve(named_layers),
+            self.__matrix_compositor.resolve(matrix_layers),
+        )
+
+    def __named_layer_entries(self, section_name):
+        if section_name == self.__named_controls_section.name:
+            return [(control.name, control) for control in self.__named_controls_section.owned_controls]
+        suffix = f"_{section_name}"
+        entries = []
+        for control in self.__overlay_sections[section_name].owned_controls:
+            base_name = control.name[:-len(suffix)] if control.name.endswith(suffix) else control.name
+            entries.append((base_name, control))
+        return entries
+
+    def __matrix_layer_entries(self, section_name):
+        section_obj = self.__matrix_sections[section_name]
+        return list(zip(section_obj.owned_coordinates, section_obj.owned_controls))
+
+    def __on_named_conflict(self, base_name, winner, runner_up):
+        winner_name, winner_priority = winner
+        runner_up_name, runner_up_priority = runner_up
+        if winner_priority[0] == 1 and winner_priority[:2] == runner_up_priority[:2]:
+            self.warning(f"Overlays `{runner_up_name}` and `{winner_name}` share a layer ({winner_priority[1]}) and the same control (`{base_name}`)\n"
+                         f"The control from `{runner_up_name}` will be disabled.")
+
+    def __on_matrix_conflict(self, coord, winner, runner_up):
+        winner_name, winner_priority = winner
+        runner_up_name, runner_up_priority = runner_up
+        if winner_priority[0] == 0 and winner_priority[:2] == runner_up_priority[:2]:
+            self.warning(f"Sections `{runner_up_name}` and `{winner_name}` share a layer ({winner_priority[1]}) and the same control (`{coord}`)\n"
+                         f"The control from `{runner_up_name}` will be disabled.")
+
+    def forget_controls(self, controls: "list[ZControl]"):
+        """Drops controls that have been torn down, so that they are not taken out of view again.
+        Every page is composed afresh on the next update."""
+        self.__composition_tables.clear()
+        self.__named_compositor.forget(controls)
+        self.__matrix_compositor.forget(controls)
 
     def debug_in_view(self):
         self.log(f"---- debug in view ----")
@@ -317,6 +320,61 @@ class ViewManager(ZCXComponent):
         return ([item for item in list1 if item not in set2],
                 [item for item in list2 if item not in set1])
 
+class LayerCompositor:
+    """Decides which control is in view at each key (a matrix coordinate, or a named control's name).
+
+    `resolve()` stacks the controls of each active layer (a section or overlay) per key, and the
+    entry with the highest priority wins that key. The result is a table of key -> control, which
+    the caller may keep and `apply()` again later. `apply()` returns just the controls that stopped
+    or started winning a key.
+    """
+
+    def __init__(self, get_entries=None, on_conflict=None):
+        """
+        :param get_entries: callable taking a layer name, returning the `(key, control)` pairs it covers
+        :param on_conflict: optional callable, called with `(key, (winner_layer, priority), (runner_up_layer, priority))`
+        """
+        self.__get_entries = get_entries
+        self.__on_conflict = on_conflict
+        self.__winners: "dict[any, ZControl]" = {}
+
+    @property
+    def winners(self) -> "list[ZControl]":
+        return list(self.__winners.values())
+
+    def resolve(self, layer_priorities: "dict[str, tuple]") -> "dict[any, ZControl]":
+        """Returns the key -> control table for `layer_priorities`, without applying it."""
+        stacks: "dict[any, list[tuple]]" = {}
+        for layer_name, priority in layer_priorities.items():
+            for key, control in self.__get_entries(layer_name):
+                stacks.setdefault(key, []).append((priority, layer_name, control))
+
+        table = {}
+        for key, stack in stacks.items():
+            if len(stack) > 1:
+                stack.sort(key=lambda entry: entry[0], reverse=True)
+                if self.__on_conflict is not None:
+                    winner_priority, winner_name, _ = stack[0]
+                    runner_up_priority, runner_up_name, _ = stack[1]
+                    self.__on_conflict(key, (winner_name, winner_priority), (runner_up_name, runner_up_priority))
+            table[key] = stack[0][2]
+        return table
+
+    def apply(self, table: "dict[any, ZControl]") -> "tuple[list[ZControl], list[ZControl]]":
+        """Makes `table` the controls in view. Returns `(leaving, entering)` controls.
+        `table` is kept as is, so it must not be modified afterwards."""
+        previous = self.__winners
+        leaving = [control for key, control in previous.items() if table.get(key) is not control]
+        entering = [control for key, control in table.items() if previous.get(key) is not control]
+        self.__winners = table
+        return leaving, entering
+
+    def forget(self, controls: "list[ZControl]"):
+        """Drops torn down controls without reporting them as leaving."""
+        stale = set(controls)
+        self.__winners = {key: control for key, control in self.__winners.items() if control not in stale}
+
+
 class OverlayDetail:
 
     def __init__(self, name, raw_config, layer=None):
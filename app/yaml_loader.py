@@ -1,4 +1,5 @@
 import os
+from .config_cache import ConfigCache
 from .vendor.yaml import safe_load
 
 
@@ -9,6 +10,7 @@ class YamlLoader:
         self.__logger = ROOT_LOGGER.getChild(self.__class__.__name__)
         self.__logger.debug('initialised')
         self.__base_dir = os.path.abspath(os.path.dirname(__file__))
+        self.__cache = ConfigCache(self.__base_dir, self.__logger)
 
     def log(self, *msg):
         for message in msg:
@@ -27,10 +29,28 @@ class YamlLoader:
         if not os.path.isfile(full_path):
             raise FileNotFoundError(f'{full_path} does not exist or is not a file')
 
-        with open(full_path, 'r') as f:
-            obj = safe_load(f)
+        return self.__cache.load_yaml(full_path, safe_load)
 
-        return obj
+    def begin_load_cycle(self, use_cache=True):
+        self.__cache.begin_load_cycle(use_cache)
+
+    def get_compiled(self, config_dir, key):
+        return self.__cache.get_compiled(config_dir, key)
+
+    def put_compiled(self, config_dir, key, obj, warnings=()):
+        self.__cache.put_compiled(config_dir, key, obj, warnings)
+
+    def recording_warnings(self):
+        return self.__cache.recording_warnings()
+
+    def get_file_digests(self, config_dir, extra_paths=()) -> dict:
+        return self.__cache.get_file_digests(config_dir, extra_paths)
+
+    def save_cache(self):
+        self.__cache.save()
+
+    def clear_cache(self):
+        self.__cache.clear()
 
 
 yaml_loader = YamlLoader()
@@ -1,18 +1,24 @@
 from functools import wraps, partial
-from typing import Optional
+from time import perf_counter
+from typing import Optional, TYPE_CHECKING
 
 from ableton.v2.base import EventObject
-from ableton.v2.base.task import TimerTask
 from ableton.v3.base import listens, listenable_property
 from ableton.v3.control_surface import ControlSurface
 
-from .colors import parse_color_definition, simplify_color, Pulse, Blink
+from .colors import parse_color_definition, simplify_color, get_pulse, get_blink
 from .consts import SUPPORTED_GESTURES, SHORTHAND_GESTURES, DEFAULT_ON_THRESHOLD, ON_GESTURES, OFF_GESTURES
 from .errors import ConfigurationError, CriticalConfigurationError
+from .log_queue import LOG_LEVELS
 from .z_element import ZElement
 from .z_state import ZState
 from .pseq import Pseq
 
+if TYPE_CHECKING:
+    from .action_resolver import ActionResolver
+    from .gesture_tracer import GestureTracer
+    from .scheduler import Scheduler
+
 
 def only_in_view(func):
     @wraps(func)
@@ -26,6 +32,9 @@ def only_in_view(func):
 class ZControl(EventObject):
 
     root_cs: ControlSurface = None
+    scheduler: "Scheduler" = None
+    gesture_tracer: "GestureTracer" = None
+    action_resolver: "ActionResolver" = None
 
     def __init__(
             self,
@@ -58,18 +67,20 @@ class ZControl(EventObject):
         self._color_dict = {}
         self._context = {}
         self._gesture_dict = {}
+        self._gesture_plan = {}
+        self._dispatch_cache = {}
         self._concerned_modes = []
+        self._concerned_mode_bits = {}
         self._vars = {}
         self._feedback_type = None
         self._mode_manager = self.root_cs.component_map['ModeManager']
-        self.modes_changed.subject = self._mode_manager
         self._external_light = False
         self._is_animating = False
         self._suppress_animations = False
         self._suppress_attention_animations = False
         self._animate_on_release = False
-        self._current_animation_task = None
         self._current_mode_string = ''
+        self._current_mode_mask = 0
         self._cascade_direction = False
         self._fake_momentary = False
         self._last_received_value = 0
@@ -94,7 +105,9 @@ class ZControl(EventObject):
 
     def _unload(self):
         self.in_view_listener.subject = None
-        self.modes_changed.subject = None
+        self._mode_manager.unsubscribe_from_modes(self)
+        if self.scheduler is not None:
+            self.scheduler.cancel(self._finish_animation)
 
     def setup(self):
         from . import STRICT_MODE
@@ -152,6 +165,8 @@ class ZControl(EventObject):
             self._cascade_direction = False
 
     def log(self, *msgs, level="info"):
+        if not self._parent_logger.isEnabledFor(LOG_LEVELS[level]):
+            return
         log_func = getattr(self._parent_logger, level)
         for msg in msgs:
             log_func(f'({self.name}) {msg}')
@@ -262,11 +277,65 @@ class ZControl(EventObject):
 
             all_modes.sort()
             self._concerned_modes = all_modes
+            self._concerned_mode_bits = {mode: self._mode_manager.get_mode_bit(mode) for mode in all_modes}
             self._gesture_dict = processed_dict
+            self._gesture_plan = self._build_gesture_plan(processed_dict)
+            self._dispatch_cache = {}
+            self._current_mode_mask = 0
+            self._update_mode_subscription()
         except Exception as e:
             self.error(e)
             raise e
 
+    def _build_gesture_plan(self, gesture_dict: dict) -> dict:
+        """Group gesture definitions by gesture, as `(required_mode_mask, action)` pairs.
+
+        Each list is ordered by (mode count, config order), i.e. least to most specific.
+        """
+        candidates = {}
+        for order_idx, (key, action) in enumerate(gesture_dict.items()):
+            parts = key.split("__")
+            required_mask = 0
+            for mode in parts[1:]:
+                required_mask |= self._concerned_mode_bits[mode]
+            candidates.setdefault(parts[0], []).append((len(parts) - 1, order_idx, required_mask, action))
+
+        plan = {}
+        for gesture, gesture_candidates in candidates.items():
+            gesture_candidates.sort(key=lambda x: (x[0], x[1]))
+            plan[gesture] = tuple((c[2], c[3]) for c in gesture_candidates)
+        return plan
+
+    def _get_gesture_actions(self, gesture) -> tuple:
+        """Returns the actions to run for a gesture in the current mode state, memoized per mode mask."""
+        mode_mask = self._current_mode_mask
+        cache_key = (gesture, mode_mask, self._cascade_direction)
+        actions = self._dispatch_cache.get(cache_key)
+        if actions is not None:
+            return actions
+
+        matching = [action for required_mask, action in self._gesture_plan.get(gesture, ())
+                    if required_mask & mode_mask == required_mask]
+
+        if not matching:
+            actions = ()
+        elif not self._cascade_direction:
+            actions = (matching[-1],)
+        elif self._cascade_direction == "down":
+            actions = tuple(matching)
+        else:  # "up"
+            actions = tuple(reversed(matching))
+
+        self._dispatch_cache[cache_key] = actions
+        return actions
+
+    def _get_subscribed_modes(self) -> list:
+        """The modes whose changes this control must be notified of."""
+        return self._concerned_modes
+
+    def _update_mode_subscription(self):
+        self._mode_manager.subscribe_to_modes(self, self._get_subscribed_modes())
+
     def set_vars(self, vars):
         self._vars = vars
 
@@ -382,70 +451,42 @@ class ZControl(EventObject):
             self._context["me"]["velp"] = vel_p
             self._context["me"]["velps"] =  vel_p_s
 
-        current_active_modes = set()
-        if self._current_mode_string:
-            current_active_modes = set(self._current_mode_string.lstrip("__").split("__"))
-
-        matching_candidates = []
-
-        gesture_keys = []
-        for key in self._gesture_dict.keys():
-            parts = key.split("__")
-            if parts[0] == gesture:
-                gesture_keys.append(key)
-
-        for order_idx, key in enumerate(gesture_keys):
-            action = self._gesture_dict[key]
-            parts = key.split("__")
+        matching_actions = self._get_gesture_actions(gesture)
 
-            if len(parts) == 1:
-                mode_count = 0
-                matching_candidates.append({
-                    'action': action,
-                    'mode_count': mode_count,
-                    'key': key,
-                    'config_order': order_idx
-                })
-                continue
-
-            required_modes = set(parts[1:])
-
-            if required_modes.issubset(current_active_modes):
-                mode_count = len(required_modes)
-                matching_candidates.append({
-                    'action': action,
-                    'mode_count': mode_count,
-                    'key': key,
-                    'config_order': order_idx
-                })
-
-        if not matching_candidates:
+        if not matching_actions:
             return False
 
-        if not self._cascade_direction:
-            matching_candidates.sort(key=lambda x: (x['mode_count'], x['config_order']), reverse=True)
-            matching_actions = [matching_candidates[0]['action']]
-        else:
-            if self._cascade_direction == "down":
-                matching_candidates.sort(key=lambda x: (x['mode_count'], x['config_order']))
-            else:  # "up"
-                matching_candidates.sort(key=lambda x: (x['mode_count'], x['config_order']), reverse=True)
-
-            matching_actions = [candidate['action'] for candidate in matching_candidates]
-
         if dry_run:
-            return matching_actions
+            return list(matching_actions)
 
-        for command in matching_actions:
+        tracer = self.gesture_tracer
+        tracing = tracer is not None and tracer.enabled
+        opened_trace = tracing and tracer.gesture_started(self.name)
+        batching = len(matching_actions) > 1 and self.action_resolver.batch_mode == 'gesture'
+        if batching:
+            self.action_resolver.begin_batch()
+
+        try:
+            for command in matching_actions:
 
-            if self.is_pseq(command):
-                command = command.get_next_command()
+                if self.is_pseq(command):
+                    command = command.get_next_command()
 
-            self._resolve_command_bundle(
-                bundle=command,
-                vars_dict=self._vars,
-                context=self._context
-            )
+                start = perf_counter() if tracing else None
+                self._resolve_command_bundle(
+                    bundle=command,
+                    vars_dict=self._vars,
+                    context=self._context
+                )
+                if tracing:
+                    tracer.command_finished(command, start)
+        finally:
+            try:
+                if batching:
+                    self.action_resolver.end_batch()
+            finally:
+                if opened_trace:
+                    tracer.end_event()
 
         if not self._simple_feedback and self._suppress_animations is False and len(matching_actions) > 0:
             self.animate_success()
@@ -466,7 +507,7 @@ class ZControl(EventObject):
             if not self._control_element.is_pressed:
                 self._do_simple_feedback_release()
         self._state._repeat = self._repeat
-        self.update_mode_string(self._mode_manager.current_modes)
+        self.update_mode_string(self._mode_manager.mode_states)
 
     def set_color_to_base(self):
         self._control_element.set_light(self._control_element.color_swatch.base)
@@ -495,17 +536,17 @@ class ZControl(EventObject):
         off = parse_color_definition('0', self)
 
         if self._feedback_type == 'rgb':
-            attention_color = Pulse(simplified_color, white, 48)
-            animate_success = Blink(simplified_color, play_green, 12)
-            animate_failure = Blink(simplified_color, red, 4)
+            attention_color = get_pulse(simplified_color, white, 48)
+            animate_success = get_blink(simplified_color, play_green, 12)
+            animate_failure = get_blink(simplified_color, red, 4)
         elif self._feedback_type == 'basic':
             attention_color = parse_color_definition("full_blink_slow", self)
-            animate_success = Blink(simplified_color, off, 48)
-            animate_failure = Blink(simplified_color, off, 12)
+            animate_success = get_blink(simplified_color, off, 48)
+            animate_failure = get_blink(simplified_color, off, 12)
         elif self._feedback_type == 'biled':
             attention_color = parse_color_definition("amber_blink_slow", self)
-            animate_success = Pulse(simplified_color, green, 48)
-            animate_failure = Blink(simplified_color, red, 12)
+            animate_success = get_pulse(simplified_color, green, 48)
+            animate_failure = get_blink(simplified_color, red, 12)
         else:
             raise ConfigurationError(f'Unknown feedback type: {self._feedback_type}')
 
@@ -549,16 +590,20 @@ class ZControl(EventObject):
         self._color = color
         self._control_element.set_light(color)
 
-    @listens('current_modes')
-    def modes_changed(self, _):
-        self.update_mode_string(_)
+    def modes_changed(self, mode_states):
+        self.update_mode_string(mode_states)
 
     @only_in_view
     def update_mode_string(self, mode_states):
         if not self._concerned_modes:
             self._current_mode_string = ''
+            self._current_mode_mask = 0
             return
         active_concerned_modes = [mode for mode in self._concerned_modes if mode_states.get(mode, False)]
+        mode_mask = 0
+        for mode in active_concerned_modes:
+            mode_mask |= self._concerned_mode_bits[mode]
+        self._current_mode_mask = mode_mask
         if not active_concerned_modes:
             self._current_mode_string = ""
             if (not self._suppress_animations) and (self._suppress_attention_animations is False):
@@ -575,20 +620,23 @@ class ZControl(EventObject):
         if self._suppress_animations:
             return
         self._is_animating = True
-        timer = AnimationTimer(self, duration)
         self._color = self._color_dict['success']
         self.request_color_update()
-        self.task_group.add(timer)
+        self.scheduler.schedule(self._finish_animation, duration)
 
     @only_in_view
     def animate_failure(self, duration=0.7):
         if self._suppress_animations:
             return
         self._is_animating = True
-        timer = AnimationTimer(self, duration)
         self._color = self._color_dict['failure']
         self.request_color_update()
-        self.task_group.add(timer)
+        self.scheduler.schedule(self._finish_animation, duration)
+
+    def _finish_animation(self):
+        self._is_animating = False
+        self._color = self._color_dict['base']
+        self.request_color_update()
 
     @only_in_view
     def _do_simple_feedback_held(self):
@@ -613,20 +661,3 @@ class ZControl(EventObject):
     @listenable_property
     def gesture_received(self):
         return self._last_gesture
-
-class AnimationTimer(TimerTask):
-
-    def __init__(self, owner, duration, **k):
-        super().__init__(duration, **k)
-        self.owner: ZControl = owner
-        old_task = self.owner._current_animation_task
-        if old_task is not None:
-            old_task.kill()
-            self.owner._current_animation_task = self
-        self.restart()
-
-    def on_finish(self):
-        self.owner._is_animating = False
-        self.owner._color = self.owner._color_dict['base']
-        self.owner.request_color_update()
-        self.owner.current_animation_task = None
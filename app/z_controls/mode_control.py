@@ -1,5 +1,3 @@
-from ableton.v2.base.event import listens
-
 from ..errors import ConfigurationError
 from ..z_control import ZControl
 from ..colors import parse_color_definition
@@ -66,12 +64,16 @@ class ModeControl(ZControl):
             self._color_dict["base"] = inactive_color
 
         self._simple_feedback = False
-        self.modes_changed(self.mode_manager.current_modes)
+        self._update_mode_subscription()
+        self.modes_changed(self.mode_manager.mode_states)
+
+    def _get_subscribed_modes(self) -> list:
+        if self._bound_mode is None:
+            return self._concerned_modes
+        return self._concerned_modes + [self._bound_mode]
 
-    @listens('current_modes')
     def modes_changed(self, _):
-        current_modes = self.mode_manager.current_modes
-        my_mode_active = current_modes.get(self._bound_mode) is True
+        my_mode_active = self.mode_manager.mode_states.get(self._bound_mode) is True
         if my_mode_active:
             self._color = self._color_dict.get('attention')
         else:
@@ -1,5 +1,10 @@
+from typing import TYPE_CHECKING, Optional
+
 from ableton.v3.control_surface.elements import ButtonElement
 
+if TYPE_CHECKING:
+    from .hardware_interface import LedFrame
+
 
 class ZElement(ButtonElement):
 
@@ -8,7 +13,33 @@ class ZElement(ButtonElement):
         self.__name = "unnamed_z_element"
         self._color_swatch = None
         self._feedback_type = None
+        self._led_frame: "Optional[LedFrame]" = None
 
     @property
     def color_swatch(self):
         return self._color_swatch
+
+    def set_light(self, value):
+        frame = self._led_frame
+        if frame is not None and frame.depth:
+            frame.buffer(self, ButtonElement.set_light, (value,), self._force_next_send)
+            self._force_next_send = False
+        else:
+            super().set_light(value)
+
+    def _do_draw(self, color):
+        frame = self._led_frame
+        if frame is not None and frame.depth:
+            frame.buffer(self, ButtonElement._do_draw, (color,), self._force_next_send)
+            self._force_next_send = False
+        else:
+            super()._do_draw(color)
+
+    def send_value(self, value, force=False, channel=None):
+        frame = self._led_frame
+        if frame is not None and frame.depth:
+            frame.buffer(self, ButtonElement.send_value, (value, False, channel), force or self._force_next_send)
+            self._force_next_send = False
+        else:
+            super().send_value(value, force=force, channel=channel)
+
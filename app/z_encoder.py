@@ -2,20 +2,19 @@ import copy
 from functools import partial
 
 from ableton.v2.base import EventObject, listenable_property
-from ableton.v3.base import listens
 from ableton.v3.control_surface import ControlSurface
 from ableton.v2.base.task import TimerTask
 
 from .action_resolver import ActionResolver
 from .encoder_element import EncoderElement
 from .encoder_state import EncoderState
-from .errors import ConfigurationError, CriticalConfigurationError
+from .errors import ConfigurationError, CriticalConfigurationError, NumberedDeviceMissingError
+from .log_queue import LOG_LEVELS
 from .mode_manager import ModeManager
 from .session_ring import SessionRing
-from .bank_definitions import get_banked_parameter
+from .binding_engine import BindingEngine, CHAIN_MIXER_PARAMETER_TYPES
 from .parse_target_path import parse_target_path
 from .util import is_chain_map_positional
-from .consts import SENDS_COUNT
 
 ENCODER_UNDO_REFRESH = 2.0
 
@@ -26,8 +25,8 @@ class ZEncoder(EventObject):
     mode_manager: ModeManager = None
     action_resolver: ActionResolver = None
     session_ring: SessionRing = None
+    binding_engine: BindingEngine = None
     song = None
-    selected_device_watcher = None
     _log_failed_bindings = True
     undo_duration = 0.50
 
@@ -51,7 +50,6 @@ class ZEncoder(EventObject):
         self._active_map = {}
         self._unbind_on_fail = True
         self._prefer_left = True
-        self.modes_changed.subject = self.mode_manager
         self._undo_step_timer = UndoStepTask(self, duration=self.undo_duration)
         self._undo_step_timer.kill()
         self.root_cs._task_group.add(self._undo_step_timer)
@@ -62,6 +60,8 @@ class ZEncoder(EventObject):
         self.critical = partial(self.log, level="critical")
 
     def log(self, *msgs, level="info"):
+        if not self._logger.isEnabledFor(LOG_LEVELS[level]):
+            return
         log_func = getattr(self._logger, level)
         for msg in msgs:
             log_func(f'({self._name}) {msg}')
@@ -167,6 +167,9 @@ class ZEncoder(EventObject):
         self._concerned_modes = concerned_modes
         self._binding_dict = binding_dict
         self._active_map = self._default_map
+        self.mode_manager.subscribe_to_modes(
+            self, [mode for mode in concerned_modes if mode not in ["default", ""]]
+        )
 
     @property
     def mapped_parameter(self):
@@ -228,52 +231,7 @@ class ZEncoder(EventObject):
             self.apply_listeners(dynamism)
 
     def apply_listeners(self, listen_dict):
-
-        if listen_dict.get("selected_track"):
-            self.selected_track_listener.subject = self.song.view
-        else:
-            self.selected_track_listener.subject = None
-
-        if listen_dict.get("track_list"):
-            self.track_list_listener.subject = self.song
-        else:
-            self.track_list_listener.subject = None
-
-        if listen_dict.get("device_list"):
-            self.debug(f"setting device_list subject to {self._mapped_track}")
-            self.device_list_listener.subject = self._mapped_track
-        else:
-            self.device_list_listener.subject = None
-
-        if listen_dict.get("parameter_list"):
-            pass
-        else:
-            pass
-
-        if listen_dict.get("chain_list"):
-            self.selected_chain_listener.subject = self.selected_device_watcher
-        else:
-            self.selected_chain_listener.subject = None
-
-        if listen_dict.get("sends_list"):
-            self.return_list_listener.subject = self.song
-        else:
-            self.return_list_listener.subject = None
-
-        if listen_dict.get("selected_parameter"):
-            self.selected_parameter_listener.subject = self.song.view
-        else:
-            self.selected_parameter_listener.subject = None
-
-        if listen_dict.get("ring_tracks"):
-            self.session_ring_track_listener.subject = self.session_ring
-        else:
-            self.session_ring_track_listener.subject = None
-
-        if listen_dict.get("selected_device"):
-            self.selected_device_listener.subject = self.selected_device_watcher
-        else:
-            self.selected_device_listener.subject = None
+        self.binding_engine.subscribe(self, listen_dict, self._mapped_track)
 
     def bind_control(self):
         if self._control_element is None:
@@ -292,48 +250,27 @@ class ZEncoder(EventObject):
         self._mapped_track = None
         self.mapped_parameter = None
         try:
-            par_type = target_map.get("parameter_type")
-            if par_type is not None:
-                if par_type.lower() == "selp":
-                    self.mapped_parameter = self.song.view.selected_parameter
-                    return True
-                elif par_type.lower() == "xfader":
-                    self.mapped_parameter = self.song.master_track.mixer_device.crossfader
-                    return True
-
-            if target_map.get("device") is None and target_map.get("chain_map") is None:
-                if target_map.get("track") is not None:
-                    track_def = target_map.get("track")
-                    track_obj = self.get_track(track_def)
-                    if track_obj is None:
-                        raise ConfigurationError(f"No track found for {track_def}")
-                elif target_map.get("ring_track") is not None:
-                    ring_track_def = target_map.get("ring_track")
-                    ring_track_parsed, status = self.action_resolver.compile(
-                        ring_track_def,
-                        self._vars,
-                        self._context
-                    )
-                    if status != 0:
-                        raise ConfigurationError(f"Unparseable ring target: {ring_track_def}")
-
-                    track_num = int(ring_track_parsed)
-
-                    track_obj = self.get_track_by_number(track_num)
-                    if track_obj is None:
-                        raise ConfigurationError(f"Invalid ring target: `{target_map}`")
-                else:
+            engine = self.binding_engine
+            plan = engine.compile_target(target_map)
+            par_type = plan.par_type
+            if par_type == "selp":
+                self.mapped_parameter = self.song.view.selected_parameter
+                return True
+            elif par_type == "xfader":
+                self.mapped_parameter = self.song.master_track.mixer_device.crossfader
+                return True
+
+            if not plan.has_device:
+                track_obj = engine.resolve_track(plan, self)
+                if track_obj is None:
                     return False
 
                 self._mapped_track = track_obj
                 is_master_track = self._mapped_track == self.song.master_track
 
-                par_type = target_map.get("parameter_type")
                 if par_type is None:
                     raise ConfigurationError("Missing parameter_type")
 
-                par_type = par_type.lower()
-
                 if par_type == "vol":
                     self.mapped_parameter = track_obj.mixer_device.volume
                     return True
@@ -343,192 +280,38 @@ class ZEncoder(EventObject):
                 elif is_master_track:
                     return False
                 ### only targets not available on main track below
-                elif par_type == "send":
-                    try:
-                        send_def = target_map.get("send")
-                        if not send_def.isdigit():
-                            send_letter = send_def.upper()
-                            send_num = ord(send_letter) - 65  # `A` in ASCII
-                            sends_count = len(list(self.song.return_tracks))
-                            if send_num < 0 or send_num >= sends_count:
-                                raise ConfigurationError(
-                                    f"Invalid send: {send_letter} | {send_num} | sends_count {sends_count}"
-                                )
-                        else:
-                            send_num = int(send_def)
-                            if send_num >= SENDS_COUNT:
-                                send_num = send_num % SENDS_COUNT
-
-                        self.mapped_parameter = track_obj.mixer_device.sends[send_num]
-                        return True
-                    except Exception as e:
-                        self.debug(e)
-                        raise ConfigurationError(f"Failed to bind to send: {e}")
-
-                elif par_type == "pan":
-                    self.mapped_parameter = track_obj.mixer_device.panning
-                    return True
-                elif par_type == "panl":
-                    self.mapped_parameter = track_obj.mixer_device.left_split_stereo
-                    return True
-                elif par_type == "panr":
-                    self.mapped_parameter = track_obj.mixer_device.right_split_stereo
-                    return True
-                else:
+                mixer_parameter = engine.resolve_mixer_parameter(plan, track_obj.mixer_device)
+                if mixer_parameter is None:
                     raise ConfigurationError(f"Unsupported parameter type: {par_type}")
+                self.mapped_parameter = mixer_parameter
+                return True
             else:
-                if target_map.get("track") is not None:
-                    track_def = target_map.get("track", "SEL")
-                    track_obj = self.get_track(track_def)
-                    if track_obj is None:
-                        raise ConfigurationError(f"No track found for {track_def}")
-                    elif target_map.get("ring_track") is not None:
-                        ring_track_def = target_map.get("ring_track")
-                        ring_track_parsed, status = self.action_resolver.compile(
-                            ring_track_def,
-                            self._vars,
-                            self._context
-                        )
-                        if status != 0:
-                            raise ConfigurationError(f"Unparseable ring target: {ring_track_def}")
-
-                        track_num = int(ring_track_parsed)
-
-                        track_obj = self.get_track_by_number(track_num)
-                        if track_obj is None:
-                            raise ConfigurationError(f"Invalid ring target: `{target_map}`")
-                else:
-                    track_obj = self.song.view.selected_track
-
+                track_obj = engine.resolve_track(plan, self, default_to_selected=True)
                 self._mapped_track = track_obj
 
-                par_def = target_map.get("parameter_name")
-
-                device_def = target_map.get("device")
-                chain_map_def = target_map.get("chain_map")
-
-                if device_def is not None:
-                    if device_def.lower() == "sel":
-                        device_obj = track_obj.view.selected_device
-                    else:
-                        try:
-                            device_def = int(device_def) - 1
-                            device_obj = list(track_obj.devices)[device_def]
-                        except ValueError:
-                            device_obj = self.get_device_from_list_by_name(
-                                list(track_obj.devices), device_def
-                            )
-                        except IndexError as e:
-                            return False
-
-                    if device_obj is None:
-                        raise ConfigurationError(f"No device found for {device_def}")
-                elif chain_map_def is not None:
-                    device_obj = self.traverse_chain_map(track_obj, chain_map_def)
-
-                    if hasattr(device_obj, "delete_device"): # todo: better test for chainy-ness
-                        if par_type is None:
-                            raise ConfigurationError("Missing parameter_type") # todo:
-
-                        chain_mixer = device_obj.mixer_device
-
-                        self.debug(target_map)
-
-                        if par_type.lower() == 'vol':
-                            self.mapped_parameter = chain_mixer.volume
-                            return True
-                        elif par_type.lower() == 'pan':
-                            self.mapped_parameter = chain_mixer.panning
-                            return True
-                        elif par_type.lower() == 'send':
-                            send_letter = target_map.get("send").upper()
-                            send_num = ord(send_letter) - 65
-                            self.mapped_parameter = chain_mixer.sends[send_num]
-                            return True
+                try:
+                    device_obj = engine.resolve_device(plan, track_obj, self)
+                except NumberedDeviceMissingError:
+                    return False
 
-                else:
-                    raise ConfigurationError("") # todo:
+                if plan.chain_map is not None and hasattr(device_obj, "delete_device"): # todo: better test for chainy-ness
+                    if par_type is None:
+                        raise ConfigurationError("Missing parameter_type") # todo:
 
-                if par_type is not None and par_type.lower() == "cs":
-                    self.mapped_parameter = device_obj.chain_selector
-                    return True
+                    if par_type in CHAIN_MIXER_PARAMETER_TYPES:
+                        self.mapped_parameter = engine.resolve_mixer_parameter(plan, device_obj.mixer_device)
+                        return True
 
-                par_num = target_map.get("parameter_number")
-                par_name = target_map.get("parameter_name")
-
-                bank_def = target_map.get("bank")
-                if bank_def is not None:
-                    bank_num = int(bank_def)
-                    banked_param = get_banked_parameter(device_obj, device_obj.class_name, bank_num, int(par_num), self._prefer_left)
-                    self.mapped_parameter = banked_param
-                    return self.mapped_parameter is not None
-
-                if isinstance(par_name, str):
-                    if "${" in par_name:
-                        parsed_par_name, status = (
-                            parse_target_path(par_num)
-                        )
-                        if status != 0:
-                            raise ConfigurationError(
-                                f"Failed to parse parameter: {par_num}"
-                            )  # todo
-                        par_name = parsed_par_name
-
-                    for par in device_obj.parameters:
-                        if par.name == par_name:
-                            self.mapped_parameter = par
-                            return True
-
-                    raise ConfigurationError(
-                        f'Parameter "{par_def}" not found on device {device_def}'
-                    )
-                else:
-                    if isinstance(par_num, str) and "${" in par_num:
-                        parsed_par_num, status = parse_target_path(
-                            par_num
-                        )
-                        if status != 0:
-                            raise ConfigurationError(
-                                f"Failed to parse parameter: {par_num}"
-                            )  # todo
-                        par_num = parsed_par_num
-                    elif isinstance(par_num, int):
-                        pass
-                    else:
-                        try:
-                            par_num = int(par_num)
-                        except ValueError:
-                            raise ConfigurationError(
-                                f"Failed to parse parameter: {par_num}"
-                            )
-                    try:
-                        self.mapped_parameter = device_obj.parameters[par_num]
-                    except IndexError as e:
-                        return False
-                    return True
+                if par_type != "cs" and plan.par_name is None and plan.par_num is None:
+                    raise ConfigurationError(f"Failed to parse parameter: {plan.par_num}")
+
+                self.mapped_parameter = engine.resolve_device_parameter(plan, device_obj, self._prefer_left)
+                return self.mapped_parameter is not None
 
         except Exception as e:
             self.debug(f"Error in map_self_to_par: {e}")
             raise
 
-    @classmethod
-    def get_device_from_list_by_name(cls, device_list, device_name):
-        for device in device_list:
-            if device.name == device_name:
-                return device
-            elif hasattr(device, "chains"):
-                for chain in device.chains:
-                    result = cls.get_device_from_list_by_name(
-                        chain.devices, device_name
-                    )
-                    if result is not None:
-                        return result
-        return None
-
-    @classmethod
-    def get_track_by_number(cls, track_number):
-        return cls.session_ring.get_ring_track(track_number)
-
     def assess_dynamism(self, target_map) -> dict:
 
         listen_dict = {
@@ -543,6 +326,9 @@ class ZEncoder(EventObject):
             "selected_device": False,
         }
 
+        if target_map is None:
+            return listen_dict
+
         track_def = target_map.get("track")
         if track_def is None:
             listen_dict["selected_track"] = True
@@ -639,10 +425,9 @@ class ZEncoder(EventObject):
         except Exception as e:
             self.debug(e)
 
-    @listens("current_modes")
-    def modes_changed(self, _):
+    def modes_changed(self, mode_states):
         old_mode_string = self._current_mode_string
-        self.update_mode_string(_)
+        self.update_mode_string(mode_states)
         if self._current_mode_string == "":
             mode_string = "default"
         else:
@@ -690,103 +475,6 @@ class ZEncoder(EventObject):
         else:
             self._current_mode_string = ""
 
-    def get_track(self, track_def):
-        if track_def.lower() == "sel":
-            return self.root_cs.song.view.selected_track
-        elif track_def.lower() == "mst":
-            return self.root_cs.song.master_track
-
-        try:
-            track = self.root_cs.component_map["CxpBridge"].get_track_by_name(track_def)
-            return track
-        except RuntimeError:
-            self.debug(f"Failed to get track called `{track_def}` from CXP")
-
-        for track in self.root_cs.song.tracks:
-            if track.name == track_def:
-                return track
-
-        try:
-            track_num = int(track_def) - 1
-            tracklist = list(self.root_cs.song.tracks)
-            return tracklist[track_num]
-        except (ValueError, IndexError):
-            return None
-
-    def traverse_chain_map(self, track, chain_map):
-        def parse_templated_node(_node):
-            if not isinstance(_node, str) or '${' not in _node:
-                try:
-                    return int(_node)
-                except (ValueError, TypeError):
-                    if isinstance(_node, str):
-                        try:
-                            if _node.startswith('"') and _node.endswith('"'):
-                                return _node.strip('"')
-                        except (ValueError, AttributeError):
-                            pass
-                    return _node
-
-            # Parse templated string using action_resolver
-            parsed, status = self.action_resolver.compile(_node, self._vars, self._context)
-            if status != 0:
-                raise ConfigurationError(f"Unparseable node: {_node}")
-
-            # Strip quotes if present
-            if isinstance(parsed, str) and parsed.startswith('"') and parsed.endswith('"'):
-                return parsed.strip('"')
-            return parsed
-
-        track_devices = list(track.devices)
-        current_search_obj = track_devices
-
-        for i, node in enumerate(chain_map):
-            is_device = i % 2 == 0
-            node = parse_templated_node(node)
-
-            if i == 0:
-                # First node is always a device
-                if isinstance(node, int):
-                    current_search_obj = track_devices[node - 1]
-                else:
-                    found = False
-                    for device in track_devices:
-                        if device.name == node:
-                            current_search_obj = device
-                            found = True
-                            break
-                    if not found:
-                        raise ConfigurationError(f"No device called: {node}")
-            elif is_device:
-                # Looking for a device in the current chain
-                if isinstance(node, int):
-                    current_search_obj = list(current_search_obj.devices)[node - 1]
-                else:
-                    found = False
-                    for device in current_search_obj.devices:
-                        if device.name == node:
-                            current_search_obj = device
-                            found = True
-                            break
-                    if not found:
-                        raise ConfigurationError(f'No device in {current_search_obj.name} called {node}')
-            else:
-                # Looking for a chain in the current device
-                if isinstance(node, int) and hasattr(current_search_obj, "chains"):
-                    current_search_obj = list(current_search_obj.chains)[node - 1]
-                else:
-                    found = False
-                    if hasattr(current_search_obj, "chains"):
-                        for chain in current_search_obj.chains:
-                            if chain.name == node:
-                                current_search_obj = chain
-                                found = True
-                                break
-                    if not found:
-                        raise ConfigurationError(f'No chain in {current_search_obj.name} called {node}')
-
-        return current_search_obj
-
     def _on_element_value(self, value):
         if self._undo_step_timer.is_running:
             self._undo_step_timer._reset_timer()
@@ -805,46 +493,10 @@ class ZEncoder(EventObject):
     def refresh_feedback(self):
         return
 
-    @listens("selected_track")
-    def selected_track_listener(self):
-        self.bind_to_active()
-
-    @listens("selected_parameter")
-    def selected_parameter_listener(self):
-        self.bind_to_active()
-
-    @listens("selected_chain")
-    def selected_chain_listener(self, _):
-        self.bind_to_active()
-
-    @listens("selected_device")
-    def selected_device_listener(self, _):
-        self.bind_to_active()
-
-    @listens("devices")
-    def device_list_listener(self):
-        self.debug("device_list_listener")
-        self.bind_to_active()
-
-    @listens("tracks")
-    def track_list_listener(self):
-        self.bind_to_active()
-
-    @listens("chains")
-    def chain_list_listener(self):
-        self.bind_to_active()
-
-    @listens("parameters")
-    def parameter_list_listener(self):
-        self.bind_to_active()
-
-    @listens("return_tracks")
-    def return_list_listener(self):
-        self.bind_to_active()
-
-    @listens("offsets")
-    def session_ring_track_listener(self):
-        self.bind_to_active()
+    def disconnect(self):
+        self.mode_manager.unsubscribe_from_modes(self)
+        self.binding_engine.unsubscribe(self)
+        super().disconnect()
 
 
 class UndoStepTask(TimerTask):
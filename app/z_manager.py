@@ -1,10 +1,10 @@
-from copy import deepcopy, copy
-from copy import deepcopy, copy
+from copy import copy
 from typing import Optional
 
 from ableton.v3.control_surface.controls import control_matrix
 from .z_controls import ParamControl, KeyboardControl, OverlayControl
 
+from .config_merge import merge_configs as merge_config_trees, thaw, without_keys
 from .control_classes import get_subclass as get_control_class
 from .errors import ConfigurationError, CriticalConfigurationError
 from .hardware_interface import HardwareInterface
@@ -12,7 +12,6 @@ from .pad_section import PadSection
 from .z_control import ZControl
 from .z_state import ZState
 from .zcx_component import ZCXComponent
-from .encoder_manager import SelectedDeviceWatcher
 
 
 class ZManager(ZCXComponent):
@@ -61,6 +60,10 @@ class ZManager(ZCXComponent):
         self.load_control_templates()
 
         ZControl.task_group = self.canonical_parent._task_group
+        ZControl.scheduler = self.canonical_parent.component_map["Scheduler"]
+        ZControl.gesture_tracer = self.canonical_parent.component_map["GestureTracer"]
+        ZControl.action_resolver = self.canonical_parent.component_map["ActionResolver"]
+        ParamControl.binding_engine = self.canonical_parent.component_map["BindingEngine"]
         z_controls.page_manager = self.canonical_parent.component_map["PageManager"]
         z_controls.action_resolver = self.canonical_parent.component_map[
             "ActionResolver"
@@ -151,17 +154,24 @@ class ZManager(ZCXComponent):
 
         matrix_state: control_matrix = self.__hardware_interface.button_matrix_state
 
-        try:
-            raw_section_config = self.yaml_loader.load_yaml(
-            f"{self._config_dir}/matrix_sections/{pad_section.name}.yaml"
-            )
-        except FileNotFoundError:
-            if pad_section._raw_template:
-                raw_section_config = {}
-            else:
-                raise CriticalConfigurationError(f"section `{pad_section.name}` referenced in `matrix_sections.yaml` without corresponding file `matrix_sections/{pad_section.name}.yaml`")
+        cache_key = f"matrix_sections/{pad_section.name}"
+        flat_config = self.yaml_loader.get_compiled(self._config_dir, cache_key)
+
+        if flat_config is None:
+            try:
+                raw_section_config = self.yaml_loader.load_yaml(
+                f"{self._config_dir}/matrix_sections/{pad_section.name}.yaml"
+                )
+            except FileNotFoundError:
+                if pad_section._raw_template:
+                    raw_section_config = {}
+                else:
+                    raise CriticalConfigurationError(f"section `{pad_section.name}` referenced in `matrix_sections.yaml` without corresponding file `matrix_sections/{pad_section.name}.yaml`")
+
+            with self.yaml_loader.recording_warnings() as warnings:
+                flat_config = self.flatten_section_config(pad_section, raw_section_config)
+            self.yaml_loader.put_compiled(self._config_dir, cache_key, flat_config, warnings)
 
-        flat_config = self.flatten_section_config(pad_section, raw_section_config)
         context_config = self.apply_section_context(pad_section, flat_config)
 
         try:
@@ -245,39 +255,14 @@ class ZManager(ZCXComponent):
 
         try:
             def merge_configs(base, override):
-                """Deep merge two configurations, ensuring override values take precedence."""
-                if not isinstance(override, dict):
-                    return override
-                if not isinstance(base, dict):
-                    return override
-                merged = deepcopy(base)
-                for key, value in override.items():
-                    if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-                        if key == "color":
-
-                            base_color_def = merged["color"]
-                            override_color_def = value
-
-                            try:
-                                if list(base_color_def.keys())[0] == list(override_color_def.keys())[0]:
-                                    merged["color"] = base_color_def | override_color_def
-                                else:
-                                    merged["color"] = override_color_def
-                            except IndexError:
-                                merged["color"] = override_color_def
-
-                        else:
-                            merged[key] = merge_configs(merged[key], value)
-                    else:
-                        merged[key] = deepcopy(value)
-                return merged
+                return merge_config_trees(base, override, merge_color=True)
 
             def apply_global_template(config):
                 """Apply global template to config if not ignored."""
                 if not ignore_global_template:
                     if not isinstance(config, dict):
                         return config
-                    return merge_configs(deepcopy(global_template), config)
+                    return merge_configs(global_template, config)
                 return config
 
             def apply_control_templates(config):
@@ -285,7 +270,8 @@ class ZManager(ZCXComponent):
                 if "template" not in config:
                     return config, False
 
-                template_value = config.pop("template")
+                template_value = config["template"]
+                config = without_keys(config, "template")
                 skip_global = False
                 result_config = {}
 
@@ -302,7 +288,7 @@ class ZManager(ZCXComponent):
                             f"Config error in {section_obj.name}: "
                             f'Specified non-existent template "{template_value}"'
                         )
-                    result_config = deepcopy(template)
+                    result_config = template
                 elif isinstance(template_value, list):
                     # List of templates - apply in order (left to right)
                     result_config = {}
@@ -321,7 +307,7 @@ class ZManager(ZCXComponent):
                                     f"Config error in {section_obj.name}: "
                                     f'Specified non-existent template "{template_name}"'
                                 )
-                            result_config = merge_configs(result_config, deepcopy(template))
+                            result_config = merge_configs(result_config, template)
                 else:
                     raise ValueError(
                         f"Config error in {section_obj.name}: "
@@ -371,13 +357,13 @@ class ZManager(ZCXComponent):
                     for i in range(len(section_obj.owned_coordinates)):
                         override = pad_overrides[i] if i < len(pad_overrides) else None
                         if override is None:
-                            raw_config.append(deepcopy(group_template))
+                            raw_config.append(group_template)
                         else:
-                            merged = merge_configs(deepcopy(group_template), override)
+                            merged = merge_configs(group_template, override)
                             raw_config.append(merged)
 
             for i, item in enumerate(raw_config):
-                config = deepcopy(item)
+                config = item
 
                 if config is None:
                     config = {}
@@ -404,6 +390,7 @@ class ZManager(ZCXComponent):
                     else:
                         final_config = config
 
+                    final_config = thaw(final_config)
                     final_config["group_context"] = {
                         "group_name": None,
                         "group_index": None,
@@ -447,10 +434,7 @@ class ZManager(ZCXComponent):
                     )
 
                 # Create base group config with correct template inheritance
-                group_config = deepcopy(config)
-                del group_config["pad_group"]
-                if "controls" in group_config:
-                    del group_config["controls"]
+                group_config = without_keys(config, "pad_group", "controls")
 
                 # Apply templates
                 skip_global = False
@@ -468,11 +452,10 @@ class ZManager(ZCXComponent):
                 for j, pad_config in enumerate(group_pads):
                     if pad_config is None:
                         # Use group config directly if no pad override
-                        member_config = deepcopy(group_config)
+                        member_config = group_config
                     else:
                         # Start with group config
-                        member_config = deepcopy(group_config)
-                        pad_config = deepcopy(pad_config)
+                        member_config = group_config
 
                         # Apply pad-specific template if it exists
                         skip_pad_global = False
@@ -490,6 +473,7 @@ class ZManager(ZCXComponent):
                             # Just merge the pad's config
                             member_config = merge_configs(member_config, pad_config)
 
+                    member_config = thaw(member_config)
                     member_config["group_context"] = {
                         "group_name": group_name,
                         "group_index": j,
@@ -516,7 +500,7 @@ class ZManager(ZCXComponent):
                 }
             }
             for i in range(num_missing):
-                flat_config.append(dummy_control)
+                flat_config.append(thaw(dummy_control))
 
             self.warning(
                 f"{num_missing} controls missing from {section_obj.name}.yaml — dummy controls have been added.")
@@ -554,7 +538,7 @@ class ZManager(ZCXComponent):
                 y_flip = global_y_flip - section_obj._PadSection__bounds["min_y"] * -1
                 X_flip = x_flip + 1
                 Y_flip = y_flip + 1
-                item_context = deepcopy(common_context)
+                item_context = dict(common_context)
                 section_context = {
                     "name": section_obj.name,
                     "width": section_width,
@@ -600,11 +584,15 @@ class ZManager(ZCXComponent):
         else:
             this_file = f"named_controls.yaml"
             path = this_file
-        raw_config = self.yaml_loader.load_yaml(
-            f"{self._config_dir}/{path}"
-        )
+        parsed_config = self.yaml_loader.get_compiled(self._config_dir, path)
 
-        parsed_config = self.parse_named_button_config(pad_section, raw_config, False, this_file)
+        if parsed_config is None:
+            raw_config = self.yaml_loader.load_yaml(
+                f"{self._config_dir}/{path}"
+            )
+            with self.yaml_loader.recording_warnings() as warnings:
+                parsed_config = self.parse_named_button_config(pad_section, raw_config, False, this_file)
+            self.yaml_loader.put_compiled(self._config_dir, path, parsed_config, warnings)
 
         hardware = self.__hardware_interface
 
@@ -662,26 +650,14 @@ class ZManager(ZCXComponent):
             global_template = self.__global_control_template
             control_templates = self.__control_templates
 
-            def merge_configs(base, override):
-                """Deep merge two configurations, ensuring override values take precedence"""
-                if not isinstance(override, dict):
-                    return override
-                if not isinstance(base, dict):
-                    return override
-                merged = deepcopy(base)
-                for key, value in override.items():
-                    if key in merged and isinstance(merged[key], dict) and isinstance(value, dict):
-                        merged[key] = merge_configs(merged[key], value)
-                    else:
-                        merged[key] = deepcopy(value)
-                return merged
+            merge_configs = merge_config_trees
 
             def apply_global_template(config):
                 """Apply global template to config if not ignored"""
                 if not ignore_global_template:
                     if not isinstance(config, dict):
                         return config
-                    return merge_configs(deepcopy(global_template), config)
+                    return merge_configs(global_template, config)
                 return config
 
             def apply_control_templates(config):
@@ -689,7 +665,8 @@ class ZManager(ZCXComponent):
                 if "template" not in config:
                     return config, False
 
-                template_value = config.pop("template")
+                template_value = config["template"]
+                config = without_keys(config, "template")
                 skip_global = False
                 result_config = {}
 
@@ -705,7 +682,7 @@ class ZManager(ZCXComponent):
                         raise ValueError(
                             f'Specified non-existent template "{template_value}" in "{this_file}"'
                         )
-                    result_config = deepcopy(template)
+                    result_config = template
                 elif isinstance(template_value, list):
                     # List of templates - apply in order (left to right)
                     result_config = {}
@@ -723,7 +700,7 @@ class ZManager(ZCXComponent):
                                 raise ValueError(
                                     f'Specified non-existent template "{template_name}" in "{this_file}"'
                                 )
-                            result_config = merge_configs(result_config, deepcopy(template))
+                            result_config = merge_configs(result_config, template)
                 else:
                     raise ValueError(
                         f'Invalid template value "{template_value}" in "{this_file}"'
@@ -738,7 +715,7 @@ class ZManager(ZCXComponent):
             for button_name, button_def in ungrouped_buttons.items():
                 working_control_name = button_name
                 working_control_def = button_def
-                config = deepcopy(button_def)
+                config = button_def
                 if config is None:
                     config = {}
 
@@ -751,11 +728,11 @@ class ZManager(ZCXComponent):
                 if not skip_global:
                     config = apply_global_template(config)
 
-                processed_ungrouped[button_name] = config
+                processed_ungrouped[button_name] = thaw(config)
 
             # Process grouped buttons
             for group_name, group_def in groups.items():
-                group_config = deepcopy(group_def)
+                group_config = group_def
 
                 # Apply templates to the group config
                 skip_global = False
@@ -769,11 +746,11 @@ class ZManager(ZCXComponent):
                 processed_sub_buttons = {}
 
                 for sub_button in group_config.get("includes", []):
-                    sub_button_config = deepcopy(group_config)
+                    sub_button_config = group_config
 
                     button_overrides = group_config.get("controls", {})
                     if button_overrides and sub_button in button_overrides:
-                        override_def = deepcopy(button_overrides[sub_button])
+                        override_def = button_overrides[sub_button]
 
                         # Check if the override has its own template
                         if "template" in override_def:
@@ -786,10 +763,7 @@ class ZManager(ZCXComponent):
                     else:
                         merged_def = sub_button_config
 
-                    for key in ["includes", "controls"]:
-                        merged_def.pop(key, None)
-
-                    processed_sub_buttons[sub_button] = merged_def
+                    processed_sub_buttons[sub_button] = thaw(without_keys(merged_def, "includes", "controls"))
 
                 cleaned_group_name = group_name[2:]
                 group_count = len(processed_sub_buttons.values())
@@ -864,27 +838,59 @@ class ZManager(ZCXComponent):
         Some controls rely on objects that are not ready when the control is created,
         so we iterate over every control and call necessary methods based on the control's class
         """
-        selected_device_watcher = SelectedDeviceWatcher(self, self._song)
-        ParamControl.selected_device_watcher = selected_device_watcher
         for control in self.__all_controls:
-            try:
-                if isinstance(control, ParamControl):
-                    control.bind_to_active()
-                    self._param_controls.append(control)
-                if isinstance(control, KeyboardControl):
-                    control.finish_setup()
-                if isinstance(control, OverlayControl):
-                    control.finish_setup()
-            except Exception as e:
-                from . import STRICT_MODE
-                msg = f"Error finishing control setup in section `{control.parent_section.name}` control `{control.name}`"
-                if STRICT_MODE:
-                    self.critical(msg)
-                    self.critical(e)
-                    raise e
-                else:
-                    self.error(msg)
-                    self.error(e)
+            self.finish_control_setup(control)
+
+    def finish_control_setup(self, control: ZControl):
+        try:
+            if isinstance(control, ParamControl):
+                control.bind_to_active()
+                self._param_controls.append(control)
+            if isinstance(control, KeyboardControl):
+                control.finish_setup()
+            if isinstance(control, OverlayControl):
+                control.finish_setup()
+        except Exception as e:
+            from . import STRICT_MODE
+            msg = f"Error finishing control setup in section `{control.parent_section.name}` control `{control.name}`"
+            if STRICT_MODE:
+                self.critical(msg)
+                self.critical(e)
+                raise e
+            else:
+                self.error(msg)
+                self.error(e)
+
+    def rebuild_pad_section(self, section_name) -> "list[ZControl]":
+        """Replaces the controls of a single matrix section with ones built from its current config.
+        Returns the controls that were torn down."""
+        pad_section = self.__matrix_sections[section_name]
+        old_controls = pad_section.unregister_owned_controls()
+        self.__forget_controls(old_controls)
+
+        self.process_pad_section(pad_section)
+        for control in pad_section.owned_controls:
+            self.finish_control_setup(control)
+
+        return old_controls
+
+    def __forget_controls(self, controls: "list[ZControl]"):
+        stale = set(controls)
+        for control in controls:
+            control.unbind_from_state()
+            control.disconnect()
+
+        self.__all_controls = [c for c in self.__all_controls if c not in stale]
+        self._param_controls = [c for c in self._param_controls if c not in stale]
+        self.__control_aliases = {
+            alias: c for alias, c in self.__control_aliases.items() if c not in stale
+        }
+        for group_name, group in list(self.__control_groups.items()):
+            remaining = [c for c in group if c not in stale]
+            if remaining:
+                self.__control_groups[group_name] = remaining
+            else:
+                del self.__control_groups[group_name]
 
     def load_overlay_definitions(self):
 
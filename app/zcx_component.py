@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 from ableton.v2.base.event import EventObject
 from ableton.v3.control_surface import Component, ControlSurface
 
+from .log_queue import LOG_LEVELS
 from .zcx_core import ZCXCore
 
 
@@ -44,6 +45,8 @@ class ZCXComponent(Component, EventObject):
         self.debug(f'{self.name} created')
 
     def log(self, *msg, level='info'):
+        if not self._logger.isEnabledFor(LOG_LEVELS[level]):
+            return
         method = getattr(self._logger, level)
         for m in msg:
             method(m)
@@ -1,4 +1,5 @@
 import logging
+import os
 from functools import partial
 import traceback
 from typing import TYPE_CHECKING
@@ -17,9 +18,13 @@ from .template_manager import TemplateManager
 from .session_ring import SessionRing
 from .consts import REQUIRED_LIVE_VERSION
 from .errors import ZcxStartupError, ConfigurationError
+from .log_queue import LOG_LEVELS
 
 root_cs = None
 
+# files outside the config dir whose changes always require a full hot reload
+RELOAD_DEPENDENCIES = ('zcx.yaml', 'hardware/specs.yaml', '_global_preferences.yaml')
+
 
 class ZCXCore(ControlSurface):
 
@@ -60,6 +65,10 @@ class ZCXCore(ControlSurface):
                 initial_hw_mode = user_prefs.get('initial_hw_mode', 'zcx')
                 self.__initial_hw_mode = initial_hw_mode
 
+                from .yaml_loader import yaml_loader
+                yaml_loader.begin_load_cycle(user_prefs.get('config_cache', True))
+                self.__config_digests = None
+
                 self.template_manager = TemplateManager(self)
 
                 from . import plugin_loader
@@ -91,7 +100,6 @@ class ZCXCore(ControlSurface):
                         self._do_send_midi(USER_MODE)
                 self.application.add_control_surfaces_listener(self.song_ready)
 
-                from .yaml_loader import yaml_loader
                 zcx_yaml = yaml_loader.load_yaml('zcx.yaml')
                 self.debug(zcx_yaml)
                 version = zcx_yaml.get('version')
@@ -192,6 +200,8 @@ class ZCXCore(ControlSurface):
         return self.__version
 
     def log(self, *msg, level='info'):
+        if not self._logger.isEnabledFor(LOG_LEVELS[level]):
+            return
         method = getattr(self._logger, level)
         for m in msg:
             method(m)
@@ -207,12 +217,16 @@ class ZCXCore(ControlSurface):
         try:
             global root_cs
             root_cs = self
+            self.component_map['Scheduler'].setup()
+            self.component_map['GestureTracer'].setup()
             self.debug(f'starting HardwareInterface setup')
             self.component_map['HardwareInterface'].setup()
             self.debug(f'finished HardwareInterface setup')
             self.debug(f'starting CxpBridge setup')
             self.component_map['CxpBridge'].setup()
             self.debug(f'finished CxpBridge setup')
+            self.component_map['OscOutput'].setup()
+            self.component_map['BindingEngine'].setup()
             self.debug(f'starting ActionResolver setup')
             self.component_map['ActionResolver'].setup()
             self.debug(f'finished ActionResolver setup')
@@ -285,20 +299,46 @@ class ZCXCore(ControlSurface):
             self.critical(e)
             raise
 
+        from .yaml_loader import yaml_loader
+        yaml_loader.save_cache()
+        self.__config_digests = yaml_loader.get_file_digests(self.preference_manager.config_dir, RELOAD_DEPENDENCIES)
+
         self.component_map['HardwareInterface'].refresh_all_lights()
 
     def build_midi_map(self, midi_map_handle):
         super().build_midi_map(midi_map_handle)
         if not self._doing_note_translations:
+            self.component_map["MelodicComponent"].invalidate_translations()
             self.component_map["MelodicComponent"].update_translation()
 
-    def hot_reload(self):
+    def hot_reload(self, full=False):
+        from . import PREF_MANAGER
+        from .colors import clear_color_cache
+        from .yaml_loader import yaml_loader
+
+        clear_color_cache()
+
+        if not full:
+            try:
+                previous_config_dir = PREF_MANAGER.config_dir
+                PREF_MANAGER.setup()
+                yaml_loader.begin_load_cycle(PREF_MANAGER.user_prefs.get('config_cache', True))
+                if PREF_MANAGER.config_dir == previous_config_dir and self.__incremental_reload():
+                    return
+            except Exception as e:
+                self.critical(traceback.format_exception(e))
+                self.critical("Incremental reload failed, doing full hot reload.")
+
         try:
             self.log("doing hot reload")
             self.log("unloading components")
-            from . import PREF_MANAGER
             PREF_MANAGER.setup()
+            yaml_loader.begin_load_cycle(PREF_MANAGER.user_prefs.get('config_cache', True))
             self.template_manager = TemplateManager(self)
+            self.component_map["Scheduler"]._unload()
+            self.component_map["BindingEngine"]._unload()
+            self.component_map["OscOutput"]._unload()
+            self.component_map["GestureTracer"]._unload()
             self.component_map["HardwareInterface"]._unload()
             self.component_map["ModeManager"]._unload()
             self.component_map["PageManager"]._unload()
@@ -320,6 +360,65 @@ class ZCXCore(ControlSurface):
             self.critical("Hot reload failed. You should perform a full reload.")
             self.show_message("Hot reload failed. You should perform a full reload.")
 
+    def __incremental_reload(self) -> bool:
+        """Rebuilds only the matrix sections and encoders whose files have changed since the last load.
+        Returns False if nothing or any other file has changed, in which case nothing is touched."""
+        from .yaml_loader import yaml_loader
+
+        if self.__config_digests is None:
+            return False
+
+        config_dir = self.preference_manager.config_dir
+        digests = yaml_loader.get_file_digests(config_dir, RELOAD_DEPENDENCIES)
+        changed = [
+            path for path in self.__config_digests.keys() | digests.keys()
+            if self.__config_digests.get(path) != digests.get(path)
+        ]
+
+        if not changed:
+            # a reload is also how users reset pages, modes and controls, so only a full reload will do
+            self.log("no config files changed, doing full hot reload")
+            return False
+
+        z_manager = self.component_map['ZManager']
+        matrix_sections = z_manager.all_matrix_sections
+        sections_dir = os.path.join(config_dir, 'matrix_sections')
+        encoders_path = os.path.join(config_dir, 'encoders.yaml')
+
+        changed_sections = []
+        encoders_changed = False
+
+        for path in changed:
+            if path == encoders_path:
+                encoders_changed = True
+            elif os.path.dirname(path) == sections_dir:
+                section_name = os.path.basename(path)[:-len('.yaml')]
+                if section_name in matrix_sections:
+                    changed_sections.append(section_name)
+            else:
+                self.debug(f'`{path}` changed, incremental reload not possible')
+                return False
+
+        self.log(f"doing incremental hot reload: {changed_sections or 'no'} sections, "
+                 f"{'with' if encoders_changed else 'no'} encoders")
+
+        stale_controls = []
+        for section_name in changed_sections:
+            stale_controls.extend(z_manager.rebuild_pad_section(section_name))
+
+        if encoders_changed:
+            self.component_map['EncoderManager'].reload()
+
+        view_manager = self.component_map['ViewManager']
+        view_manager.forget_controls(stale_controls)
+        view_manager._update_in_view_controls()
+
+        yaml_loader.save_cache()
+        self.__config_digests = digests
+        self.refresh_required()
+        self.log("hot reload complete")
+        return True
+
     def song_ready(self):
         if self.application.control_surfaces_has_listener(self.song_ready):
             self.application.remove_control_surfaces_listener(self.song_ready)
@@ -364,10 +463,11 @@ class ZCXCore(ControlSurface):
             self.invoke_all_plugins('receive_sysex', midi_bytes=sysex_message)
 
     def refresh_all_lights(self):
-        self.component_map['HardwareInterface'].refresh_all_lights()
-        self.invoke_all_plugins('refresh_feedback')
-        self.component_map["MelodicComponent"].update_translation()
-        self.component_map["MelodicComponent"].refresh_all_feedback()
+        with self.component_map['HardwareInterface'].led_frame:
+            self.component_map['HardwareInterface'].refresh_all_lights()
+            self.invoke_all_plugins('refresh_feedback')
+            self.component_map["MelodicComponent"].update_translation()
+            self.component_map["MelodicComponent"].refresh_all_feedback(force=True)
 
     def show_popup(self, message):
         self.application.show_on_the_fly_message(message)
@@ -397,6 +497,8 @@ class ZCXCore(ControlSurface):
         self.log("disconnecting")
         self.invoke_all_plugins("_on_disconnect")
         super().disconnect()
+        for handler in self._logger.handlers:
+            handler.flush()
 
 class RefreshLightsTask(TimerTask):
 
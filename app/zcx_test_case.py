@@ -4,11 +4,14 @@ from typing import Any, TYPE_CHECKING, TypedDict, Iterable
 if TYPE_CHECKING:
     from action_resolver import ActionResolver
     from api_manager import ApiManager, ZcxApi
+    from binding_engine import BindingEngine
     from cxp_bridge import CxpBridge
     from encoder_element import EncoderElement
+    from gesture_tracer import GestureTracer
     from hardware_interface import HardwareInterface
     from encoder_state import EncoderState
     from mode_manager import ModeManager
+    from osc_output import OscOutput
     from pad_section import PadSection
     from page_manager import PageManager
     from plugin_loader import PluginLoader
@@ -38,10 +41,13 @@ class ZCXTestCase(unittest.TestCase):
     def setUpClass(cls) -> None:
         cls._action_resolver: "ActionResolver" = cls.zcx.component_map["ActionResolver"]
         cls._api_manager: "ApiManager" = cls.zcx.component_map["ApiManager"]
+        cls._binding_engine: "BindingEngine" = cls.zcx.component_map["BindingEngine"]
         cls._cxp_bridge: "CxpBridge" = cls.zcx.component_map["CxpBridge"]
         cls._encoder_manager: "EncoderManager" = cls.zcx.component_map["EncoderManager"]
+        cls._gesture_tracer: "GestureTracer" = cls.zcx.component_map["GestureTracer"]
         cls._hardware_interface: "HardwareInterface" = cls.zcx.component_map["HardwareInterface"]
         cls._mode_manager: "ModeManager" = cls.zcx.component_map["ModeManager"]
+        cls._osc_output: "OscOutput" = cls.zcx.component_map["OscOutput"]
         cls._page_manager: "PageManager" = cls.zcx.component_map["PageManager"]
         cls._session_ring: "SessionRing" = cls.zcx._session_ring_custom
         cls._session_view: "SessionView" = cls.zcx.component_map["SessionView"]
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""Benchmarks zcx against the headless Live stand-in (see tools/headless).
+
+For each hardware folder's demo_config, measures:
+
+- startup: time spent importing zcx, in `create_instance` (and `post_init` within it) and in `song_ready`,
+  for a cold boot and for a warm boot that can use the config cache
+- gestures: time from an incoming MIDI message to `CxpBridge.trigger_action_list`, for every pad and
+  named button on every page, plus the total time taken to handle each message
+- page_change: time taken to change to each page, and the LED messages sent doing so
+- mode_change: time taken to switch each mode on and off, and the number of objects notified
+- memory: bytes allocated while booting, per control
+
+Results are written as JSON, so runs can be compared across versions:
+
+    python benchmarks/run_benchmarks.py --output before.json
+    python benchmarks/run_benchmarks.py --output after.json --compare before.json
+"""
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT / 'tools' / 'headless'))
+
+from zcx_headless import HeadlessZcx, available_hardware  # noqa: E402
+
+RESULTS_VERSION = 1
+
+# (section, metric) pairs compared by --compare; lower is better for all of them
+COMPARED_METRICS = (
+    ('startup', 'cold_total_ms'),
+    ('startup', 'warm_total_ms'),
+    ('startup', 'post_init_ms'),
+    ('gestures', 'press_to_action_us.p50'),
+    ('gestures', 'press_to_action_us.p99'),
+    ('gestures', 'release_to_action_us.p50'),
+    ('gestures', 'input_handling_us.p50'),
+    ('gestures', 'input_handling_us.p99'),
+    ('page_change', 'per_change_us.p50'),
+    ('page_change', 'midi_per_change.mean'),
+    ('mode_change', 'per_change_us.p50'),
+    ('memory', 'bytes_per_control'),
+)
+
+
+def summarize(samples) -> dict:
+    """Percentiles of `samples`, by nearest rank."""
+    if not samples:
+        return {'count': 0}
+    ordered = sorted(samples)
+
+    def rank(p):
+        return ordered[min(len(ordered) - 1, max(0, round(p / 100 * len(ordered)) - 1))]
+
+    return {
+        'count': len(ordered),
+        'mean': round(statistics.fmean(ordered), 2),
+        'p50': round(rank(50), 2),
+        'p90': round(rank(90), 2),
+        'p99': round(rank(99), 2),
+        'max': round(ordered[-1], 2),
+    }
+
+
+def boot(hardware, config_path=None, workdir=None, **k) -> HeadlessZcx:
+    return HeadlessZcx(hardware, config_path=config_path, workdir=workdir, **k).boot()
+
+
+def bench_startup(hardware, config_path, runs) -> dict:
+    cold = []
+    warm = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory(prefix='zcx_bench_') as workdir:
+            for timings in (cold, warm):
+                zcx = boot(hardware, config_path, workdir)
+                timings.append(dict(zcx.timings))
+                zcx.shutdown()
+
+    def median_ms(timings, phase):
+        return round(statistics.median(t[phase] for t in timings) * 1000, 3)
+
+    def total_ms(timings):
+        return round(statistics.median(
+            t['import'] + t['create_instance'] + t['song_ready'] for t in timings
+        ) * 1000, 3)
+
+    return {
+        'runs': runs,
+        'cold_total_ms': total_ms(cold),
+        'warm_total_ms': total_ms(warm),
+        'import_ms': median_ms(cold, 'import'),
+        'create_instance_ms': median_ms(cold, 'create_instance'),
+        'post_init_ms': median_ms(cold, 'post_init'),
+        'song_ready_ms': median_ms(cold, 'song_ready'),
+        'warm_post_init_ms': median_ms(warm, 'post_init'),
+    }
+
+
+def _input_targets(zcx) -> list:
+    elements = zcx.elements
+    matrix = elements.button_matrix
+    targets = [(row, column) for row in range(matrix.height()) for column in range(matrix.width())]
+    targets.extend(sorted(elements.named_buttons))
+    return targets
+
+
+def _restore_state(zcx, page):
+    mode_manager = zcx.component_map['ModeManager']
+    for mode in mode_manager.active_modes:
+        mode_manager.remove_mode(mode)
+    page_manager = zcx.component_map['PageManager']
+    if page_manager.current_page != page:
+        page_manager.set_page(page_number=page)
+
+
+def _timed_send(zcx, target, value, recorder) -> tuple:
+    """Sends one message; returns (handling time, time until the first action list or None), in µs."""
+    first_action = len(recorder.timestamps)
+    start = time.perf_counter()
+    zcx.send_value(target, value)
+    handled = time.perf_counter()
+    to_action = None
+    if len(recorder.timestamps) > first_action:
+        to_action = (recorder.timestamps[first_action] - start) * 1e6
+    return (handled - start) * 1e6, to_action
+
+
+def bench_gestures(zcx, repeats) -> dict:
+    from ableton.v3.control_surface.controls import DOUBLE_CLICK_DELAY
+
+    recorder = zcx.clyphx.clyphx_pro_component
+    page_manager = zcx.component_map['PageManager']
+    targets = _input_targets(zcx)
+    press_to_action = []
+    release_to_action = []
+    input_handling = []
+
+    for page in range(page_manager.page_count):
+        _restore_state(zcx, page)
+        for target in targets:
+            for _ in range(repeats):
+                handling, to_action = _timed_send(zcx, target, 127, recorder)
+                input_handling.append(handling)
+                if to_action is not None:
+                    press_to_action.append(to_action)
+                handling, to_action = _timed_send(zcx, target, 0, recorder)
+                input_handling.append(handling)
+                if to_action is not None:
+                    release_to_action.append(to_action)
+                # let the double click window lapse, so every press is a fresh one
+                zcx.advance(DOUBLE_CLICK_DELAY + zcx.step)
+                _restore_state(zcx, page)
+        zcx.clear_recordings()
+
+    return {
+        'targets': len(targets),
+        'pages': page_manager.page_count,
+        'press_to_action_us': summarize(press_to_action),
+        'release_to_action_us': summarize(release_to_action),
+        'input_handling_us': summarize(input_handling),
+    }
+
+
+def bench_page_change(zcx, repeats) -> dict:
+    page_manager = zcx.component_map['PageManager']
+    _restore_state(zcx, 0)
+    durations = []
+    midi_counts = []
+    per_page = {}
+    if page_manager.page_count > 1:
+        for _ in range(repeats):
+            for page in list(range(1, page_manager.page_count)) + [0]:
+                sent_before = zcx.c_instance.sent_midi_count
+                start = time.perf_counter()
+                page_manager.set_page(page_number=page)
+                duration = (time.perf_counter() - start) * 1e6
+                durations.append(duration)
+                midi_counts.append(zcx.c_instance.sent_midi_count - sent_before)
+                per_page.setdefault(page_manager.get_page_name_from_index(page), []).append(duration)
+    return {
+        'pages': page_manager.page_count,
+        'per_change_us': summarize(durations),
+        'midi_per_change': summarize(midi_counts),
+        'per_page_us': {name: summarize(samples)['p50'] for name, samples in per_page.items()},
+    }
+
+
+def bench_mode_change(zcx, repeats) -> dict:
+    mode_manager = zcx.component_map['ModeManager']
+    subscribers = mode_manager._ModeManager__mode_subscribers
+    _restore_state(zcx, 0)
+    durations = []
+    per_mode = {}
+    for mode in mode_manager.all_modes:
+        samples = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            mode_manager.add_mode(mode)
+            samples.append((time.perf_counter() - start) * 1e6)
+            start = time.perf_counter()
+            mode_manager.remove_mode(mode)
+            samples.append((time.perf_counter() - start) * 1e6)
+            _restore_state(zcx, 0)
+        durations.extend(samples)
+        per_mode[mode] = {
+            'subscribers': len(subscribers.get(mode, ())),
+            'p50_us': summarize(samples)['p50'],
+        }
+    return {
+        'modes': len(per_mode),
+        'per_change_us': summarize(durations),
+        'per_mode': per_mode,
+    }
+
+
+def bench_memory(hardware, config_path) -> dict:
+    with tempfile.TemporaryDirectory(prefix='zcx_bench_') as workdir:
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.take_snapshot()
+            zcx = boot(hardware, config_path, workdir)
+            snapshot = tracemalloc.take_snapshot()
+        finally:
+            tracemalloc.stop()
+        allocated = sum(stat.size_diff for stat in snapshot.compare_to(baseline, 'filename'))
+        controls = len(zcx.controls())
+        encoders = len(zcx.encoders())
+        zcx.shutdown()
+    return {
+        'allocated_bytes': allocated,
+        'controls': controls,
+        'encoders': encoders,
+        'bytes_per_control': round(allocated / max(1, controls + encoders)),
+    }
+
+
+def bench_hardware(hardware, args) -> dict:
+    config_path = args.config
+    result = {'startup': bench_startup(hardware, config_path, args.startup_runs)}
+    with tempfile.TemporaryDirectory(prefix='zcx_bench_') as workdir:
+        zcx = boot(hardware, config_path, workdir)
+        try:
+            result['controls'] = len(zcx.controls())
+            result['encoders'] = len(zcx.encoders())
+            result['gestures'] = bench_gestures(zcx, args.repeats)
+            result['page_change'] = bench_page_change(zcx, args.repeats)
+            result['mode_change'] = bench_mode_change(zcx, args.repeats)
+            result['warnings'] = zcx.warnings
+            result['errors'] = zcx.errors
+        finally:
+            zcx.shutdown()
+    if not args.skip_memory:
+        result['memory'] = bench_memory(hardware, config_path)
+    return result
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=PROJECT_ROOT, stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def lookup(section_result, metric):
+    value = section_result
+    for key in metric.split('.'):
+        if not isinstance(value, dict) or key not in value:
+            return None
+        value = value[key]
+    return value
+
+
+def compare(results, baseline, threshold) -> list:
+    """Lines describing each metric's change against `baseline`; regressions beyond `threshold` are flagged."""
+    lines = []
+    for hardware, result in results['hardware'].items():
+        baseline_result = baseline.get('hardware', {}).get(hardware)
+        if baseline_result is None:
+            continue
+        for section, metric in COMPARED_METRICS:
+            new = lookup(result.get(section, {}), metric)
+            old = lookup(baseline_result.get(section, {}), metric)
+            if not new or not old:
+                continue
+            change = (new - old) / old
+            flag = '  REGRESSION' if change > threshold else ''
+            lines.append(f'{hardware:<20} {section}.{metric:<28} {old:>12} -> {new:>12} ({change:+.1%}){flag}')
+    return lines
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark zcx against the headless Live stand-in.')
+    parser.add_argument('hardware', nargs='*', help='Hardware folders to benchmark, defaults to all of them')
+    parser.add_argument('--config', type=Path, help='Config folder to use instead of each demo_config')
+    parser.add_argument('--repeats', type=int, default=3, help='Repetitions of each gesture, page and mode change')
+    parser.add_argument('--startup-runs', type=int, default=3, help='Boots to take the median startup time of')
+    parser.add_argument('--skip-memory', action='store_true', help="Don't measure memory (it needs another boot)")
+    parser.add_argument('--output', type=Path, help='Write results here instead of stdout')
+    parser.add_argument('--compare', type=Path, help='Results of an earlier run to compare against')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='Relative slowdown reported as a regression by --compare')
+    parser.add_argument('--allow-errors', action='store_true',
+                        help="Don't exit with an error status when zcx logs an error")
+    args = parser.parse_args()
+
+    hardware_names = args.hardware or available_hardware()
+    results = {
+        'version': RESULTS_VERSION,
+        'meta': {
+            'revision': git_revision(),
+            'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'repeats': args.repeats,
+            'startup_runs': args.startup_runs,
+        },
+        'hardware': {},
+    }
+
+    failed = []
+    for hardware in hardware_names:
+        print(f'benchmarking {hardware}...', file=sys.stderr)
+        result = bench_hardware(hardware, args)
+        results['hardware'][hardware] = result
+        if result['errors']:
+            # an error can cut a code path short, making the timings meaningless
+            print(f'{hardware} logged {len(result["errors"])} errors, first: {result["errors"][0]}', file=sys.stderr)
+            failed.append(hardware)
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        args.output.write_text(output)
+    else:
+        print(output)
+
+    if args.compare:
+        lines = compare(results, json.loads(args.compare.read_text()), args.threshold)
+        print('\n'.join(lines), file=sys.stderr)
+        if any(line.endswith('REGRESSION') for line in lines):
+            sys.exit(1)
+
+    if failed and not args.allow_errors:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
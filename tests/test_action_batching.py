@@ -0,0 +1,47 @@
+from zcx_test_case import ZCXTestCase
+
+
+class TestActionBatching(ZCXTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.triggered = []
+        self._cxp_bridge.trigger_action_list = self.record_action_list
+        for mode in self._mode_manager.all_modes:
+            self._mode_manager.remove_mode(mode)
+
+    def tearDown(self):
+        del self._cxp_bridge.trigger_action_list
+        for mode in self._mode_manager.all_modes:
+            self._mode_manager.remove_mode(mode)
+
+    def record_action_list(self, action_list):
+        self.triggered.append((action_list, self._mode_manager.check_mode_state("shift")))
+
+    def test_consecutive_action_lists_are_joined(self):
+        with self._action_resolver.action_list_batch():
+            self._action_resolver.execute_command_bundle(None, ["DUMMY 1", {"cxp": "DUMMY 2;"}], {}, {})
+            self._action_resolver.execute_command_bundle(None, "DUMMY 3", {}, {})
+            self.assertEqual(self.triggered, [])
+        self.assertEqual(self.triggered, [("DUMMY 1; DUMMY 2; DUMMY 3", False)])
+
+    def test_other_commands_keep_their_order(self):
+        with self._action_resolver.action_list_batch():
+            self._action_resolver.execute_command_bundle(
+                None, ["DUMMY 1", "DUMMY 2", {"mode_on": "shift"}, "DUMMY 3"], {}, {}
+            )
+        self.assertEqual(self.triggered, [("DUMMY 1; DUMMY 2", False), ("DUMMY 3", True)])
+
+    def test_reload_inside_batch(self):
+        # stands in for a full hot reload, which sets the resolver up again
+        self.zcx.hot_reload = lambda full=False: self._action_resolver.setup()
+        try:
+            with self._action_resolver.action_list_batch():
+                self._action_resolver.execute_command_bundle(None, ["DUMMY 1", {"hot_reload": "full"}, "DUMMY 2"], {}, {})
+        finally:
+            del self.zcx.hot_reload
+        self.assertEqual(self.triggered, [("DUMMY 1", False), ("DUMMY 2", False)])
+
+        # the batch depth is back to zero, so action lists outside a batch are triggered straight away
+        self._action_resolver.execute_command_bundle(None, "DUMMY 3", {}, {})
+        self.assertEqual(self.triggered[-1], ("DUMMY 3", False))
@@ -1,3 +1,4 @@
+import sys
 import unittest
 from typing import TYPE_CHECKING
 from zcx_test_case import ZCXTestCase
@@ -81,3 +82,21 @@ class TestColors(ZCXTestCase):
         self.assertIsNotNone(lazy_blink_test)
         self.assertEqual(lazy_blink_test.color1.midi_value, green.midi_value)
         self.assertEqual(lazy_blink_test.color2.midi_value, 0)
+
+    def test_identical_colors_are_shared(self):
+        pulse_def = {"pulse": {"a": "green", "b": "red", "speed": 2}}
+        pulse_1 = self.zcx_api.create_color(pulse_def, None)
+        pulse_2 = self.zcx_api.create_color(dict(pulse_def), None)
+        self.assertIs(pulse_1, pulse_2)
+        self.assertIs(pulse_1.color1, self.zcx_api.create_color("green", None))
+        self.assertIsNot(pulse_1, self.zcx_api.create_color({"blink": {"a": "green", "b": "red", "speed": 2}}, None))
+
+    def test_animated_colors_are_shared_by_value(self):
+        colors = sys.modules[f"{type(self.zcx_api).__module__.rpartition('.')[0]}.colors"]
+        get_pulse, RgbColor = colors.get_pulse, colors.RgbColor
+        pulse = get_pulse(RgbColor(5), RgbColor(6), 2)
+        self.assertIs(get_pulse(RgbColor(5), RgbColor(6), 2), pulse)
+        self.assertIsNot(get_pulse(RgbColor(5), RgbColor(7), 2), pulse)
+        for i in range(colors.ANIMATED_COLOR_CACHE_SIZE * 2):
+            get_pulse(RgbColor(i % 128), object(), 2)
+        self.assertLessEqual(len(colors._animated_colors), colors.ANIMATED_COLOR_CACHE_SIZE)
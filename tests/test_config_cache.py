@@ -0,0 +1,53 @@
+import logging
+import os
+import tempfile
+
+from zcx_test_case import ZCXTestCase
+from config_cache import ConfigCache
+
+LOGGER_NAME = "zcx_config_cache_test"
+
+
+class TestConfigCache(ZCXTestCase):
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.base_dir = self.temp_dir.name
+        os.mkdir(os.path.join(self.base_dir, "_config"))
+        self.write("_config/encoders.yaml", "enc_1:\n  binding: SEL / VOL\n")
+        self.write("_global_preferences.yaml", "strict_mode: true\n")
+        self.logger = logging.getLogger(LOGGER_NAME).getChild("YamlLoader")
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write(self, path, content):
+        with open(os.path.join(self.base_dir, path), "w") as f:
+            f.write(content)
+
+    def new_cache(self) -> ConfigCache:
+        cache = ConfigCache(self.base_dir, self.logger)
+        cache.begin_load_cycle()
+        return cache
+
+    def test_warnings_are_replayed_on_hit(self):
+        cache = self.new_cache()
+        with cache.recording_warnings() as warnings:
+            logging.getLogger(f"{LOGGER_NAME}.EncoderManager").warning("enc_1 has no default binding")
+        cache.put_compiled("_config", "encoders", {"enc_1": {}}, warnings)
+        cache.save()
+
+        cache = self.new_cache()
+        with self.assertLogs(LOGGER_NAME, logging.WARNING) as logs:
+            self.assertEqual(cache.get_compiled("_config", "encoders"), {"enc_1": {}})
+        self.assertEqual(logs.records[0].name, f"{LOGGER_NAME}.EncoderManager")
+        self.assertEqual(logs.records[0].getMessage(), "enc_1 has no default binding")
+
+    def test_global_preferences_invalidate_compiled_configs(self):
+        cache = self.new_cache()
+        cache.put_compiled("_config", "encoders", {"enc_1": {}})
+        self.assertIsNotNone(cache.get_compiled("_config", "encoders"))
+
+        self.write("_global_preferences.yaml", "strict_mode: false\n")
+        cache.begin_load_cycle()
+        self.assertIsNone(cache.get_compiled("_config", "encoders"))
@@ -11,7 +11,33 @@ if TYPE_CHECKING:
 
 class TestStandardControls(ZCXTestCase):
 
-    pass
+    def test_led_frame_sends_last_feedback_once(self):
+        sent = []
+        self.zcx._send_midi = lambda midi_bytes, optimized=True: sent.append(midi_bytes) or True
+        try:
+            with self._hardware_interface.led_frame:
+                with self._hardware_interface.led_frame:
+                    self._hardware_interface.send_feedback((144, 60, 5))
+                self._hardware_interface.send_feedback((144, 60, 9))
+                self._hardware_interface.send_feedback((144, 61, 9))
+                self.assertEqual(sent, [])
+            self.assertEqual(sent, [(144, 60, 9), (144, 61, 9)])
+        finally:
+            del self.zcx._send_midi
+
+    def test_scheduler_replaces_and_cancels(self):
+        scheduler = self.zcx.component_map["Scheduler"]
+        calls = []
+        callback = lambda: calls.append(True)
+        try:
+            scheduler.schedule(callback, 10)
+            scheduler.schedule(callback, 20)
+            self.assertTrue(scheduler.is_scheduled(callback))
+            scheduler.cancel(callback)
+            self.assertFalse(scheduler.is_scheduled(callback))
+            self.assertEqual(calls, [])
+        finally:
+            scheduler.cancel(callback)
 
 class TestPageControls(ZCXTestCase):
 
@@ -14,6 +14,7 @@ class TestEncoders(ZCXTestCase):
             self._mode_manager.remove_mode(mode)
         self._session_ring.go_to_scene(0)
         self._session_ring.go_to_track(0)
+        self._binding_engine.flush()
 
     def test_encoder_simple(self):
         enc: "ZEncoder" = self._encoder_manager.get_encoder("enc_master")
@@ -135,3 +136,54 @@ class TestEncoders(ZCXTestCase):
         self._mode_manager.remove_mode("shift")
         self.assertIsNone(encoder.mapped_parameter)
 
+
+    def test_named_target_resolves_from_index(self):
+        enc: "ZEncoder" = self._encoder_manager.get_encoder("enc_master")
+        track = next((track for track in self.song.tracks if len(track.devices) > 0), None)
+        if track is None:
+            self.skipTest("No track with a device in this set")
+        device = list(track.devices)[0]
+
+        try:
+            enc.bind_ad_hoc(f'"{track.name}" / DEV("{device.name}") P1')
+            self.assertEqual(enc._mapped_parameter, device.parameters[1])
+
+            enc.bind_ad_hoc(f'"{track.name}" / DEV(1) P1')
+            self.assertEqual(enc._mapped_parameter, device.parameters[1])
+
+            self.assertEqual(enc.binding_engine.get_track(track.name), track)
+            self.assertEqual(enc.binding_engine.get_device(track, device.name), device)
+        finally:
+            enc.refresh_binding()
+
+    def test_selection_storm_is_coalesced(self):
+        enc: "ZEncoder" = self._encoder_manager.get_encoder("enc_master")
+        tracks = list(self.song.tracks)
+        if len(tracks) < 2:
+            self.skipTest("Set needs at least two tracks")
+        if self._binding_engine.rebind_window == 0:
+            self.skipTest("Rebinding is not coalesced with `rebind_window: 0`")
+        original_track = self.song.view.selected_track
+
+        try:
+            self.song.view.selected_track = tracks[0]
+            enc.bind_ad_hoc("SEL / VOL")
+            self._binding_engine.flush()
+
+            # a single change rebinds straight away
+            self.song.view.selected_track = tracks[1]
+            self.assertEqual(enc._mapped_parameter, tracks[1].mixer_device.volume)
+
+            # further changes inside the window only count once it closes
+            self.song.view.selected_track = tracks[0]
+            self.song.view.selected_track = tracks[1]
+            self.song.view.selected_track = tracks[0]
+            self.assertEqual(enc._mapped_parameter, tracks[1].mixer_device.volume)
+
+            self._binding_engine.flush()
+            self.assertEqual(enc._mapped_parameter, tracks[0].mixer_device.volume)
+            self.assertEqual(self._binding_engine.pending_rebind_count, 0)
+        finally:
+            self.song.view.selected_track = original_track
+            enc.refresh_binding()
+            self._binding_engine.flush()
@@ -0,0 +1,28 @@
+from zcx_test_case import ZCXTestCase
+
+
+class TestGestureTracer(ZCXTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self._page_manager.set_page(page_name="test_page_1")
+        self.test_control = self._z_manager.get_matrix_section("test_section_1").owned_controls[0]
+        self.was_enabled = self._gesture_tracer.enabled
+        self.zcx_api.gesture_tracing = True
+        self.zcx_api.reset_latency_stats()
+
+    def tearDown(self):
+        self.zcx_api.gesture_tracing = self.was_enabled
+        self.zcx_api.reset_latency_stats()
+
+    def test_gesture_is_traced(self):
+        self.test_control.handle_gesture("pressed", testing=True)
+        report = self.zcx_api.get_latency_report()
+        self.assertIn(self.test_control.name, report["controls"])
+        self.assertEqual(report["stages"]["total"]["count"], 1)
+        self.assertTrue(report["command_types"])
+
+    def test_tracing_off(self):
+        self.zcx_api.gesture_tracing = False
+        self.test_control.handle_gesture("pressed", testing=True)
+        self.assertFalse(self.zcx_api.get_latency_report()["controls"])
@@ -60,3 +60,11 @@ class TestGestures(ZCXTestCase):
         end_time = time.perf_counter()
         execution_time = end_time - start_time
         self.log(f"Execution time: {execution_time:.4f} seconds")
+
+    def test_mode_mask(self):
+        self.assertEqual(self._mode_manager.mode_mask, 0)
+        self._mode_manager.add_mode("shift")
+        shift_bit = self._mode_manager.get_mode_bit("shift")
+        self.assertEqual(self._mode_manager.mode_mask, shift_bit)
+        self._mode_manager.toggle_mode("shift")
+        self.assertEqual(self._mode_manager.mode_mask, 0)
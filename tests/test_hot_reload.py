@@ -0,0 +1,107 @@
+import os
+
+from zcx_test_case import ZCXTestCase
+
+
+class TestHotReload(ZCXTestCase):
+
+    def test_unchanged_config_is_not_reloaded_incrementally(self):
+        # a full hot reload would rerun the tests, so only check that one would happen
+        self.assertFalse(self.zcx._ZCXCore__incremental_reload())
+
+    def test_changed_section_and_encoders_are_rebuilt(self):
+        preference_manager = self.zcx.preference_manager
+        config_dir = os.path.join(preference_manager.this_dir, preference_manager.config_dir)
+        section_path = os.path.join(config_dir, "matrix_sections", "select_control.yaml")
+        encoders_path = os.path.join(config_dir, "encoders.yaml")
+        if not os.path.exists(section_path) or not os.path.exists(encoders_path):
+            self.skipTest("Config has no select_control section or encoders")
+
+        section = self._z_manager.get_matrix_section("select_control")
+        old_controls = list(section.owned_controls)
+        old_encoders = list(self._encoder_manager._encoders.values())
+        untouched = {
+            name: list(self._z_manager.get_matrix_section(name).owned_controls)
+            for name in ("actions_top_left", "track_control")
+        }
+
+        self.__change_files(section_path, encoders_path)
+        self.__hot_reload()
+
+        new_controls = list(section.owned_controls)
+        new_encoders = list(self._encoder_manager._encoders.values())
+        self.assertEqual(len(new_controls), len(old_controls))
+        self.assertFalse(set(new_controls) & set(old_controls))
+        self.assertEqual(len(new_encoders), len(old_encoders))
+        self.assertFalse(set(new_encoders) & set(old_encoders))
+
+        for name, controls in untouched.items():
+            self.assertEqual(
+                [id(control) for control in self._z_manager.get_matrix_section(name).owned_controls],
+                [id(control) for control in controls],
+            )
+
+        stale = set(old_controls) | set(old_encoders)
+        self.assertFalse(stale & set(self._z_manager.all_controls))
+        group = self._z_manager.get_control_group("device_select")
+        self.assertTrue(group)
+        self.assertFalse(stale & set(group))
+        self.assertIn(self._z_manager.get_aliased_control("select_mute"), new_controls)
+
+        mode_subscribers = self._mode_manager._ModeManager__subscriber_modes
+        self.assertFalse(stale & set(mode_subscribers))
+        self.assertTrue(set(new_controls) & set(mode_subscribers))
+        self.assertTrue(set(new_encoders) & set(mode_subscribers))
+
+        binding_subscribers = set()
+        for subscribers in self._binding_engine._BindingEngine__subscribers.values():
+            binding_subscribers.update(subscribers)
+        self.assertFalse(stale & binding_subscribers)
+        self.assertTrue(set(new_controls) & binding_subscribers)
+
+        # the rebuilt `SEL / MUTE` pad still receives its MIDI
+        self._page_manager.set_page(page_name="alt_page")
+        track = self.zcx.song.view.selected_track
+        was_muted = track.mute
+        element = self._z_manager.get_aliased_control("select_mute")._control_element
+        status = (144 if element.message_type() == 0 else 176) + element.message_channel()
+        try:
+            self.zcx.receive_midi_chunk(((status, element.message_identifier(), 127),))
+            self.zcx.receive_midi_chunk(((status, element.message_identifier(), 0),))
+            self.assertEqual(track.mute, not was_muted)
+        finally:
+            track.mute = was_muted
+
+    def __change_files(self, *paths):
+        originals = {}
+        for path in paths:
+            with open(path, "rb") as f:
+                originals[path] = f.read()
+            with open(path, "ab") as f:
+                f.write(b"\n# changed by test_hot_reload\n")
+
+        def restore():
+            for path, content in originals.items():
+                with open(path, "wb") as f:
+                    f.write(content)
+            self.__hot_reload()
+
+        self.addCleanup(restore)
+
+    def __hot_reload(self):
+        # a full hot reload would rerun the tests, so stop one before it unloads anything
+        full_reloads = []
+        log = self.zcx.log
+
+        def guarded_log(*msg, **k):
+            if msg == ("doing hot reload",):
+                full_reloads.append(msg)
+                raise RuntimeError("incremental reload was not possible")
+            return log(*msg, **k)
+
+        self.zcx.log = guarded_log
+        try:
+            self.zcx.hot_reload()
+        finally:
+            del self.zcx.log
+        self.assertEqual(full_reloads, [])
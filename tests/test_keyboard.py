@@ -0,0 +1,136 @@
+from typing import TYPE_CHECKING
+from zcx_test_case import ZCXTestCase
+
+if TYPE_CHECKING:
+    from playable.melodic_component import MelodicComponent
+
+
+class _TranslationRecorder:
+    """Stands in for the control surface's c_instance, recording note translations and MIDI map rebuilds."""
+
+    def __init__(self, c_instance):
+        self._c_instance = c_instance
+        self.translations = []
+        self.rebuilds = 0
+
+    def set_note_translation(self, *a):
+        self.translations.append(a)
+        self._c_instance.set_note_translation(*a)
+
+    def request_rebuild_midi_map(self):
+        self.rebuilds += 1
+        self._c_instance.request_rebuild_midi_map()
+
+    def __getattr__(self, name):
+        return getattr(self._c_instance, name)
+
+
+class TestKeyboard(ZCXTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.melodic: "MelodicComponent" = self.zcx.component_map["MelodicComponent"]
+        if not self.melodic.does_exist:
+            self.skipTest("No keyboard section")
+        self._page_manager.set_page(page_name="keyboard_page")
+        self.initial_octave = self.melodic.octave
+        self.melodic.octave = 4
+
+        self.c_instance = self.zcx._c_instance
+        self.recorder = _TranslationRecorder(self.c_instance)
+        self.zcx._c_instance = self.recorder
+
+        self.feedback = []
+        send_feedback = self._hardware_interface.send_feedback
+
+        def record_feedback(midi_bytes):
+            self.feedback.append(midi_bytes)
+            send_feedback(midi_bytes)
+
+        self._hardware_interface.send_feedback = record_feedback
+
+        self.calculations = 0
+        calculate_translations = self.melodic._calculate_translations
+
+        def count_calculations(*a, **k):
+            self.calculations += 1
+            return calculate_translations(*a, **k)
+
+        self.melodic._calculate_translations = count_calculations
+
+    def tearDown(self):
+        self.zcx._c_instance = self.c_instance
+        del self._hardware_interface.send_feedback
+        del self.melodic._calculate_translations
+        self.melodic.octave = self.initial_octave
+
+    @property
+    def applied_translations(self) -> dict:
+        return dict(self.melodic._MelodicComponent__applied_translations)
+
+    @property
+    def concerned_pitches(self) -> list:
+        return list(self.melodic._MelodicComponent__concerned_pitches)
+
+    def test_octave_round_trip_reuses_tables(self):
+        self.melodic.octave = 5
+        self.melodic.octave = 4
+        self.calculations = 0
+        self.recorder.translations.clear()
+
+        before = self.applied_translations
+        self.melodic.octave = 5
+        after = self.applied_translations
+        self.melodic.octave = 4
+
+        self.assertEqual(self.calculations, 0)
+        self.assertEqual(self.recorder.rebuilds, 0)
+        changed = {pitch for pitch in after if before.get(pitch) != after[pitch]}
+        self.assertTrue(changed)
+        sent_on_up = {translation[0] for translation in self.recorder.translations[:len(changed)]}
+        self.assertEqual(sent_on_up, changed)
+        self.assertEqual(len(self.recorder.translations), 2 * len(changed))
+
+    def test_same_octave_sends_nothing(self):
+        self.recorder.translations.clear()
+        self.feedback.clear()
+        self.melodic.octave = 4
+        self.assertEqual(self.recorder.translations, [])
+        self.assertEqual(self.feedback, [])
+
+    def test_invalidate_resends_all_translations(self):
+        self.recorder.translations.clear()
+        self.melodic.invalidate_translations()
+        self.melodic.update_translation()
+        sent = [translation[0] for translation in self.recorder.translations]
+        self.assertEqual(sorted(sent), sorted(self.concerned_pitches))
+
+    def test_unchanged_feedback_sends_nothing(self):
+        self.melodic.refresh_all_feedback()
+        self.feedback.clear()
+        self.melodic.refresh_all_feedback()
+        self.assertEqual(self.feedback, [])
+
+    def test_forced_feedback_resends_pads_in_view(self):
+        self.melodic.refresh_all_feedback()
+        self.feedback.clear()
+        self.melodic.refresh_all_feedback(force=True)
+        sent = sorted(midi_bytes[1] for midi_bytes in self.feedback)
+        self.assertEqual(sent, sorted(self.concerned_pitches))
+
+    def test_feedback_before_setup_is_ignored(self):
+        # as on boot or a hot reload, before the keyboard's colors are parsed
+        color_dict = self.melodic._MelodicComponent__color_dict
+        self.melodic._MelodicComponent__does_exist = False
+        self.melodic._MelodicComponent__color_dict = None
+        logged = []
+        self.melodic.critical = self.melodic.error = lambda *a, **k: logged.append(a)
+        try:
+            self.melodic.refresh_all_feedback(force=True)
+            self.melodic.refresh_single_pitch(self.concerned_pitches[0])
+        finally:
+            del self.melodic.critical, self.melodic.error
+            self.melodic._MelodicComponent__color_dict = color_dict
+            self.melodic._MelodicComponent__does_exist = True
+        self.assertEqual(logged, [])
+        self.assertEqual(self.feedback, [])
@@ -0,0 +1,44 @@
+import logging
+import threading
+
+from zcx_test_case import ZCXTestCase
+from log_queue import QueuedLogHandler
+
+
+class _BlockingHandler(logging.Handler):
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+        self.gate = threading.Event()
+
+    def emit(self, record):
+        self.gate.wait(5)
+        self.records.append(self.format(record))
+
+
+class TestLogQueue(ZCXTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.target = _BlockingHandler()
+        self.handler = QueuedLogHandler(self.target, max_size=2)
+        self.logger = logging.getLogger("zcx_test_log_queue")
+        self.logger.propagate = False
+        self.logger.addHandler(self.handler)
+
+    def tearDown(self):
+        self.target.gate.set()
+        self.logger.removeHandler(self.handler)
+        self.handler.close()
+
+    def test_full_queue_drops_and_reports(self):
+        for i in range(10):
+            self.logger.warning("message %d", i)
+        self.assertGreater(self.handler.dropped_count, 0)
+        self.target.gate.set()
+        self.handler.flush()
+        self.logger.warning("after")
+        self.handler.flush()
+        self.assertTrue(any("dropped" in record for record in self.target.records))
+        self.assertEqual(self.target.records[-1], "after")
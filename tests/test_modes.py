@@ -0,0 +1,38 @@
+from zcx_test_case import ZCXTestCase
+
+
+class _ModeSubscriber:
+
+    def __init__(self):
+        self.calls = 0
+
+    def modes_changed(self, _):
+        self.calls += 1
+
+
+class TestModes(ZCXTestCase):
+
+    def setUp(self):
+        super().setUp()
+        for mode in self._mode_manager.all_modes:
+            self._mode_manager.remove_mode(mode)
+        self.subscriber = _ModeSubscriber()
+
+    def tearDown(self):
+        self._mode_manager.unsubscribe_from_modes(self.subscriber)
+        for mode in self._mode_manager.all_modes:
+            self._mode_manager.remove_mode(mode)
+
+    def test_resubscribe_replaces_modes(self):
+        self._mode_manager.subscribe_to_modes(self.subscriber, ["shift", "select", "shift"])
+        self._mode_manager.subscribe_to_modes(self.subscriber, ["select"])
+        self._mode_manager.toggle_mode("shift")
+        self.assertEqual(self.subscriber.calls, 0)
+        self._mode_manager.toggle_mode("select")
+        self.assertEqual(self.subscriber.calls, 1)
+
+    def test_unsubscribe(self):
+        self._mode_manager.subscribe_to_modes(self.subscriber, ["shift"])
+        self._mode_manager.unsubscribe_from_modes(self.subscriber)
+        self._mode_manager.toggle_mode("shift")
+        self.assertEqual(self.subscriber.calls, 0)
@@ -0,0 +1,27 @@
+from zcx_test_case import ZCXTestCase
+
+
+class TestOscOutput(ZCXTestCase):
+
+    def setUp(self):
+        super().setUp()
+        if not self._osc_output.is_enabled:
+            self.skipTest("No OSC server")
+        self._osc_output.flush()
+        self.address = f'/zcx/{self.zcx.name}/test/osc_output'
+
+    def test_latest_value_per_address(self):
+        self._osc_output.send(self.address, 1)
+        self._osc_output.send(self.address, 2)
+        self.assertEqual(self._osc_output.pending_count, 1)
+        self._osc_output.flush()
+        self.assertEqual(self._osc_output.pending_count, 0)
+
+    def test_unchanged_value_is_suppressed(self):
+        self._osc_output.send(self.address, 'a')
+        self._osc_output.flush()
+        self._osc_output.send(self.address, 'a')
+        self.assertEqual(self._osc_output.pending_count, 0)
+        self._osc_output.send(self.address, 'b')
+        self.assertEqual(self._osc_output.pending_count, 1)
+        self._osc_output.flush()
@@ -26,3 +26,30 @@ class TestPages(ZCXTestCase):
         all_pages = self._page_manager.all_page_names
         self._page_manager.set_page(page_name=all_pages[1])
         self.assertEqual(self._page_manager.current_page, 1)
+
+    def test_shared_sections_stay_in_view(self):
+        shared_section = self.zcx_api.get_matrix_section("actions_top_left")
+        other_section = self.zcx_api.get_matrix_section("actions_bottom_double")
+        repainted = []
+        for control in shared_section.owned_controls:
+            control.request_color_update = lambda control=control: repainted.append(control)
+        try:
+            self._page_manager.set_page(page_name="alt_page")
+            self.assertTrue(all(control.in_view for control in shared_section.owned_controls))
+            self.assertFalse(any(control.in_view for control in other_section.owned_controls))
+            self.assertEqual(repainted, [])
+        finally:
+            for control in shared_section.owned_controls:
+                del control.request_color_update
+
+    def test_returning_to_page_restores_view(self):
+        matrix_controls = [
+            control
+            for section in self.zcx_api.z_manager.all_matrix_sections.values()
+            for control in section.owned_controls
+        ]
+        initial_view = [control.in_view for control in matrix_controls]
+        for _ in range(2):
+            self._page_manager.set_page(page_name="alt_page")
+            self._page_manager.set_page(page_number=0)
+            self.assertEqual([control.in_view for control in matrix_controls], initial_view)
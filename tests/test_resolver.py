@@ -11,3 +11,36 @@ class TestResolver(ZCXTestCase):
         parsed, status = self._action_resolver.compile(test_str, {}, context)
         self.assertEqual(status, 0)
         self.assertEqual(parsed, "Hello, world!")
+
+    def test_resolve_cached_template(self):
+        test_str = "${me.message}, world!"
+        for message in ["Hello", "Goodbye"]:
+            parsed, status = self._action_resolver.compile(test_str, {}, {"me": {"message": message}})
+            self.assertEqual(status, 0)
+            self.assertEqual(parsed, f"{message}, world!")
+
+    def test_resolve_escaped(self):
+        test_str = r"\${me.message} ${me.message}"
+        parsed, status = self._action_resolver.compile(test_str, {}, {"me": {"message": "Hello"}})
+        self.assertEqual(status, 0)
+        self.assertEqual(parsed, r"\${me.message} Hello")
+
+    def test_vars_chain(self):
+        vars_dict = {"a": "me.index + 1", "b": "a * 2"}
+        parsed, status = self._action_resolver.compile("${b}", vars_dict, {"me": {"index": 1}})
+        self.assertEqual(status, 0)
+        self.assertEqual(parsed, "4")
+
+    def test_python_assignment_does_not_leak(self):
+        self._action_resolver.execute_command_bundle(None, {"python": "leaked_name = 1"}, {}, {})
+        parsed, status = self._action_resolver.compile("${leaked_name}", {}, {})
+        self.assertNotEqual(status, 0)
+
+    def test_unreferenced_vars_not_evaluated(self):
+        calls = []
+        context = {"me": {"index": 1, "record": lambda: calls.append(1)}}
+        vars_dict = {"a": "me.index", "b": "me.record()"}
+        parsed, status = self._action_resolver.compile("${a}", vars_dict, context)
+        self.assertEqual(status, 0)
+        self.assertEqual(parsed, "1")
+        self.assertEqual(calls, [])
@@ -47,3 +47,48 @@ class TestSessionView(ZCXTestCase):
 
         do_test()
 
+    def tearDown(self):
+        for control in self.owned_controls:
+            control.__dict__.pop("request_color_update", None)
+        self._session_view.update_clip_slot_assignments(force=True)
+
+    def count_feedback(self):
+        sent = []
+        for control in self.owned_controls:
+            control.request_color_update = lambda control=control, **k: sent.append(control)
+        return sent
+
+    def test_ring_move_reuses_slot_watchers(self):
+        grid = self._session_view.clip_grid
+        tracks = list(self._session_ring.tracks_in_view)
+        if len(tracks) < 2:
+            self.skipTest("needs at least two tracks")
+        before = grid.get_watcher(1, 0)
+        grid.assign(tracks[1:], 0)
+        self.assertIs(grid.get_watcher(0, 0), before)
+
+        for control in self.owned_controls:
+            if control.clip_slot is None:
+                continue
+            clip_slots = list(control.clip_slot.canonical_parent.clip_slots)
+            self.assertEqual(control.scene_index, clip_slots.index(control.clip_slot))
+
+    def test_unchanged_window_sends_no_feedback(self):
+        grid = self._session_view.clip_grid
+        tracks = list(self._session_ring.tracks_in_view)
+        sent = self.count_feedback()
+        grid.assign(tracks, self._session_ring.scene_offset)
+        self.assertEqual(sent, [])
+        # a forced assign re-reads every slot, but nothing has changed colour
+        grid.assign(tracks, self._session_ring.scene_offset, force=True)
+        self.assertEqual(sent, [])
+
+    def test_status_color_sends_only_changes(self):
+        control = self.owned_controls[0]
+        color_dict = self._session_view.get_color_dict(5)
+        control.set_status_color(color_dict, color_dict["base"])
+        sent = self.count_feedback()
+        control.set_status_color(color_dict, color_dict["base"])
+        self.assertEqual(sent, [])
+        control.set_status_color(color_dict, color_dict["playing"])
+        self.assertEqual(sent, [control])
@@ -38,3 +38,14 @@ class TestTemplates(ZCXTestCase):
         control_2 = self.test_section_1.owned_controls[6]
         self.assertRaises(KeyError, lambda: get_test_prop(control_2))
         self.assertTrue(control_2._context["me"]["props"]["test_1"])
+
+    def test_templates_not_shared(self):
+        control = self.test_section_1.owned_controls[3]
+        control_2 = self.test_section_1.owned_controls[4]
+        self.assertIsNot(control._raw_config, control_2._raw_config)
+        self.assertIsNot(control._raw_config["props"], control_2._raw_config["props"])
+
+        global_template = self.zcx.template_manager.global_control_template
+        def set_item():
+            global_template["threshold"] = 0
+        self.assertRaises(TypeError, set_item)
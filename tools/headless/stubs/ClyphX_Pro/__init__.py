@@ -0,0 +1,94 @@
+"""Stand-in for the ClyphX Pro control surface. Instead of executing action lists, it records them.
+Actions registered by user action classes (see `ClyphX_Pro.add_user_actions`) are also dispatched,
+so zcx's own `ZCX` action works as it does in Live."""
+import time
+
+
+class RecordingOscServer(object):
+
+    def __init__(self):
+        self.messages = []
+
+    def sendOSC(self, address, value):
+        self.messages.append((address, value))
+
+
+class RecordingTrackManager(object):
+
+    def __init__(self, song):
+        self._song = song
+
+    def get_track_by_name(self, name):
+        name = name.strip('"')
+        for track in tuple(self._song.tracks) + tuple(self._song.return_tracks) + (self._song.master_track,):
+            if track.name == name:
+                return track
+        return None
+
+
+class RecordingClyphXComponent(object):
+    """Records every action list it is asked to trigger, along with a `perf_counter()` timestamp.
+    Set `on_action_list` to a callable to observe action lists as they arrive."""
+
+    def __init__(self, song):
+        self.action_lists = []
+        self.timestamps = []
+        self.on_action_list = None
+        self.osc_server = RecordingOscServer()
+        self.user_actions = {}
+        self._user_variables = {}
+        self._track_manager = RecordingTrackManager(song)
+
+    def trigger_action_list(self, action_list):
+        self.timestamps.append(time.perf_counter())
+        self.action_lists.append(action_list)
+        if self.on_action_list is not None:
+            self.on_action_list(action_list)
+        if self.user_actions:
+            self._dispatch_user_actions(action_list)
+
+    def _dispatch_user_actions(self, action_list):
+        for action in action_list.split(';'):
+            name, _, args = action.strip().partition(' ')
+            func = self.user_actions.get(name.lower())
+            if func is not None:
+                func({}, args.strip().lower())
+
+    def clear(self):
+        self.action_lists.clear()
+        self.timestamps.clear()
+        self.osc_server.messages.clear()
+
+
+class ClyphX_Pro(object):
+
+    def __init__(self, song, application=None):
+        self._song = song
+        self._application = application
+        self._user_action_instances = []
+        self.clyphx_pro_component = RecordingClyphXComponent(song)
+        if application is not None:
+            application.add_control_surfaces_listener(self.control_surfaces_changed)
+
+    def song(self):
+        return self._song
+
+    def application(self):
+        return self._application
+
+    def add_user_actions(self, user_actions_class):
+        instance = user_actions_class(canonical_parent=self)
+        instance.create_actions()
+        self.clyphx_pro_component.user_actions.update(instance._action_registry)
+        self._user_action_instances.append(instance)
+        return instance
+
+    def control_surfaces_changed(self):
+        """Live calls this on every script when the selected control surfaces change."""
+        scripts = list(self._application.control_surfaces) if self._application is not None else []
+        for instance in self._user_action_instances:
+            instance.on_control_surface_scripts_changed(scripts)
+
+    def disconnect(self):
+        if self._application is not None:
+            self._application.remove_control_surfaces_listener(self.control_surfaces_changed)
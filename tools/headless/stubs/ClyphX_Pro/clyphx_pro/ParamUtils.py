@@ -0,0 +1,12 @@
+PARAMS_PER_BANK = 8
+
+
+def get_instant_mapping_parameter(device, args):
+    """Resolves `['b<bank>', 'p<param>']` against the device's parameter list, banked in eights after `Device On`."""
+    bank = int(args[0][1:])
+    param = int(args[1][1:])
+    index = (bank - 1) * PARAMS_PER_BANK + param
+    parameters = device.parameters
+    if 0 < index < len(parameters):
+        return parameters[index], args[2:]
+    return None, args[2:]
@@ -0,0 +1,10 @@
+def parse_int(value, default=None, min_value=None, max_value=None):
+    try:
+        value = int(value)
+    except (TypeError, ValueError):
+        return default
+    if min_value is not None:
+        value = max(min_value, value)
+    if max_value is not None:
+        value = min(max_value, value)
+    return value
@@ -0,0 +1,29 @@
+class UserActionsBase(object):
+    """Base class for ClyphX Pro user actions."""
+
+    def __init__(self, canonical_parent=None, *a, **k):
+        super().__init__()
+        self.canonical_parent = canonical_parent
+        self.name = self.__class__.__name__
+        self._action_registry = {}
+
+    def song(self):
+        return self.canonical_parent.song()
+
+    def create_actions(self):
+        pass
+
+    def add_global_action(self, name, func):
+        self._action_registry[name.lower()] = func
+
+    def add_track_action(self, name, func):
+        self._action_registry[name.lower()] = func
+
+    def add_clip_action(self, name, func):
+        self._action_registry[name.lower()] = func
+
+    def add_device_action(self, name, func):
+        self._action_registry[name.lower()] = func
+
+    def on_control_surface_scripts_changed(self, scripts):
+        pass
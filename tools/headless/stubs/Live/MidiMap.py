@@ -0,0 +1,27 @@
+class MapMode(object):
+    absolute = 0
+    absolute_14_bit = 1
+    relative_signed_bit = 2
+    relative_binary_offset = 3
+    relative_two_compliment = 4
+    relative_signed_bit2 = 5
+    relative_smooth_signed_bit = 6
+    relative_smooth_binary_offset = 7
+    relative_smooth_two_compliment = 8
+    relative_smooth_signed_bit2 = 9
+    relative_smooth_signed_bit2_rev = 10
+
+
+RELATIVE_MODES = frozenset(range(2, 11))
+
+
+def relative_delta(map_mode, value):
+    """Translates a relative encoder message into a signed step."""
+    if map_mode in (MapMode.relative_binary_offset, MapMode.relative_smooth_binary_offset):
+        return value - 64
+    if map_mode in (MapMode.relative_signed_bit, MapMode.relative_smooth_signed_bit):
+        return -(value & 63) if value & 64 else value
+    if map_mode in (MapMode.relative_signed_bit2, MapMode.relative_smooth_signed_bit2,
+                    MapMode.relative_smooth_signed_bit2_rev):
+        return value & 63 if value & 64 else -value
+    return value - 128 if value >= 64 else value
@@ -0,0 +1,602 @@
+"""A scriptable stand-in for the parts of Live's object model that zcx touches.
+
+Objects notify their listeners (with no arguments, as Live does) whenever a listenable property changes,
+so a test or benchmark can drive zcx by simply assigning to `song.view.selected_track`, `track.arm`, etc.
+Build a set with `Song.create_default()` or the `add_*` helpers.
+"""
+from itertools import count
+
+from ableton.v2.base.event import EventObject, notify
+
+from . import MidiMap
+
+
+class _prop(object):
+    """A listenable Live property. Listeners are notified with no arguments when the value changes."""
+
+    def __init__(self, default=None, read_only=False):
+        self._default = default
+        self._read_only = read_only
+        self._name = None
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return obj.__dict__.get(self._name, self._default)
+
+    def __set__(self, obj, value):
+        if obj.__dict__.get(self._name, self._default) is value:
+            return
+        obj.__dict__[self._name] = value
+        notify(obj, self._name)
+
+
+_live_ptrs = count(1)
+
+
+class LiveObject(EventObject):
+
+    def __init__(self, canonical_parent=None, name='', **props):
+        super().__init__()
+        self._live_ptr = next(_live_ptrs)
+        self.canonical_parent = canonical_parent
+        self.__dict__['name'] = name
+        for key, value in props.items():
+            setattr(self, key, value)
+
+    name = _prop('')
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} {self.name!r}>'
+
+
+class Application(LiveObject):
+
+    def __init__(self, song=None, major=12, minor=1, bugfix=0):
+        super().__init__(name='Live')
+        self._song = song
+        self._version = (major, minor, bugfix)
+        self.messages = []
+        self.view = ApplicationView(self)
+
+    def get_document(self):
+        return self._song
+
+    control_surfaces = _prop(())
+
+    def get_major_version(self):
+        return self._version[0]
+
+    def get_minor_version(self):
+        return self._version[1]
+
+    def get_bugfix_version(self):
+        return self._version[2]
+
+    def show_on_the_fly_message(self, message):
+        self.messages.append(message)
+
+    def add_control_surface(self, control_surface):
+        self.control_surfaces = tuple(self.control_surfaces) + (control_surface,)
+
+    def remove_control_surface(self, control_surface):
+        self.control_surfaces = tuple(cs for cs in self.control_surfaces if cs is not control_surface)
+
+
+class ApplicationView(LiveObject):
+    focused_document_view = _prop('Session')
+
+    def focus_view(self, view_name):
+        self.focused_document_view = view_name
+
+    def show_view(self, view_name):
+        self.focused_document_view = view_name
+
+    def is_view_visible(self, view_name):
+        return self.focused_document_view == view_name
+
+
+_application = None
+
+
+def get_application():
+    global _application
+    if _application is None:
+        _application = Application()
+    return _application
+
+
+def set_application(application):
+    global _application
+    _application = application
+
+
+class DeviceParameter(LiveObject):
+    value = _prop(0.0)
+    automation_state = _prop(0)
+    is_enabled = _prop(True)
+    state = _prop(0)
+
+    def __init__(self, canonical_parent=None, name='', value=0.0, min=0.0, max=1.0, is_quantized=False,
+                 value_items=(), default_value=None):
+        super().__init__(canonical_parent, name)
+        self.original_name = name
+        self.min = min
+        self.max = max
+        self.is_quantized = is_quantized
+        self.value_items = tuple(value_items)
+        self.default_value = value if default_value is None else default_value
+        self.__dict__['value'] = value
+
+    def __str__(self):
+        if self.value_items:
+            return str(self.value_items[int(self.value) % len(self.value_items)])
+        return f'{self.value:.2f}'
+
+    def str_for_value(self, value):
+        return str(value)
+
+    def begin_gesture(self):
+        pass
+
+    def end_gesture(self):
+        pass
+
+    def re_enable_automation(self):
+        pass
+
+
+class MixerDevice(LiveObject):
+    crossfade_assign = _prop(1)
+    panning_mode = _prop(0)
+    sends = _prop(())
+
+    def __init__(self, canonical_parent=None, num_sends=0):
+        super().__init__(canonical_parent, 'Mixer')
+        self.volume = DeviceParameter(self, 'Track Volume', 0.85)
+        self.panning = DeviceParameter(self, 'Track Panning', 0.0, -1.0, 1.0)
+        self.left_split_stereo = DeviceParameter(self, 'Left Split Stereo', -1.0, -1.0, 1.0)
+        self.right_split_stereo = DeviceParameter(self, 'Right Split Stereo', 1.0, -1.0, 1.0)
+        self.track_activator = DeviceParameter(self, 'Speaker On', 1.0, is_quantized=True)
+        self.crossfader = DeviceParameter(self, 'Crossfader', 0.0, -1.0, 1.0)
+        self.cue_volume = DeviceParameter(self, 'Preview Volume', 0.85)  # called Cue Volume before Live 12
+        self.song_tempo = DeviceParameter(self, 'Song Tempo', 120.0, 20.0, 999.0)
+        self.__dict__['sends'] = tuple(DeviceParameter(self, f'Send {chr(65 + i)}') for i in range(num_sends))
+
+    def add_send(self):
+        self.sends = self.sends + (DeviceParameter(self, f'Send {chr(65 + len(self.sends))}'),)
+
+
+class ChainView(LiveObject):
+    pass
+
+
+class Chain(LiveObject):
+    devices = _prop(())
+    color_index = _prop(0)
+    mute = _prop(False)
+    solo = _prop(False)
+
+    def __init__(self, canonical_parent=None, name='Chain'):
+        super().__init__(canonical_parent, name)
+        self.mixer_device = MixerDevice(self)
+        self.view = ChainView(self)
+
+    def add_device(self, name, class_name=None, **k):
+        device = Device(self, name, class_name or name, **k)
+        self.devices = self.devices + (device,)
+        return device
+
+
+class DeviceView(LiveObject):
+    selected_chain = _prop(None)
+    is_collapsed = _prop(False)
+
+
+class Device(LiveObject):
+    parameters = _prop(())
+    chains = _prop(())
+    is_active = _prop(True)
+
+    def __init__(self, canonical_parent=None, name='Device', class_name=None, num_parameters=16, parameters=None,
+                 can_have_chains=False, type=1):
+        super().__init__(canonical_parent, name)
+        self.class_name = class_name or name
+        self.class_display_name = self.class_name
+        self.type = type
+        self.can_have_chains = can_have_chains
+        self.can_have_drum_pads = False
+        self.view = DeviceView(self)
+        if parameters is None:
+            parameters = [f'{name} Param {i + 1}' for i in range(num_parameters)]
+        self.__dict__['parameters'] = (DeviceParameter(self, 'Device On', 1.0, is_quantized=True),) + tuple(
+            param if isinstance(param, DeviceParameter) else DeviceParameter(self, param)
+            for param in parameters
+        )
+
+    def add_chain(self, name='Chain'):
+        chain = Chain(self, name)
+        self.chains = self.chains + (chain,)
+        if self.view.selected_chain is None:
+            self.view.selected_chain = chain
+        return chain
+
+    def store_chosen_bank(self, *a):
+        pass
+
+
+class RackDevice(Device):
+
+    def __init__(self, canonical_parent=None, name='Rack', class_name='InstrumentGroupDevice', num_chains=2, **k):
+        super().__init__(canonical_parent, name, class_name, can_have_chains=True, **k)
+        for i in range(num_chains):
+            self.add_chain(f'Chain {i + 1}')
+
+
+class Clip(LiveObject):
+    color_index = _prop(0)
+    is_playing = _prop(False)
+    is_triggered = _prop(False)
+    is_recording = _prop(False)
+    looping = _prop(True)
+    muted = _prop(False)
+    playing_position = _prop(0.0)
+
+    def __init__(self, canonical_parent=None, name='', is_midi_clip=True, length=4.0, color_index=0):
+        super().__init__(canonical_parent, name)
+        self.is_midi_clip = is_midi_clip
+        self.is_audio_clip = not is_midi_clip
+        self.length = length
+        self.__dict__['color_index'] = color_index
+
+    @property
+    def color(self):
+        return self.color_index
+
+    def fire(self, *a, **k):
+        self.canonical_parent.fire()
+
+    def stop(self):
+        self.canonical_parent.stop()
+
+
+class ClipSlot(LiveObject):
+    clip = _prop(None)
+    has_clip = _prop(False)
+    is_playing = _prop(False)
+    is_triggered = _prop(False)
+    is_recording = _prop(False)
+    playing_status = _prop(0)
+    has_stop_button = _prop(True)
+    color_index = _prop(None)
+    controls_other_clips = _prop(False)
+
+    def __init__(self, canonical_parent=None, index=0):
+        super().__init__(canonical_parent, '')
+        self.index = index
+        self.fired = 0
+
+    @property
+    def is_group_slot(self):
+        return bool(getattr(self.canonical_parent, 'is_foldable', False))
+
+    @property
+    def color(self):
+        return self.clip.color_index if self.clip is not None else None
+
+    def create_clip(self, length=4.0, name='', color_index=0):
+        clip = Clip(self, name, getattr(self.canonical_parent, 'has_midi_input', True), length, color_index)
+        self.clip = clip
+        self.has_clip = True
+        return clip
+
+    def delete_clip(self):
+        self.clip = None
+        self.has_clip = False
+
+    def fire(self, *a, **k):
+        self.fired += 1
+        track = self.canonical_parent
+        if self.has_clip:
+            self.is_triggered = True
+            self.clip.is_triggered = True
+        if isinstance(track, Track):
+            track.fired_slot_index = self.index
+
+    def stop(self):
+        if isinstance(self.canonical_parent, Track):
+            self.canonical_parent.stop_all_clips()
+
+    def set_fire_button_state(self, state):
+        pass
+
+    def start_playing(self):
+        """Scripting helper: makes this slot's clip the one playing on its track."""
+        track = self.canonical_parent
+        if isinstance(track, Track):
+            for slot in track.clip_slots:
+                if slot is not self and slot.is_playing:
+                    slot._set_playing(False)
+            track.fired_slot_index = -1
+            track.playing_slot_index = self.index
+        self._set_playing(True)
+
+    def _set_playing(self, playing):
+        self.is_triggered = False
+        self.is_playing = playing
+        if self.clip is not None:
+            self.clip.is_triggered = False
+            self.clip.is_playing = playing
+        self.playing_status = 1 if playing else 0
+
+
+class TrackView(LiveObject):
+    selected_device = _prop(None)
+    device_insert_mode = _prop(0)
+    is_collapsed = _prop(False)
+
+    def select_instrument(self):
+        devices = self.canonical_parent.devices
+        if devices:
+            self.selected_device = devices[0]
+            return True
+        return False
+
+
+class Track(LiveObject):
+    color_index = _prop(0)
+    arm = _prop(False)
+    mute = _prop(False)
+    solo = _prop(False)
+    muted_via_solo = _prop(False)
+    clip_slots = _prop(())
+    devices = _prop(())
+    playing_slot_index = _prop(-1)
+    fired_slot_index = _prop(-1)
+    fold_state = _prop(False)
+    is_visible = _prop(True)
+    current_monitoring_state = _prop(1)
+    input_meter_level = _prop(0.0)
+    output_meter_level = _prop(0.0)
+    output_meter_left = _prop(0.0)
+    output_meter_right = _prop(0.0)
+    input_routing_type = _prop(None)
+    output_routing_type = _prop(None)
+    implicit_arm = _prop(False)
+
+    def __init__(self, canonical_parent=None, name='', has_midi_input=True, is_foldable=False, group_track=None,
+                 num_scenes=0, num_sends=0, color_index=0, can_be_armed=True):
+        super().__init__(canonical_parent, name)
+        self.has_midi_input = has_midi_input
+        self.has_audio_input = not has_midi_input
+        self.has_midi_output = has_midi_input
+        self.has_audio_output = True
+        self.is_foldable = is_foldable
+        self.is_grouped = group_track is not None
+        self.group_track = group_track
+        self.is_frozen = False
+        self.is_part_of_selection = False
+        self.can_be_armed = can_be_armed and not is_foldable
+        self.can_be_frozen = False
+        self.can_show_chains = False
+        self.__dict__['color_index'] = color_index
+        self.mixer_device = MixerDevice(self, num_sends)
+        self.view = TrackView(self)
+        self.__dict__['clip_slots'] = tuple(ClipSlot(self, i) for i in range(num_scenes))
+
+    @property
+    def color(self):
+        return self.color_index
+
+    def add_device(self, name, class_name=None, **k):
+        device = Device(self, name, class_name or name, **k)
+        self.devices = self.devices + (device,)
+        if self.view.selected_device is None:
+            self.view.selected_device = device
+        return device
+
+    def add_rack(self, name, class_name='InstrumentGroupDevice', **k):
+        device = RackDevice(self, name, class_name, **k)
+        self.devices = self.devices + (device,)
+        if self.view.selected_device is None:
+            self.view.selected_device = device
+        return device
+
+    def stop_all_clips(self, *a):
+        for slot in self.clip_slots:
+            if slot.is_playing or slot.is_triggered:
+                slot._set_playing(False)
+        self.fired_slot_index = -2
+        self.playing_slot_index = -1
+
+    def jump_in_running_session_clip(self, beats):
+        pass
+
+    def _add_clip_slot(self):
+        self.clip_slots = self.clip_slots + (ClipSlot(self, len(self.clip_slots)),)
+
+
+class Scene(LiveObject):
+    color_index = _prop(0)
+    is_triggered = _prop(False)
+    is_empty = _prop(True)
+    tempo = _prop(-1.0)
+    tempo_enabled = _prop(False)
+
+    def __init__(self, canonical_parent=None, name='', index=0):
+        super().__init__(canonical_parent, name)
+        self.index = index
+
+    @property
+    def clip_slots(self):
+        return tuple(track.clip_slots[self.index] for track in self.canonical_parent.tracks)
+
+    @property
+    def color(self):
+        return self.color_index
+
+    def fire(self, *a, **k):
+        for slot in self.clip_slots:
+            slot.fire()
+
+    def fire_as_selected(self, *a, **k):
+        self.fire()
+
+
+class SongView(LiveObject):
+    selected_track = _prop(None)
+    selected_scene = _prop(None)
+    selected_parameter = _prop(None)
+    selected_chain = _prop(None)
+    detail_clip = _prop(None)
+    follow_song = _prop(False)
+    draw_mode = _prop(True)
+
+    @property
+    def highlighted_clip_slot(self):
+        song = self.canonical_parent
+        track, scene = self.selected_track, self.selected_scene
+        if track is None or scene is None or track not in song.tracks:
+            return None
+        return track.clip_slots[list(song.scenes).index(scene)]
+
+    @highlighted_clip_slot.setter
+    def highlighted_clip_slot(self, slot):
+        song = self.canonical_parent
+        self.selected_track = slot.canonical_parent
+        self.selected_scene = song.scenes[slot.index]
+
+    def select_device(self, device, *a):
+        track = device.canonical_parent
+        while track is not None and not isinstance(track, Track):
+            track = track.canonical_parent
+        if track is not None:
+            self.selected_track = track
+            track.view.selected_device = device
+
+
+class Song(LiveObject):
+    tracks = _prop(())
+    visible_tracks = _prop(())
+    return_tracks = _prop(())
+    scenes = _prop(())
+    is_playing = _prop(False)
+    tempo = _prop(120.0)
+    metronome = _prop(False)
+    loop = _prop(False)
+    punch_in = _prop(False)
+    punch_out = _prop(False)
+    record_mode = _prop(False)
+    session_record = _prop(False)
+    session_record_status = _prop(0)
+    session_automation_record = _prop(False)
+    arrangement_overdub = _prop(False)
+    overdub = _prop(False)
+    is_counting_in = _prop(False)
+    can_undo = _prop(False)
+    can_redo = _prop(False)
+    root_note = _prop(0)
+    scale_name = _prop('Major')
+    scale_intervals = _prop((0, 2, 4, 5, 7, 9, 11))
+    scale_mode = _prop(True)
+    current_song_time = _prop(0.0)
+    signature_numerator = _prop(4)
+    signature_denominator = _prop(4)
+    clip_trigger_quantization = _prop(4)
+    groove_amount = _prop(1.0)
+    nudge_down = _prop(False)
+    nudge_up = _prop(False)
+
+    def __init__(self, name='headless set'):
+        super().__init__(None, name)
+        self.view = SongView(self)
+        self.master_track = Track(self, 'Master', has_midi_input=False, can_be_armed=False)
+        self.undo_steps = []
+        self._open_undo_steps = 0
+
+    @classmethod
+    def create_default(cls, num_tracks=8, num_scenes=8, num_returns=2, name='headless set'):
+        """A set with MIDI tracks holding an instrument rack and an effect, a couple of return tracks,
+        and a clip in every other slot."""
+        song = cls(name)
+        for i in range(num_scenes):
+            song.add_scene(f'Scene {i + 1}')
+        for i in range(num_returns):
+            song.add_return_track(f'{chr(65 + i)} Return')
+        for i in range(num_tracks):
+            track = song.add_track(f'Track {i + 1}', color_index=(i * 5) % 70)
+            track.add_rack(f'Rack {i + 1}')
+            track.add_device(f'Effect {i + 1}', 'AutoFilter')
+            for slot in track.clip_slots[i % 2::2]:
+                slot.create_clip(name=f'Clip {i + 1}-{slot.index + 1}', color_index=track.color_index)
+        song.view.selected_track = song.tracks[0] if song.tracks else None
+        song.view.selected_scene = song.scenes[0] if song.scenes else None
+        return song
+
+    def add_track(self, name='', **k):
+        track = Track(self, name, num_scenes=len(self.scenes), num_sends=len(self.return_tracks), **k)
+        self.tracks = self.tracks + (track,)
+        self.visible_tracks = tuple(t for t in self.tracks if t.is_visible)
+        return track
+
+    def add_return_track(self, name=''):
+        track = Track(self, name, has_midi_input=False, can_be_armed=False)
+        self.return_tracks = self.return_tracks + (track,)
+        for t in self.tracks + (self.master_track,):
+            t.mixer_device.add_send()
+        return track
+
+    def add_scene(self, name=''):
+        scene = Scene(self, name, len(self.scenes))
+        for track in self.tracks:
+            track._add_clip_slot()
+        self.scenes = self.scenes + (scene,)
+        return scene
+
+    def delete_track(self, index):
+        track = self.tracks[index]
+        self.tracks = self.tracks[:index] + self.tracks[index + 1:]
+        self.visible_tracks = tuple(t for t in self.tracks if t.is_visible)
+        if self.view.selected_track is track:
+            self.view.selected_track = self.tracks[min(index, len(self.tracks) - 1)] if self.tracks else None
+
+    def begin_undo_step(self):
+        self._open_undo_steps += 1
+
+    def end_undo_step(self):
+        self._open_undo_steps = max(0, self._open_undo_steps - 1)
+        self.undo_steps.append(self.current_song_time)
+        self.can_undo = True
+
+    def undo(self):
+        if self.undo_steps:
+            self.undo_steps.pop()
+        self.can_undo = bool(self.undo_steps)
+
+    def redo(self):
+        pass
+
+    def start_playing(self):
+        self.is_playing = True
+
+    def stop_playing(self):
+        self.is_playing = False
+
+    def continue_playing(self):
+        self.is_playing = True
+
+    def stop_all_clips(self, *a):
+        for track in self.tracks:
+            track.stop_all_clips()
+
+    def tap_tempo(self):
+        pass
+
+    def get_data(self, key, default=None):
+        return self.__dict__.setdefault('_data', {}).get(key, default)
+
+    def set_data(self, key, value):
+        self.__dict__.setdefault('_data', {})[key] = value
@@ -0,0 +1,31 @@
+from ableton.v3.control_surface.elements.color import Color
+from pushbase.colors import Basic, Blink, FallbackColor, Pulse, Rgb, TransparentColor
+
+SHADE_STEP = 1
+
+
+def translate_color_index(index):
+    return index % 26 + 1 if index is not None and index >= 0 else 0
+
+
+def inverse_translate_color_index(index):
+    return max(0, index - 1)
+
+
+def determine_shaded_color_index(color_index, shade_level):
+    return color_index + 128 * shade_level if shade_level else color_index
+
+
+class IndexedColor(Color):
+
+    def __init__(self, index=0, *a, **k):
+        super().__init__(index, *a, **k)
+        self.index = index
+
+    @classmethod
+    def from_push_index(cls, index, shade_level=0):
+        return cls(determine_shaded_color_index(index, shade_level) % 128)
+
+    @classmethod
+    def from_live_index(cls, index, shade_level=0):
+        return cls.from_push_index(translate_color_index(index), shade_level)
@@ -0,0 +1,14 @@
+from .event import EventObject, listenable_property, listens, listens_group
+from .task import Task, TaskGroup, TimerTask
+
+
+def clamp(value, minv, maxv):
+    return max(minv, min(value, maxv))
+
+
+def nop(*a, **k):
+    pass
+
+
+def liveobj_valid(obj):
+    return obj is not None and getattr(obj, '_live_ptr', True) is not None
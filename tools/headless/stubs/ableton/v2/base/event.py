@@ -0,0 +1,247 @@
+"""Stand-in for Live's event system: EventObject, listenable_property, listens and listens_group.
+
+Listener registration is dynamic, as in Live: any `EventObject` answers `add_<event>_listener`,
+`remove_<event>_listener`, `<event>_has_listener` and `notify_<event>`.
+"""
+
+_LISTENER_PREFIXES = (
+    ('add_', '_listener', 'add'),
+    ('remove_', '_listener', 'remove'),
+    ('', '_has_listener', 'has'),
+    ('notify_', '', 'notify'),
+)
+
+
+def _listener_table(obj) -> dict:
+    try:
+        return object.__getattribute__(obj, '_event_listeners')
+    except AttributeError:
+        table = {}
+        object.__setattr__(obj, '_event_listeners', table)
+        return table
+
+
+def add_listener(obj, event, listener):
+    listeners = _listener_table(obj).setdefault(event, [])
+    if listener not in listeners:
+        listeners.append(listener)
+
+
+def remove_listener(obj, event, listener):
+    listeners = _listener_table(obj).get(event)
+    if listeners and listener in listeners:
+        listeners.remove(listener)
+
+
+def has_listener(obj, event, listener) -> bool:
+    return listener in _listener_table(obj).get(event, ())
+
+
+def notify(obj, event, *a, **k):
+    listeners = _listener_table(obj).get(event)
+    if not listeners:
+        return
+    for listener in tuple(listeners):
+        listener(*a, **k)
+
+
+def listener_count(obj, event=None) -> int:
+    table = _listener_table(obj)
+    if event is not None:
+        return len(table.get(event, ()))
+    return sum(len(listeners) for listeners in table.values())
+
+
+class EventObject(object):
+
+    def __init__(self, *a, **k):
+        super().__init__()
+        self._registered_disconnectables = []
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        for prefix, suffix, kind in _LISTENER_PREFIXES:
+            if name.startswith(prefix) and name.endswith(suffix) and len(name) > len(prefix) + len(suffix):
+                event = name[len(prefix):len(name) - len(suffix)]
+                if kind == 'add':
+                    return lambda listener: add_listener(self, event, listener)
+                if kind == 'remove':
+                    return lambda listener: remove_listener(self, event, listener)
+                if kind == 'has':
+                    return lambda listener: has_listener(self, event, listener)
+                return lambda *a, **k: notify(self, event, *a, **k)
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+    def register_disconnectable(self, disconnectable):
+        self._registered_disconnectables.append(disconnectable)
+        return disconnectable
+
+    def unregister_disconnectable(self, disconnectable):
+        if disconnectable in self._registered_disconnectables:
+            self._registered_disconnectables.remove(disconnectable)
+
+    def disconnect(self):
+        for connection in tuple(self.__dict__.get('_connections', {}).values()):
+            connection.disconnect()
+        for disconnectable in reversed(self.__dict__.get('_registered_disconnectables', [])):
+            disconnectable.disconnect()
+        self.__dict__['_registered_disconnectables'] = []
+        _listener_table(self).clear()
+
+
+class listenable_property(property):
+    """A property that can be listened to. The setter is responsible for calling `notify_<name>`."""
+
+    @classmethod
+    def managed(cls, default_value):
+        return _ManagedProperty(default_value)
+
+
+class _ManagedProperty(object):
+
+    def __init__(self, default_value):
+        self._default = default_value
+        self._name = None
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        return obj.__dict__.get(f'_managed_{self._name}', self._default)
+
+    def __set__(self, obj, value):
+        key = f'_managed_{self._name}'
+        if obj.__dict__.get(key, self._default) != value:
+            obj.__dict__[key] = value
+            notify(obj, self._name, value)
+
+
+class _Connection(object):
+    """The per-instance object returned when accessing a `listens` method."""
+
+    def __init__(self, owner, func, event):
+        self._owner = owner
+        self._func = func
+        self._event = event
+        self._subject = None
+
+    @property
+    def subject(self):
+        return self._subject
+
+    @subject.setter
+    def subject(self, subject):
+        if subject is self._subject:
+            return
+        if self._subject is not None:
+            _unsubscribe(self._subject, self._event, self)
+        self._subject = subject
+        if subject is not None:
+            _subscribe(subject, self._event, self)
+
+    @property
+    def listener(self):
+        return self
+
+    def __call__(self, *a, **k):
+        return self._func(self._owner, *a, **k)
+
+    def disconnect(self):
+        self.subject = None
+
+
+class _GroupConnection(object):
+    """The per-instance object returned when accessing a `listens_group` method.
+    The sender is passed to the decorated method as its last argument."""
+
+    def __init__(self, owner, func, event):
+        self._owner = owner
+        self._func = func
+        self._event = event
+        self._listeners = {}
+
+    def _make_listener(self, subject):
+        def listener(*a, **k):
+            return self._func(self._owner, *(a + (subject,)), **k)
+        return listener
+
+    @property
+    def subjects(self):
+        return [subject for subject, _ in self._listeners.values()]
+
+    def add_subject(self, subject):
+        if subject is None or id(subject) in self._listeners:
+            return
+        listener = self._make_listener(subject)
+        self._listeners[id(subject)] = (subject, listener)
+        _subscribe(subject, self._event, listener)
+
+    def remove_subject(self, subject):
+        entry = self._listeners.pop(id(subject), None)
+        if entry is not None:
+            _unsubscribe(entry[0], self._event, entry[1])
+
+    def has_subject(self, subject):
+        return id(subject) in self._listeners
+
+    def replace_subjects(self, subjects, identifiers=None):
+        self.disconnect()
+        for subject in subjects:
+            self.add_subject(subject)
+
+    def __call__(self, *a, **k):
+        return self._func(self._owner, *a, **k)
+
+    def disconnect(self):
+        for subject, listener in tuple(self._listeners.values()):
+            _unsubscribe(subject, self._event, listener)
+        self._listeners.clear()
+
+
+def _subscribe(subject, event, listener):
+    if isinstance(subject, EventObject) or not hasattr(subject, f'add_{event}_listener'):
+        add_listener(subject, event, listener)
+    else:
+        getattr(subject, f'add_{event}_listener')(listener)
+
+
+def _unsubscribe(subject, event, listener):
+    if isinstance(subject, EventObject) or not hasattr(subject, f'remove_{event}_listener'):
+        remove_listener(subject, event, listener)
+    else:
+        getattr(subject, f'remove_{event}_listener')(listener)
+
+
+class listens(object):
+    connection_class = _Connection
+
+    def __init__(self, event, *a, **k):
+        self._event = event
+        self._func = None
+        self._name = None
+
+    def __call__(self, func):
+        self._func = func
+        self._name = func.__name__
+        return self
+
+    def __set_name__(self, owner, name):
+        self._name = name
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        # keyed by descriptor, not name, so an override calling super().<listener> gets the base class's connection
+        connections = obj.__dict__.setdefault('_connections', {})
+        connection = connections.get(self)
+        if connection is None:
+            connection = self.connection_class(obj, self._func, self._event)
+            connections[self] = connection
+        return connection
+
+
+class listens_group(listens):
+    connection_class = _GroupConnection
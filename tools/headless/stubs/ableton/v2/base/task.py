@@ -0,0 +1,119 @@
+"""Stand-in for Live's task system. Time only advances when the owning `TaskGroup` is updated,
+which the headless harness does from `HeadlessZcx.advance()`."""
+
+
+class Task(object):
+
+    def __init__(self, *a, **k):
+        super().__init__()
+        self._killed = False
+        self._paused = False
+        self._group = None
+
+    @property
+    def is_running(self):
+        return not self._killed and not self._paused
+
+    @property
+    def is_killed(self):
+        return self._killed
+
+    @property
+    def is_paused(self):
+        return self._paused
+
+    def kill(self):
+        self._killed = True
+        return self
+
+    def pause(self):
+        self._paused = True
+        return self
+
+    def resume(self):
+        self._paused = False
+        return self
+
+    def restart(self):
+        self._killed = False
+        self._paused = False
+        if self._group is not None:
+            self._group._ensure_scheduled(self)
+        return self
+
+    def update(self, delta):
+        if self.is_running:
+            self.do_update(delta)
+
+    def do_update(self, delta):
+        pass
+
+
+class TimerTask(Task):
+
+    def __init__(self, duration=1.0, *a, **k):
+        super().__init__(*a, **k)
+        self.duration = duration
+        self.remaining = duration
+
+    def restart(self):
+        self.remaining = self.duration
+        return super().restart()
+
+    def do_update(self, delta):
+        self.remaining -= delta
+        if self.remaining <= 0:
+            self.remaining = 0
+            self.kill()
+            self.on_finish()
+
+    def on_finish(self):
+        pass
+
+
+class FuncTask(Task):
+
+    def __init__(self, func, *a, **k):
+        super().__init__(*a, **k)
+        self._func = func
+
+    def do_update(self, delta):
+        self.kill()
+        self._func()
+
+
+class TaskGroup(Task):
+    """Killed tasks are dropped from the group, and rescheduled when restarted."""
+
+    def __init__(self, *a, **k):
+        super().__init__(*a, **k)
+        self._tasks = []
+
+    @property
+    def tasks(self):
+        return list(self._tasks)
+
+    def add(self, task):
+        if callable(task) and not isinstance(task, Task):
+            task = FuncTask(task)
+        task._group = self
+        self._ensure_scheduled(task)
+        return task
+
+    def _ensure_scheduled(self, task):
+        if task not in self._tasks:
+            self._tasks.append(task)
+
+    def clear(self):
+        for task in self._tasks:
+            task.kill()
+        self._tasks = []
+
+    def do_update(self, delta):
+        for task in tuple(self._tasks):
+            task.update(delta)
+        self._tasks = [task for task in self._tasks if not task.is_killed]
+
+    @property
+    def count(self):
+        return len(self._tasks)
@@ -0,0 +1,80 @@
+from ableton.v2.base import listenable_property, listens
+from ableton.v3.control_surface import Component
+
+
+class SessionRingComponent(Component):
+
+    def __init__(self, num_tracks=0, num_scenes=0, always_snap_track_offset=False, tracks_to_use=None, *a, **k):
+        super().__init__(*a, **k)
+        self._num_tracks = num_tracks
+        self._num_scenes = num_scenes
+        self._track_offset = 0
+        self._scene_offset = 0
+        self._tracks_to_use = tracks_to_use or (lambda: self.song.visible_tracks)
+        self.__on_song_tracks_changed.subject = self.song
+
+    @property
+    def num_tracks(self):
+        return self._num_tracks
+
+    @property
+    def num_scenes(self):
+        return self._num_scenes
+
+    @property
+    def track_offset(self):
+        return self._track_offset
+
+    @track_offset.setter
+    def track_offset(self, value):
+        self.set_offsets(value, self._scene_offset)
+
+    @property
+    def scene_offset(self):
+        return self._scene_offset
+
+    @scene_offset.setter
+    def scene_offset(self, value):
+        self.set_offsets(self._track_offset, value)
+
+    @listenable_property
+    def offsets(self):
+        return self._track_offset, self._scene_offset
+
+    @listenable_property
+    def tracks(self):
+        return self.controlled_tracks()
+
+    def tracks_to_use(self):
+        return self._tracks_to_use()
+
+    def controlled_tracks(self):
+        return self.tracks_to_use()[self._track_offset:self._track_offset + self._num_tracks]
+
+    def set_offsets(self, track_offset, scene_offset):
+        # the ring never extends past the last track or scene
+        track_offset = max(0, min(track_offset, len(self.tracks_to_use()) - self._num_tracks))
+        scene_offset = max(0, min(scene_offset, len(self.song.scenes) - self._num_scenes))
+        if (track_offset, scene_offset) == (self._track_offset, self._scene_offset):
+            return
+        tracks_changed = track_offset != self._track_offset
+        self._track_offset = track_offset
+        self._scene_offset = scene_offset
+        self.notify_offsets()
+        if tracks_changed:
+            self.notify_tracks()
+
+    def move(self, tracks, scenes):
+        self.set_offsets(self._track_offset + tracks, self._scene_offset + scenes)
+
+    def clip_slot(self, track_index, scene_index):
+        tracks = self.controlled_tracks()
+        if track_index >= len(tracks):
+            return None
+        slots = tracks[track_index].clip_slots
+        index = self._scene_offset + scene_index
+        return slots[index] if index < len(slots) else None
+
+    @listens('visible_tracks')
+    def __on_song_tracks_changed(self):
+        self.notify_tracks()
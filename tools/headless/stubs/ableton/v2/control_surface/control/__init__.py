@@ -0,0 +1 @@
+from ableton.v3.control_surface.controls import ButtonControl, EncoderControl, PlayableControl, control_matrix
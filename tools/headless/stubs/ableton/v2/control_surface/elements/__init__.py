@@ -0,0 +1,2 @@
+from ableton.v3.control_surface.elements.color import Color, AnimatedColor
+from ableton.v3.control_surface.elements import ButtonElement, ButtonMatrixElement, EncoderElement
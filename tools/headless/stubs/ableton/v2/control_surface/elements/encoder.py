@@ -0,0 +1 @@
+from Live.MidiMap import MapMode as _map_modes
@@ -0,0 +1,4 @@
+class ScriptForwarding(object):
+    none = 0
+    exclusive = 1
+    non_consuming = 2
@@ -0,0 +1,3 @@
+from ...v2.base import *
+from ...v2.base import EventObject, listenable_property, listens, listens_group, clamp, nop, liveobj_valid
+from ...v2.base.task import Task, TaskGroup, TimerTask
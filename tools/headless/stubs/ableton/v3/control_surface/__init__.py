@@ -0,0 +1,263 @@
+"""Stand-in for Live's v3 control surface framework.
+
+`ControlSurface` builds the specification's elements, instantiates every component named by the
+specification's mappings, connects controls to elements, and routes MIDI in both directions through
+its `c_instance` (see `zcx_headless.HeadlessCInstance`).
+"""
+from contextlib import contextmanager
+
+from ableton.v2.base import EventObject
+from ableton.v2.base.task import TaskGroup
+from ableton.v2.control_surface import MIDI_CC_TYPE, MIDI_NOTE_TYPE, MIDI_PB_TYPE
+
+_current_surface = None
+
+
+def current_surface():
+    return _current_surface
+
+
+def _set_current_surface(surface):
+    global _current_surface
+    _current_surface = surface
+
+
+class Component(EventObject):
+
+    def __init__(self, name='', canonical_parent=None, is_enabled=True, *a, **k):
+        super().__init__(*a, **k)
+        self.name = name
+        self.canonical_parent = canonical_parent if canonical_parent is not None else current_surface()
+        self._is_enabled = is_enabled
+
+    @property
+    def song(self):
+        return self.canonical_parent.song
+
+    @property
+    def _song(self):
+        return self.canonical_parent.song
+
+    @property
+    def application(self):
+        return self.canonical_parent.application
+
+    def is_enabled(self):
+        return self._is_enabled
+
+    def set_enabled(self, enable):
+        self._is_enabled = bool(enable)
+        self.update()
+
+    def update(self):
+        pass
+
+    def control_states(self):
+        from .controls import Control
+        states = []
+        for cls in type(self).__mro__:
+            for attr in vars(cls).values():
+                if isinstance(attr, Control):
+                    states.append(attr.__get__(self, type(self)))
+        return states
+
+
+class ControlSurfaceSpecification(object):
+    elements_type = None
+    control_surface_skin = None
+    create_mappings_function = None
+    component_map = {}
+    num_tracks = 0
+    num_scenes = 0
+    include_returns = False
+    include_master = False
+    right_align_non_player_tracks = False
+    identity_response_id_bytes = None
+    send_goodbye_messages = True
+
+
+class ComponentMap(dict):
+    """Components are created on first access, so one component may look up another in its constructor."""
+
+    def __init__(self, surface):
+        super().__init__()
+        self._surface = surface
+        self._factories = {}
+
+    def register(self, name, component_class):
+        self._factories[name] = component_class
+
+    def __missing__(self, name):
+        component_class = self._factories.get(name)
+        if component_class is None:
+            raise KeyError(name)
+        component = component_class(name=name)
+        self[name] = component
+        self._surface._components.append(component)
+        return component
+
+    def __contains__(self, name):
+        return super().__contains__(name) or name in self._factories
+
+
+class ElementsBase(object):
+
+    def __init__(self, global_channel=0, *a, **k):
+        super().__init__()
+        self._global_channel = global_channel
+
+    def add_matrix(self, identifiers, base_name, channels=None, element_factory=None, msg_type=MIDI_NOTE_TYPE,
+                   is_private=False, *a, **k):
+        from .elements import ButtonElement, ButtonMatrixElement
+        if element_factory is None:
+            element_factory = ButtonElement
+        if channels is None:
+            channels = self._global_channel
+        rows = []
+        for row_index, row in enumerate(identifiers):
+            elements = []
+            for col_index, identifier in enumerate(row):
+                channel = channels[row_index][col_index] if isinstance(channels, (list, tuple)) else channels
+                elements.append(element_factory(
+                    identifier=identifier,
+                    channel=channel,
+                    msg_type=msg_type,
+                    name=f'{base_name}_{row_index}_{col_index}',
+                    *a,
+                    **k
+                ))
+            rows.append(elements)
+        matrix = ButtonMatrixElement(rows=rows, name=base_name)
+        setattr(self, base_name, matrix)
+        setattr(self, f'{base_name}_raw', [element for row in rows for element in row])
+        return matrix
+
+
+def create_matrix_identifiers(start, stop, width, flip_rows=False):
+    ids = list(range(start, stop))
+    rows = [ids[i:i + width] for i in range(0, len(ids), width)]
+    if flip_rows:
+        rows.reverse()
+    return rows
+
+
+def create_skin(skin=None, colors=None, *a, **k):
+    return skin() if isinstance(skin, type) else skin
+
+
+class ControlSurface(EventObject):
+
+    def __init__(self, specification=None, c_instance=None, *a, **k):
+        super().__init__(*a, **k)
+        self._c_instance = c_instance
+        self.specification = specification
+        self._task_group = TaskGroup()
+        self._components = []
+        self._enabled = True
+        self._midi_receivers = {}
+        self.component_map = ComponentMap(self)
+        self.elements = None
+
+        previous_surface = current_surface()
+        _set_current_surface(self)
+        try:
+            if specification is not None:
+                self._create_from_specification(specification)
+            self.setup()
+        finally:
+            _set_current_surface(previous_surface if previous_surface is not None else self)
+
+    def _create_from_specification(self, specification):
+        self.elements = specification.elements_type()
+        mappings = specification.create_mappings_function(self)
+        for component_name in mappings:
+            self.component_map.register(component_name, specification.component_map[component_name])
+        for component_name, component_mappings in mappings.items():
+            component = self.component_map[component_name]
+            for control_name, element_name in component_mappings.items():
+                state = getattr(component, control_name)
+                state.set_control_element(getattr(self.elements, element_name))
+
+    def setup(self):
+        pass
+
+    @property
+    def song(self):
+        return self._c_instance.song()
+
+    @property
+    def application(self):
+        return self._c_instance.application()
+
+    @property
+    def components(self):
+        return tuple(self._components)
+
+    @contextmanager
+    def component_guard(self):
+        previous_surface = current_surface()
+        _set_current_surface(self)
+        try:
+            yield
+        finally:
+            _set_current_surface(previous_surface)
+
+    def show_message(self, message):
+        self._c_instance.show_message(message)
+
+    def log_message(self, *message):
+        self._c_instance.log_message(' '.join(str(m) for m in message))
+
+    def _send_midi(self, midi_event_bytes, optimized=True):
+        self._c_instance.send_midi(tuple(midi_event_bytes))
+        return True
+
+    def _do_send_midi(self, midi_event_bytes):
+        return self._send_midi(midi_event_bytes)
+
+    def request_rebuild_midi_map(self):
+        self._c_instance.request_rebuild_midi_map()
+
+    def build_midi_map(self, midi_map_handle):
+        pass
+
+    def refresh_state(self):
+        for component in self._components:
+            component.update()
+
+    def update_display(self):
+        self._task_group.update(0.1)
+
+    def port_settings_changed(self):
+        self.refresh_state()
+
+    def register_midi_receiver(self, element):
+        self._midi_receivers[element.message_map_key()] = element
+
+    def receive_midi(self, midi_bytes):
+        if midi_bytes[0] == 240:
+            return
+        status = midi_bytes[0] & 0xF0
+        channel = midi_bytes[0] & 0x0F
+        if status in (0x80, 0x90):
+            msg_type, value = MIDI_NOTE_TYPE, (midi_bytes[2] if status == 0x90 else 0)
+        elif status == 0xB0:
+            msg_type, value = MIDI_CC_TYPE, midi_bytes[2]
+        elif status == 0xE0:
+            msg_type, value = MIDI_PB_TYPE, midi_bytes[2] << 7 | midi_bytes[1]
+        else:
+            return
+        element = self._midi_receivers.get((msg_type, channel, midi_bytes[1]))
+        if element is not None:
+            element.receive_value(value)
+
+    def receive_midi_chunk(self, midi_chunk):
+        for midi_bytes in midi_chunk:
+            self.receive_midi(midi_bytes)
+
+    def disconnect(self):
+        for component in self._components:
+            component.disconnect()
+        self._task_group.clear()
+        self._enabled = False
+        super().disconnect()
@@ -0,0 +1,318 @@
+"""Stand-in for Live's control descriptors.
+
+A `Control` is a class attribute of a component. Accessing it on a component instance returns that
+component's `State`, which listens to its control element and turns element values into events.
+Event handlers are registered on the control with decorators, e.g. `@button.pressed`.
+"""
+from ableton.v2.base import EventObject, listenable_property
+from ableton.v2.base.event import add_listener, remove_listener, notify
+from ableton.v2.base.task import TimerTask
+
+from . import current_surface
+
+DELAY_TIME = 0.5
+DOUBLE_CLICK_DELAY = 0.3
+REPEAT_RATE = 0.1
+
+
+class _CallbackTask(TimerTask):
+
+    def __init__(self, duration, callback):
+        super().__init__(duration)
+        self._callback = callback
+        self.kill()
+
+    def on_finish(self):
+        self._callback()
+
+
+def _scheduled_task(duration, callback):
+    task = _CallbackTask(duration, callback)
+    surface = current_surface()
+    if surface is not None:
+        surface._task_group.add(task)
+        task.kill()
+    return task
+
+
+class _ControlEvent(object):
+
+    def __init__(self, control, event):
+        self._control = control
+        self._event = event
+
+    def __call__(self, handler):
+        self._control._handlers[self._event] = handler
+        return self._control
+
+
+class Control(object):
+    events = ()
+
+    class State(EventObject):
+
+        def __init__(self, control=None, manager=None, *a, **k):
+            super().__init__(*a, **k)
+            self._control = control
+            self._manager = manager
+            self._control_element = None
+            self._event_owner = control
+
+        @property
+        def control_element(self):
+            return self._control_element
+
+        @property
+        def coordinate(self):
+            return getattr(self, '_coordinate', None)
+
+        @property
+        def index(self):
+            return getattr(self, '_index', None)
+
+        def set_control_element(self, control_element):
+            if self._control_element is not None:
+                remove_listener(self._control_element, 'value', self._on_value)
+            self._control_element = control_element
+            if control_element is not None:
+                add_listener(control_element, 'value', self._on_value)
+
+        def _on_value(self, value, *a, **k):
+            pass
+
+        def _notifications_enabled(self):
+            manager = self._manager
+            return manager is None or not hasattr(manager, 'is_enabled') or manager.is_enabled()
+
+        def _call_listener(self, event, *a):
+            handler = self._event_owner._handlers.get(event) if self._event_owner is not None else None
+            if handler is not None:
+                handler(self._manager, *a, self)
+
+        def _has_listener(self, event):
+            return self._event_owner is not None and event in self._event_owner._handlers
+
+    def __init__(self, *a, **k):
+        super().__init__()
+        self._handlers = {}
+        self._extra_args = a
+        self._extra_kwargs = k
+
+    def __getattr__(self, name):
+        if name in type(self).events:
+            return _ControlEvent(self, name)
+        raise AttributeError(name)
+
+    def _make_state(self, manager):
+        return self.State(control=self, manager=manager)
+
+    def __get__(self, manager, owner=None):
+        if manager is None:
+            return self
+        states = manager.__dict__.setdefault('_control_states', {})
+        state = states.get(id(self))
+        if state is None:
+            state = self._make_state(manager)
+            states[id(self)] = state
+        return state
+
+
+class ButtonControl(Control):
+    events = ('pressed', 'released', 'pressed_delayed', 'released_immediately', 'released_delayed',
+              'double_clicked', 'value')
+
+    class State(Control.State):
+
+        def __init__(self, *a, **k):
+            super().__init__(*a, **k)
+            self._is_pressed = False
+            self._repeat = False
+            self._delay_task = _scheduled_task(DELAY_TIME, self._on_pressed_delayed)
+            self._double_click_task = _scheduled_task(DOUBLE_CLICK_DELAY, lambda: None)
+            self._repeat_task = _scheduled_task(REPEAT_RATE, self._on_repeat)
+
+        @property
+        def is_pressed(self):
+            return self._is_pressed
+
+        def _on_value(self, value, *a, **k):
+            if not self._notifications_enabled():
+                return
+            self._call_listener('value', value)
+            if not self._control_element.is_momentary():
+                self._press_button()
+                self._release_button()
+            elif value:
+                self._press_button()
+            else:
+                self._release_button()
+
+        def _press_button(self):
+            if self._is_pressed:
+                return
+            self._is_pressed = True
+            self._delay_task.restart()
+            if self._double_click_task.is_running:
+                self._double_click_task.kill()
+                self._call_listener('pressed')
+                self._call_listener('double_clicked')
+            else:
+                self._double_click_task.restart()
+                self._call_listener('pressed')
+
+        def _release_button(self):
+            if not self._is_pressed:
+                return
+            self._is_pressed = False
+            self._repeat_task.kill()
+            self._call_listener('released')
+            if self._delay_task.is_running:
+                self._delay_task.kill()
+                self._call_listener('released_immediately')
+            else:
+                self._call_listener('released_delayed')
+
+        def _on_pressed_delayed(self):
+            if self._is_pressed:
+                self._call_listener('pressed_delayed')
+                if self._repeat:
+                    self._repeat_task.restart()
+
+        def _on_repeat(self):
+            if self._is_pressed and self._repeat:
+                self._call_listener('pressed')
+                self._repeat_task.restart()
+
+
+class PlayableControl(ButtonControl):
+
+    class Mode(object):
+        listenable = 0
+        playable = 1
+        playable_and_listenable = 2
+
+    class State(ButtonControl.State):
+
+        def __init__(self, *a, **k):
+            super().__init__(*a, **k)
+            self._mode = PlayableControl.Mode.listenable
+
+        @property
+        def mode(self):
+            return self._mode
+
+        def set_mode(self, mode):
+            self._mode = mode
+
+
+class EncoderControl(Control):
+    events = ('value', 'touched', 'released')
+
+    class State(Control.State):
+
+        def _on_value(self, value, *a, **k):
+            if self._notifications_enabled():
+                self._call_listener('value', value)
+
+
+class Connectable(EventObject):
+    """Mixin for control states that can be connected to a property of another object."""
+
+    def __init__(self, *a, **k):
+        super().__init__(*a, **k)
+        self._connected_subject = None
+        self._connected_property = None
+
+    def connect_property(self, subject, property_name, transform=None):
+        self._connected_subject = subject
+        self._connected_property = property_name
+
+    def disconnect_property(self):
+        self._connected_subject = None
+        self._connected_property = None
+
+
+class MatrixControl(Control):
+    """A control for a `ButtonMatrixElement`. Its state holds one sub-state per element,
+    and events from any sub-state are forwarded to the handlers registered on the matrix."""
+
+    class State(Control.State):
+
+        def __init__(self, control=None, manager=None, *a, **k):
+            super().__init__(control=control, manager=manager, *a, **k)
+            self._control_type = control._control_type
+            self._sub_control = control._control_type(*control._extra_args, **control._extra_kwargs)
+            self._states = []
+            self._width = 0
+            self._height = 0
+
+        def set_control_element(self, matrix):
+            for state in self._states:
+                state.set_control_element(None)
+            self._control_element = matrix
+            self._states = []
+            if matrix is None:
+                self._width = self._height = 0
+                return
+            self._width = matrix.width()
+            self._height = matrix.height()
+            for row_index, row in enumerate(matrix):
+                for col_index, element in enumerate(row):
+                    state = self._sub_control._make_state(self._manager)
+                    state._event_owner = self._control
+                    state._coordinate = (row_index, col_index)
+                    state._index = row_index * self._width + col_index
+                    state.set_control_element(element)
+                    self._states.append(state)
+
+        @property
+        def width(self):
+            return self._width
+
+        @property
+        def height(self):
+            return self._height
+
+        @property
+        def dimensions(self):
+            return self._width, self._height
+
+        @property
+        def control_elements(self):
+            return [state._control_element for state in self._states]
+
+        def get_control(self, row, column):
+            return self._states[row * self._width + column]
+
+        def __iter__(self):
+            return iter(self._states)
+
+        def __len__(self):
+            return len(self._states)
+
+        def __getitem__(self, index):
+            return self._states[index]
+
+    def __init__(self, control_type=None, *a, **k):
+        super().__init__(*a, **k)
+        self._control_type = control_type
+
+    @property
+    def events(self):
+        return self._control_type.events
+
+    def __getattr__(self, name):
+        if name != '_control_type' and name in self._control_type.events:
+            return _ControlEvent(self, name)
+        raise AttributeError(name)
+
+
+def control_matrix(control_type, *a, **k):
+    return MatrixControl(control_type, *a, **k)
+
+
+def control_list(control_type, *a, **k):
+    return MatrixControl(control_type, *a, **k)
+
+
+ToggleButtonControl = ButtonControl
@@ -0,0 +1 @@
+BANK_DEFINITIONS = {}
@@ -0,0 +1,8 @@
+from ableton.v2.base import EventObject
+
+
+class Renderable(EventObject):
+    """Marks a control state as able to contribute to a display. Nothing is rendered headlessly."""
+
+    def notify(self, *a, **k):
+        pass
@@ -0,0 +1,198 @@
+from ableton.v2.base import EventObject
+from ableton.v2.base.event import notify
+from ableton.v2.control_surface import MIDI_CC_TYPE, MIDI_NOTE_TYPE
+from Live.MidiMap import MapMode, RELATIVE_MODES, relative_delta
+
+from .color import Color, AnimatedColor
+from .. import current_surface
+
+
+class InputControlElement(EventObject):
+
+    def __init__(self, msg_type=MIDI_NOTE_TYPE, channel=0, identifier=0, name='', is_feedback_enabled=True, *a, **k):
+        super().__init__()
+        self._msg_type = msg_type
+        self._msg_channel = channel
+        self._msg_identifier = identifier
+        self._original_channel = channel
+        self._original_identifier = identifier
+        self.name = name
+        self._is_feedback_enabled = is_feedback_enabled
+        self._last_sent_value = None
+        self._last_received_value = -1
+        self._force_next_send = False
+        self._surface = current_surface()
+        self.sent_values = 0
+        if self._surface is not None and identifier is not None:
+            self._surface.register_midi_receiver(self)
+
+    def message_type(self):
+        return self._msg_type
+
+    def message_channel(self):
+        return self._msg_channel
+
+    def message_identifier(self):
+        return self._msg_identifier
+
+    def message_map_key(self):
+        return self._msg_type, self._msg_channel, self._msg_identifier
+
+    def receive_value(self, value):
+        self._last_received_value = value
+        notify(self, 'value', value)
+
+    def status_byte(self, channel=None):
+        base = 0x90 if self._msg_type == MIDI_NOTE_TYPE else 0xB0
+        return base | (self._msg_channel if channel is None else channel)
+
+    def send_value(self, value, force=False, channel=None):
+        value = int(value)
+        force = force or self._force_next_send
+        self._force_next_send = False
+        key = (value, channel)
+        if not force and key == self._last_sent_value:
+            return
+        self._last_sent_value = key
+        self.sent_values += 1
+        if self._surface is not None:
+            self._surface._send_midi((self.status_byte(channel), self._msg_identifier, value))
+
+    def clear_send_cache(self):
+        self._last_sent_value = None
+
+    def reset(self):
+        self.send_value(0)
+
+    def set_feedback_delay(self, delay):
+        pass
+
+    def use_default_message(self):
+        pass
+
+    def script_wants_forwarding(self):
+        return True
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} {self.name}>'
+
+
+class ButtonElement(InputControlElement):
+
+    def __init__(self, is_momentary=True, msg_type=MIDI_NOTE_TYPE, channel=0, identifier=0, is_rgb=False, skin=None,
+                 name='', *a, **k):
+        super().__init__(msg_type=msg_type, channel=channel, identifier=identifier, name=name)
+        self._is_momentary = is_momentary
+        self._is_rgb = is_rgb
+        self._skin = skin
+        self._last_drawn_color = None
+
+    def is_momentary(self):
+        return self._is_momentary
+
+    @property
+    def is_pressed(self):
+        return bool(self._last_received_value)
+
+    def receive_value(self, value):
+        super().receive_value(value)
+
+    def set_light(self, value):
+        if hasattr(value, 'draw'):
+            self._do_draw(value)
+        elif isinstance(value, bool):
+            self.send_value(127 if value else 0)
+        elif isinstance(value, int):
+            self.send_value(value)
+        else:
+            self.send_value(0)
+
+    def _do_draw(self, color):
+        self._last_drawn_color = color
+        color.draw(self)
+
+    def turn_on(self):
+        self.set_light(True)
+
+    def turn_off(self):
+        self.set_light(False)
+
+
+class ButtonMatrixElement(EventObject):
+
+    def __init__(self, rows=(), name='', *a, **k):
+        super().__init__()
+        self.name = name
+        self._rows = [list(row) for row in rows]
+        self._nested_control_elements = [element for row in self._rows for element in row]
+
+    def width(self):
+        return len(self._rows[0]) if self._rows else 0
+
+    def height(self):
+        return len(self._rows)
+
+    def nested_control_elements(self):
+        return list(self._nested_control_elements)
+
+    def get_button(self, column, row):
+        return self._rows[row][column]
+
+    def iterbuttons(self):
+        for row_index, row in enumerate(self._rows):
+            for col_index, element in enumerate(row):
+                yield element, (col_index, row_index)
+
+    def __iter__(self):
+        return iter(self._rows)
+
+    def __len__(self):
+        return len(self._nested_control_elements)
+
+    def reset(self):
+        for element in self._nested_control_elements:
+            element.reset()
+
+
+class EncoderElement(InputControlElement):
+    """Stands in for an encoder mapped to a parameter through Live's MIDI map: incoming values
+    are applied straight to the connected parameter."""
+
+    def __init__(self, identifier=0, map_mode=MapMode.absolute, is_feedback_enabled=False, channel=0,
+                 msg_type=MIDI_CC_TYPE, feedback_delay=None, mapping_sensitivity=1.0, name='', *a, **k):
+        super().__init__(msg_type=msg_type, channel=channel, identifier=identifier, name=name,
+                         is_feedback_enabled=is_feedback_enabled)
+        self._map_mode = map_mode
+        self.mapping_sensitivity = mapping_sensitivity
+        self._mapped_parameter = None
+
+    def message_map_mode(self):
+        return self._map_mode
+
+    @property
+    def mapped_object(self):
+        return self._mapped_parameter
+
+    def mapped_parameter(self):
+        return self._mapped_parameter
+
+    def connect_to(self, parameter):
+        self._mapped_parameter = parameter
+
+    def release_parameter(self):
+        self._mapped_parameter = None
+
+    def receive_value(self, value):
+        parameter = self._mapped_parameter
+        if parameter is not None:
+            span = parameter.max - parameter.min
+            if self._map_mode in RELATIVE_MODES:
+                step = relative_delta(self._map_mode, value) * self.mapping_sensitivity * span / 127.0
+                new_value = parameter.value + step
+            else:
+                new_value = parameter.min + span * value / 127.0
+            parameter.value = max(parameter.min, min(parameter.max, new_value))
+        super().receive_value(value)
+
+    def normalize_value(self, value):
+        return value / 127.0
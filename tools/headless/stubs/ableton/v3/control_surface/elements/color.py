@@ -0,0 +1,42 @@
+class Color(object):
+
+    def __init__(self, midi_value=0, *a, **k):
+        super().__init__()
+        self._midi_value = midi_value
+
+    @property
+    def midi_value(self):
+        return self._midi_value
+
+    def draw(self, interface):
+        interface.send_value(self.midi_value)
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+    def __hash__(self):
+        return hash((type(self), self._midi_value))
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self._midi_value})'
+
+
+class AnimatedColor(Color):
+    """Draws `color1`, then `color2` on the animation channel `channel2`."""
+
+    def __init__(self, color1=Color(0), color2=Color(0), channel2=None, *a, **k):
+        super().__init__(getattr(color1, 'midi_value', 0))
+        self.color1 = color1
+        self.color2 = color2
+        self._channel = channel2
+
+    def draw(self, interface):
+        self.color1.draw(interface)
+        if self._channel is not None:
+            interface.send_value(self.color2.midi_value, channel=self._channel)
+
+    def __hash__(self):
+        return hash((type(self), self.color1, self.color2, self._channel))
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}({self.color1!r}, {self.color2!r})'
@@ -0,0 +1 @@
+from ...v2.base import liveobj_valid
@@ -0,0 +1,16 @@
+from ableton.v3.control_surface.elements.color import AnimatedColor, Color
+
+BLINK_CHANNEL = 1
+PULSE_CHANNEL = 2
+
+
+class Blink(AnimatedColor):
+
+    def __init__(self, color1=Color(0), color2=Color(0), channel=BLINK_CHANNEL, *a, **k):
+        super().__init__(color1, color2, channel)
+
+
+class Pulse(AnimatedColor):
+
+    def __init__(self, color1=Color(0), color2=Color(0), channel=PULSE_CHANNEL, *a, **k):
+        super().__init__(color1, color2, channel)
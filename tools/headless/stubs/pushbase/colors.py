@@ -0,0 +1,82 @@
+"""Stand-in for pushbase's color classes. Drawing a color sends its MIDI value to the element."""
+from ableton.v3.control_surface.elements.color import Color, AnimatedColor
+
+
+class RgbColor(Color):
+
+    def __init__(self, midi_value=0, alpha=255, *a, **k):
+        super().__init__(midi_value, *a, **k)
+        self._alpha = alpha
+
+    def shade(self, shade_level):
+        return RgbColor(self.midi_value - shade_level if self.midi_value > shade_level else 0)
+
+    def highlight(self):
+        return RgbColor(self.midi_value + 1)
+
+
+class FallbackColor(Color):
+
+    def __init__(self, rgb_color, fallback_color, *a, **k):
+        super().__init__(rgb_color.midi_value)
+        self.rgb_color = rgb_color
+        self.fallback_color = fallback_color
+
+    def draw(self, interface):
+        self.rgb_color.draw(interface)
+
+
+class TransparentColor(Color):
+
+    def draw(self, interface):
+        pass
+
+
+class Pulse(AnimatedColor):
+
+    def __init__(self, color1=Color(0), color2=Color(0), speed=None, *a, **k):
+        super().__init__(color1, color2, speed)
+        self.speed = speed
+
+
+class Blink(AnimatedColor):
+
+    def __init__(self, color1=Color(0), color2=Color(0), speed=None, *a, **k):
+        super().__init__(color1, color2, speed)
+        self.speed = speed
+
+
+class Basic(object):
+    HALF = Color(1)
+    HALF_BLINK_SLOW = Color(2)
+    HALF_BLINK_FAST = Color(3)
+    FULL = Color(4)
+    FULL_BLINK_SLOW = Color(5)
+    FULL_BLINK_FAST = Color(6)
+    OFF = Color(0)
+    ON = Color(127)
+
+
+class BiLed(object):
+    OFF = Color(0)
+    RED = Color(1)
+    RED_HALF = Color(2)
+    GREEN = Color(3)
+    GREEN_HALF = Color(4)
+    YELLOW = Color(5)
+    YELLOW_HALF = Color(6)
+    AMBER = Color(7)
+    AMBER_HALF = Color(8)
+
+
+class Rgb(object):
+    BLACK = RgbColor(0)
+    DARK_GREY = RgbColor(1)
+    GREY = RgbColor(2)
+    WHITE = RgbColor(3)
+    RED = RgbColor(5)
+    AMBER = RgbColor(9)
+    YELLOW = RgbColor(13)
+    GREEN = RgbColor(21)
+    BLUE = RgbColor(45)
+    PURPLE = RgbColor(49)
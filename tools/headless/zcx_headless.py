@@ -0,0 +1,511 @@
+#!/usr/bin/env python3
+"""Run zcx outside of Ableton Live.
+
+The `stubs/` directory next to this file stands in for the parts of Live's Python environment that zcx
+imports (`ableton.v2`/`v3`, `Live`, `ClyphX_Pro`, `pushbase`, `novation`, `Push2`). This module assembles a
+zcx package the same way tools/build.py does, boots it against a scriptable `Live.Song`, and lets you press
+buttons, advance time and inspect the action lists that reached ClyphX Pro.
+
+    zcx = HeadlessZcx('launchpad_x').boot()
+    zcx.tap((0, 0))
+    print(zcx.action_lists)
+    zcx.shutdown()
+
+Or from the command line:
+
+    python tools/headless/zcx_headless.py launchpad_x
+    python tools/headless/zcx_headless.py __test --run-tests
+"""
+import argparse
+import builtins
+import importlib
+import itertools
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import time
+from collections import deque
+from pathlib import Path
+
+HEADLESS_DIR = Path(__file__).resolve().parent
+STUBS_DIR = HEADLESS_DIR / 'stubs'
+PROJECT_ROOT = HEADLESS_DIR.parent.parent
+APP_DIR = PROJECT_ROOT / 'app'
+HARDWARE_DIR = PROJECT_ROOT / 'hardware'
+TESTS_DIR = PROJECT_ROOT / 'tests'
+USER_ACTIONS_DIR = PROJECT_ROOT / 'user_actions'
+
+IGNORE_PATTERNS = shutil.ignore_patterns(
+    '__pycache__', '*.pyc', '.DS_Store', 'log.txt', 'test_log.txt', '_config_cache.pickle*', '* Project'
+)
+
+SENT_MIDI_HISTORY = 10000
+
+_package_counter = itertools.count()
+
+
+def install_stubs():
+    """Puts the Live stand-ins on sys.path. Safe to call more than once."""
+    stubs = str(STUBS_DIR)
+    if stubs not in sys.path:
+        sys.path.insert(0, stubs)
+
+
+def available_hardware() -> list:
+    return sorted(
+        path.name for path in HARDWARE_DIR.iterdir()
+        if path.is_dir() and (path / 'specs.yaml').exists() and not path.name.startswith('__')
+    )
+
+
+def load_user_actions(clyphx, directory=USER_ACTIONS_DIR) -> list:
+    """Registers every user action class found in `directory` with the stand-in ClyphX Pro."""
+    import importlib.util
+    from ClyphX_Pro.clyphx_pro.UserActionsBase import UserActionsBase
+
+    instances = []
+    for path in sorted(Path(directory).glob('*.py')):
+        spec = importlib.util.spec_from_file_location(f'_zcx_headless_user_actions_{path.stem}', path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        for value in vars(module).values():
+            if isinstance(value, type) and issubclass(value, UserActionsBase) and value is not UserActionsBase:
+                instances.append(clyphx.add_user_actions(value))
+    return instances
+
+
+def find_vendor_dir(vendor_dir=None) -> Path:
+    """The vendored dependencies (yaml, asteval, semver) normally live in app/vendor,
+    see tools/install_vendored_dependencies.py."""
+    candidates = [vendor_dir, os.environ.get('ZCX_VENDOR_DIR'), APP_DIR / 'vendor']
+    for candidate in candidates:
+        if candidate and (Path(candidate) / 'yaml').is_dir():
+            return Path(candidate)
+    raise RuntimeError(
+        'Could not find zcx\'s vendored dependencies. '
+        'Run tools/install_vendored_dependencies.py, set ZCX_VENDOR_DIR, or pass vendor_dir.'
+    )
+
+
+def assemble_package(hardware, dest_dir, package_name, config_path=None, vendor_dir=None, include_tests=False,
+                     use_blank_config=False) -> Path:
+    """Lays out a zcx package like tools/build.py: app/ as the package root, `hardware/<hardware>` as
+    `hardware/`, and the demo (or given) config as `_config/`."""
+    hardware_root = HARDWARE_DIR / hardware
+    if not (hardware_root / 'specs.yaml').exists():
+        raise ValueError(f'Unknown hardware `{hardware}`. Options: {", ".join(available_hardware())}')
+
+    package_dir = Path(dest_dir) / package_name
+    shutil.copytree(APP_DIR, package_dir, ignore=IGNORE_PATTERNS, dirs_exist_ok=True)
+    shutil.copytree(hardware_root, package_dir / 'hardware', ignore=IGNORE_PATTERNS, dirs_exist_ok=True)
+
+    if config_path is None:
+        config_path = hardware_root / ('blank_config' if use_blank_config else 'demo_config')
+    shutil.copytree(config_path, package_dir / '_config', ignore=IGNORE_PATTERNS, dirs_exist_ok=True)
+
+    vendor_source = find_vendor_dir(vendor_dir)
+    if vendor_source.resolve() != (APP_DIR / 'vendor').resolve():
+        shutil.copytree(vendor_source, package_dir / 'vendor', ignore=IGNORE_PATTERNS, dirs_exist_ok=True)
+
+    if include_tests:
+        shutil.copytree(TESTS_DIR, package_dir / 'tests', ignore=IGNORE_PATTERNS, dirs_exist_ok=True)
+
+    return package_dir
+
+
+class _RecordingHandler(logging.Handler):
+    """Records what `logger_name` and its children log at WARNING or above.
+
+    Attached to the root logger, as zcx's `create_instance` strips the handlers from its own logger.
+    """
+
+    def __init__(self, logger_name):
+        super().__init__(level=logging.WARNING)
+        self.logger_name = logger_name
+        self.records = []
+
+    def filter(self, record):
+        if record.name != self.logger_name and not record.name.startswith(f'{self.logger_name}.'):
+            return False
+        return super().filter(record)
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class HeadlessCInstance(object):
+    """Stands in for the `c_instance` Live passes to a control surface script."""
+
+    def __init__(self, song, application):
+        self._song = song
+        self._application = application
+        self.surface = None
+        self.sent_midi = deque(maxlen=SENT_MIDI_HISTORY)
+        self.sent_midi_count = 0
+        self.messages = []
+        self.log_messages = []
+        self.note_translations = {}
+        self.midi_map_rebuilds = 0
+
+    def song(self):
+        return self._song
+
+    def application(self):
+        return self._application
+
+    def send_midi(self, midi_bytes):
+        self.sent_midi_count += 1
+        self.sent_midi.append(midi_bytes)
+
+    def show_message(self, message):
+        self.messages.append(message)
+
+    def log_message(self, message):
+        self.log_messages.append(message)
+
+    def instance_identifier(self):
+        return 0
+
+    def request_rebuild_midi_map(self):
+        from ableton.v3.control_surface import current_surface
+        surface = self.surface or current_surface()
+        self.midi_map_rebuilds += 1
+        self.note_translations.clear()
+        if surface is not None:
+            surface.build_midi_map(None)
+
+    def set_note_translation(self, from_identifier, from_channel, to_identifier, to_channel):
+        if (from_identifier, from_channel) == (to_identifier, to_channel):
+            self.note_translations.pop((from_identifier, from_channel), None)
+        else:
+            self.note_translations[(from_identifier, from_channel)] = (to_identifier, to_channel)
+
+    def set_pad_translation(self, *a):
+        pass
+
+    def set_feedback_velocity(self, *a):
+        pass
+
+    def set_feedback_channels(self, *a):
+        pass
+
+    def translate(self, midi_bytes):
+        """Applies note translations to an incoming note message, as Live does before the script sees it."""
+        status = midi_bytes[0] & 0xF0
+        if status not in (0x80, 0x90) or not self.note_translations:
+            return midi_bytes
+        translated = self.note_translations.get((midi_bytes[1], midi_bytes[0] & 0x0F))
+        if translated is None:
+            return midi_bytes
+        return (status | translated[1], translated[0]) + tuple(midi_bytes[2:])
+
+
+class HeadlessZcx(object):
+    """One zcx instance running against a stand-in Live.
+
+    :param hardware: name of a folder in hardware/
+    :param config_path: config folder to load as `_config`, defaults to the hardware's demo_config
+    :param song: a `Live.Song`, defaults to `Song.create_default()`
+    :param vendor_dir: where to find zcx's vendored dependencies, see `find_vendor_dir`
+    :param include_tests: copy tests/ into the package; the TestRunner then runs them once the song is ready
+    :param workdir: where to assemble the package, defaults to a temporary directory removed on shutdown
+    :param user_actions: register the user actions in user_actions/ with the stand-in ClyphX Pro
+    :param step: granularity, in seconds, of `advance()`
+    """
+
+    def __init__(self, hardware='launchpad_x', config_path=None, song=None, vendor_dir=None, include_tests=False,
+                 workdir=None, use_blank_config=False, live_version=(12, 1), step=0.05, user_actions=True):
+        install_stubs()
+        import Live
+
+        self.hardware = hardware
+        self.step = step
+        self.song = song if song is not None else Live.Song.create_default()
+        self.application = Live.Application(self.song, *live_version)
+        self.c_instance = HeadlessCInstance(self.song, self.application)
+        self.surface = None
+        self.package = None
+        # named as tools/build.py would name it, unless another instance in this process already took the name
+        self.package_name = f'_zcx_{hardware.strip("_")}'
+        if self.package_name in sys.modules:
+            self.package_name = f'{self.package_name}_{next(_package_counter)}'
+        self.timings = {}
+        self.clock = 0.0
+
+        self._config_path = config_path
+        self._vendor_dir = vendor_dir
+        self._include_tests = include_tests
+        self._use_blank_config = use_blank_config
+        self._owns_workdir = workdir is None
+        self._workdir = Path(workdir) if workdir is not None else Path(tempfile.mkdtemp(prefix='zcx_headless_'))
+        self._package_dir = None
+        self._log_handler = _RecordingHandler(self.package_name.lstrip('_'))
+
+        from ClyphX_Pro import ClyphX_Pro
+        self.clyphx = ClyphX_Pro(self.song, self.application)
+        if user_actions:
+            load_user_actions(self.clyphx)
+
+    # lifecycle
+
+    def boot(self):
+        import Live
+        Live.set_application(self.application)
+        self.application.control_surfaces = (self.clyphx,)
+        # Live exposes the loaded scripts to every script as the builtin `control_surfaces`
+        builtins.control_surfaces = [self.clyphx]
+
+        self._package_dir = assemble_package(
+            self.hardware, self._workdir, self.package_name, self._config_path, self._vendor_dir,
+            self._include_tests, self._use_blank_config,
+        )
+        if str(self._workdir) not in sys.path:
+            sys.path.insert(0, str(self._workdir))
+
+        start = time.perf_counter()
+        self.package = importlib.import_module(self.package_name)
+        self.timings['import'] = time.perf_counter() - start
+
+        logging.getLogger().addHandler(self._log_handler)
+
+        core_class = importlib.import_module(f'{self.package_name}.zcx_core').ZCXCore
+        original_post_init = core_class.post_init
+
+        def timed_post_init(surface):
+            post_init_start = time.perf_counter()
+            try:
+                return original_post_init(surface)
+            finally:
+                self.timings['post_init'] = time.perf_counter() - post_init_start
+
+        core_class.post_init = timed_post_init
+        start = time.perf_counter()
+        try:
+            self.surface = self.package.create_instance(self.c_instance)
+        finally:
+            core_class.post_init = original_post_init
+        self.c_instance.surface = self.surface
+        self.timings['create_instance'] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        builtins.control_surfaces.append(self.surface)
+        self.application.add_control_surface(self.surface)
+        self.timings['song_ready'] = time.perf_counter() - start
+
+        if not self.surface._enabled:
+            raise RuntimeError(f'zcx failed to start:\n' + '\n'.join(self.c_instance.messages))
+        return self
+
+    def shutdown(self):
+        if self.surface is not None and self.surface._enabled:
+            self.surface.disconnect()
+        logging.getLogger().removeHandler(self._log_handler)
+        logger = logging.getLogger(self.package_name.lstrip('_'))
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
+        package_dir = str(self._package_dir) if self._package_dir is not None else None
+        for name, module in list(sys.modules.items()):
+            module_file = getattr(module, '__file__', None) or ''
+            if name == self.package_name or name.startswith(f'{self.package_name}.') \
+                    or (package_dir and module_file.startswith(package_dir)):
+                del sys.modules[name]
+        if str(self._workdir) in sys.path:
+            sys.path.remove(str(self._workdir))
+        if self._owns_workdir:
+            shutil.rmtree(self._workdir, ignore_errors=True)
+        self.surface = None
+
+    def __enter__(self):
+        return self.boot()
+
+    def __exit__(self, *exc):
+        self.shutdown()
+
+    # access
+
+    @property
+    def component_map(self):
+        return self.surface.component_map
+
+    @property
+    def api(self):
+        return self.surface.zcx_api
+
+    @property
+    def elements(self):
+        return self.surface.elements
+
+    @property
+    def package_dir(self) -> Path:
+        return self._package_dir
+
+    @property
+    def action_lists(self) -> list:
+        """Every action list triggered on the stand-in ClyphX Pro, in order."""
+        return self.clyphx.clyphx_pro_component.action_lists
+
+    @property
+    def osc_messages(self) -> list:
+        return self.clyphx.clyphx_pro_component.osc_server.messages
+
+    @property
+    def sent_midi(self):
+        return self.c_instance.sent_midi
+
+    @property
+    def errors(self) -> list:
+        """Messages zcx logged at ERROR or above since booting."""
+        return [record.getMessage() for record in self._log_handler.records if record.levelno >= logging.ERROR]
+
+    @property
+    def warnings(self) -> list:
+        """Messages zcx logged at WARNING since booting."""
+        return [record.getMessage() for record in self._log_handler.records if record.levelno == logging.WARNING]
+
+    def read_log(self) -> str:
+        path = self._package_dir / 'log.txt'
+        return path.read_text() if path.exists() else ''
+
+    def read_test_log(self) -> str:
+        path = self._package_dir / 'test_log.txt'
+        return path.read_text() if path.exists() else ''
+
+    def clear_recordings(self):
+        """Forgets the action lists and MIDI recorded so far. What zcx logged is kept."""
+        self.clyphx.clyphx_pro_component.clear()
+        self.c_instance.sent_midi.clear()
+
+    # time
+
+    def advance(self, seconds=0.0):
+        """Runs the surface's scheduled tasks as though `seconds` had passed."""
+        remaining = seconds
+        task_group = self.surface._task_group
+        while True:
+            delta = min(self.step, remaining)
+            task_group.update(delta)
+            self.clock += delta
+            remaining -= delta
+            if remaining <= 1e-9:
+                break
+
+    # input
+
+    def element(self, target):
+        """Resolves `target` to a control element. `target` may be a named button, a `(row, column)`
+        coordinate on the button matrix, the name of a zcx control, an encoder name, or an element."""
+        elements = self.surface.elements
+        if isinstance(target, tuple):
+            row, column = target
+            return elements.button_matrix.get_button(column, row)
+        if isinstance(target, str):
+            if target in elements.named_buttons:
+                return elements.named_buttons[target]
+            if target in elements.encoders:
+                return elements.encoders[target]
+            control = self.api.get_control(target)
+            if control is None:
+                raise KeyError(f'No button, encoder or control named `{target}`')
+            return control._control_element
+        return target
+
+    def send_midi(self, midi_bytes):
+        """Delivers one incoming MIDI message to the surface, after Live's note translation."""
+        self.surface.receive_midi_chunk((self.c_instance.translate(tuple(midi_bytes)),))
+
+    def send_value(self, target, value):
+        element = self.element(target)
+        self.send_midi((element.status_byte(), element.message_identifier(), value))
+
+    def press(self, target, velocity=127):
+        self.send_value(target, velocity)
+
+    def release(self, target):
+        self.send_value(target, 0)
+
+    def tap(self, target, hold=0.0, velocity=127):
+        self.press(target, velocity)
+        if hold:
+            self.advance(hold)
+        self.release(target)
+
+    def long_press(self, target):
+        from ableton.v3.control_surface.controls import DELAY_TIME
+        self.tap(target, hold=DELAY_TIME + self.step)
+
+    def double_tap(self, target):
+        self.tap(target)
+        self.tap(target)
+
+    def turn(self, encoder_name, value):
+        self.send_value(encoder_name, value)
+
+    # zcx
+
+    def hot_reload(self, full=False):
+        self.surface.hot_reload(full=full)
+
+    def set_page(self, page):
+        return self.component_map['PageManager'].request_page_change(page)
+
+    def controls(self) -> list:
+        return self.component_map['ZManager'].all_controls
+
+    def encoders(self) -> list:
+        return list(self.component_map['EncoderManager']._encoders.values())
+
+
+def self_test(hardware):
+    """Checks that `hardware`'s demo config boots without logging an error, and that the harness sees what zcx
+    logs, by logging an error through zcx's logger once booted."""
+    with HeadlessZcx(hardware) as zcx:
+        if zcx.errors:
+            raise AssertionError(f'{hardware} logged errors while booting: {zcx.errors}')
+        message = 'headless self-test error'
+        logging.getLogger(zcx.package_name.lstrip('_')).getChild('self_test').error(message)
+        if message not in zcx.errors:
+            raise AssertionError(f'logged error missing from HeadlessZcx.errors: {zcx.errors}')
+    print(f'{hardware}: self-test passed')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Boot zcx against a stand-in Live and report how it went.')
+    parser.add_argument('hardware', nargs='?', default='launchpad_x', help='Hardware folder name')
+    parser.add_argument('--config', type=Path, help='Config folder to use instead of the demo_config')
+    parser.add_argument('--blank-config', action='store_true', help='Use blank_config instead of demo_config')
+    parser.add_argument('--vendor-dir', type=Path, help='Location of the vendored dependencies')
+    parser.add_argument('--run-tests', action='store_true', help='Include tests/ and print the test log')
+    parser.add_argument('--keep', type=Path, help='Assemble the package in this folder and keep it')
+    parser.add_argument('--self-test', action='store_true', help='Check that the config boots without errors, and that the harness records what zcx logs')
+    args = parser.parse_args()
+
+    if args.self_test:
+        self_test(args.hardware)
+        return
+
+    zcx = HeadlessZcx(
+        args.hardware, config_path=args.config, vendor_dir=args.vendor_dir, include_tests=args.run_tests,
+        workdir=args.keep, use_blank_config=args.blank_config,
+    )
+    try:
+        zcx.boot()
+        total = zcx.timings['import'] + zcx.timings['create_instance'] + zcx.timings['song_ready']
+        print(f'{args.hardware}: booted {len(zcx.controls())} controls in {total * 1000:.1f}ms')
+        for phase, seconds in zcx.timings.items():
+            note = ' (part of create_instance)' if phase == 'post_init' else ''
+            print(f'  {phase}: {seconds * 1000:.1f}ms{note}')
+        if args.run_tests:
+            print(zcx.read_test_log())
+        for message in zcx.warnings:
+            print(f'  warning: {message}')
+        for message in zcx.errors:
+            print(f'  error: {message}')
+    finally:
+        zcx.shutdown()
+
+
+if __name__ == '__main__':
+    main()
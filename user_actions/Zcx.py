@@ -190,12 +190,27 @@ class Zcx(UserActionsBase):
             elif sub_action == 'refresh':
                 target_script.refresh()
 
+            elif sub_action == 'latency':
+                latency_action = _args[2].lower() if len(_args) > 2 else 'report'
+                match latency_action:
+                    case 'report':
+                        target_script.log_latency_report()
+                    case 'reset':
+                        target_script.reset_latency_stats()
+                    case 'on':
+                        target_script.gesture_tracing = True
+                    case 'off':
+                        target_script.gesture_tracing = False
+                    case _:
+                        raise ValueError(f'Invalid latency action `{latency_action}`.')
+
             elif sub_action == 'hw_mode':
                 mode_def = _args[2]
                 target_script.set_hardware_mode(mode_def)
 
             elif sub_action == 'hot_reload':
-                target_script.root_cs.hot_reload()
+                full = len(_args) > 2 and _args[2].lower() == 'full'
+                target_script.root_cs.hot_reload(full=full)
 
             elif sub_action == 'kb': # keyboard
                 kb_args = _args[2:]